@@ -0,0 +1,80 @@
+"""Synthetic search responses and a client returning them.
+
+Responses are generated deterministically, so every run of the suite
+parses exactly the same data.
+"""
+import json
+import random
+from typing import Any, Optional
+
+
+def hits_response(count: int, total: Optional[int] = None) -> dict[str, Any]:
+    """Return search response with ``count`` hits of product documents."""
+    rng = random.Random(count)
+    hits = [
+        {
+            "_index": "products",
+            "_id": str(i),
+            "_score": round(rng.random() * 10, 4),
+            "_source": {
+                "name": f"Product {i}",
+                "price": round(rng.random() * 100, 2),
+                "in_stock": rng.random() > 0.2,
+                "tags": [f"tag{rng.randrange(50)}" for _ in range(3)],
+                "brand": {"id": rng.randrange(500), "name": f"Brand {i % 500}"},
+            },
+        }
+        for i in range(count)
+    ]
+    return {
+        "took": 5,
+        "timed_out": False,
+        "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+        "hits": {
+            "total": {"value": total if total is not None else count, "relation": "eq"},
+            "max_score": 10.0,
+            "hits": hits,
+        },
+    }
+
+
+def buckets_response(count: int, name: str = "by_tag") -> dict[str, Any]:
+    """Return aggregation response with ``count`` buckets with sub-aggregations."""
+    rng = random.Random(count)
+    buckets = [
+        {
+            "key": f"tag{i}",
+            "doc_count": rng.randrange(1, 10000),
+            "avg_price": {"value": rng.random() * 100},
+            "price_stats": {
+                "count": 10, "min": 1.0, "max": 99.0, "avg": 50.0, "sum": 500.0,
+            },
+        }
+        for i in range(count)
+    ]
+    return {
+        "took": 12,
+        "timed_out": False,
+        "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+        "hits": {"total": {"value": 10000, "relation": "gte"}, "max_score": None, "hits": []},
+        "aggregations": {
+            name: {
+                "doc_count_error_upper_bound": 0,
+                "sum_other_doc_count": 0,
+                "buckets": buckets,
+            }
+        },
+    }
+
+
+class FakeClient:
+    """Client returning a fixed response without any I/O.
+
+    The response is encoded once and decoded on every call, like
+    a transport would, so searches can't share or mutate the same dicts.
+    """
+    def __init__(self, response: dict[str, Any]):
+        self.raw = json.dumps(response)
+
+    def search(self, index, body, **kwargs):
+        return json.loads(self.raw)
@@ -0,0 +1,119 @@
+"""Check that importing the package stays within its time budget.
+
+Every scenario is imported in fresh interpreters. The median run is
+compared with its budget. Each interpreter first imports pydantic, which
+the package can't avoid. Only the time of the scenario after that
+counts, so budgets hold on slower machines too.
+
+Besides time, importing the package must not import optional or slow
+dependencies. It must not build any model validator either. These
+checks also run in the test suite, see ``tests/test_imports.py``.
+
+Exits with status 1 when a budget or check fails, so it can run in CI:
+
+    python benchmarks/import_budget.py
+
+Run with ``--repeat`` to take more samples on a noisy machine.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+BASELINE = "from pydantic import BaseModel, Field"
+"""Import made before every scenario and not counted in its time."""
+
+BUDGETS: dict[str, tuple[str, float]] = {
+    "queries": ("import opensearch_requests.search.queries", 0.005),
+    "match_query": ("from opensearch_requests.search.queries import MatchQuery", 0.075),
+    "all_requests": (
+        "from opensearch_requests.search.queries import *; "
+        "from opensearch_requests.search.aggregations import *",
+        0.09,
+    ),
+    "bulk": ("from opensearch_requests.bulk import bulk", 0.03),
+}
+"""Scenarios by name, with code to import and budget in seconds."""
+
+FORBIDDEN = ("asyncio", "opensearchpy", "numpy", "pyarrow")
+"""Modules that must only be imported when a feature needing them is used."""
+
+CHECK = """
+import sys
+from pydantic import BaseModel
+from opensearch_requests.search import aggregations, queries
+from opensearch_requests.search.queries import *
+from opensearch_requests.search.aggregations import *
+import opensearch_requests.bulk
+import opensearch_requests.search.local
+import opensearch_requests.search.multi
+import opensearch_requests.search.request
+
+for name in {forbidden!r}:
+    if name in sys.modules:
+        print(f"imports {{name}}")
+for package in (queries, aggregations):
+    for name in package.__all__:
+        value = getattr(package, name)
+        if isinstance(value, type) and issubclass(value, BaseModel) and value.__pydantic_complete__:
+            print(f"builds {{name}} on import")
+"""
+
+
+def timed(code: str) -> tuple[float, float]:
+    """Return times of importing pydantic and then running code."""
+    out = subprocess.run(
+        [
+            sys.executable, "-c",
+            f"import time; t = time.perf_counter(); {BASELINE}; b = time.perf_counter(); {code}; "
+            "print(b - t, time.perf_counter() - b)",
+        ],
+        capture_output=True, text=True, check=True, cwd=ROOT,
+    )
+    baseline, elapsed = out.stdout.split()
+    return float(baseline), float(elapsed)
+
+
+def median(code: str, repeat: int) -> tuple[float, float]:
+    runs = [timed(code) for _ in range(repeat)]
+    return statistics.median(b for b, _ in runs), statistics.median(e for _, e in runs)
+
+
+def problems() -> list[str]:
+    """Return problems found by importing all modules in a fresh interpreter."""
+    out = subprocess.run(
+        [sys.executable, "-c", CHECK.format(forbidden=FORBIDDEN)],
+        capture_output=True, text=True, check=True, cwd=ROOT,
+    )
+    return out.stdout.splitlines()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7, help="fresh interpreters per scenario")
+    args = parser.parse_args(argv)
+
+    baseline, _ = median("pass", args.repeat)
+    print(f"{'pydantic':<20} {baseline * 1e3:>8.1f} ms")
+    failed = False
+    for name, (code, budget) in BUDGETS.items():
+        _, elapsed = median(code, args.repeat)
+        over = elapsed > budget
+        failed |= over
+        print(
+            f"{name:<20} {elapsed * 1e3:>+8.1f} ms  budget {budget * 1e3:.0f} ms"
+            f"{'  OVER BUDGET' if over else ''}"
+        )
+    for problem in problems():
+        failed = True
+        print(f"import {problem}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
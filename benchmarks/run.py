@@ -0,0 +1,257 @@
+"""Benchmarks of request building, serialization and response parsing.
+
+No cluster is needed: responses are synthetic and searches go through
+a fake client. Results are written as JSON, so runs can be compared
+across commits.
+
+Usage:
+
+    python benchmarks/run.py --output before.json
+    git checkout feature-branch
+    python benchmarks/run.py --output after.json --compare before.json
+
+Run with ``--filter parse`` to only run benchmarks with ``parse`` in
+their names and with ``--quick`` for a fast, less precise run. Import
+time is measured by default or with ``--filter import_time``.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fake import FakeClient, buckets_response, hits_response  # noqa: E402
+
+from opensearch_requests.search.aggregations import *  # noqa: E402,F403
+from opensearch_requests.search.queries import *  # noqa: E402,F403
+from opensearch_requests.search.result import Result  # noqa: E402
+
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], Any]]] = {}
+"""Benchmark setups by name. A setup returns the function to time."""
+
+
+def benchmark(name: str):
+    def register(setup: Callable[[], Callable[[], Any]]):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+QUERIES: dict[str, Callable[[], BaseQuery]] = {
+    "match_all": lambda: MatchAllQuery(),
+    "term": lambda: TermQuery(field="brand.id", query="42"),
+    "terms": lambda: TermsQuery(field="tags", values=["tag1", "tag2", "tag3"]),
+    "match": lambda: MatchQuery(field="name", query="red shoes", operator="and", fuzziness=2),
+    "multi_match": lambda: MultiMatchQuery(fields=["name", "tags"], query="red shoes", type="best_fields"),
+    "match_phrase": lambda: MatchPhraseQuery(field="name", query="red shoes", slop=1),
+    "match_phrase_prefix": lambda: MatchPhrasePrefixQuery(field="name", query="red sh"),
+    "match_bool_prefix": lambda: MatchBoolPrefixQuery(field="name", query="red sh"),
+    "query_string": lambda: QueryStringQuery(query="name:red AND tags:tag1", default_operator="and"),
+    "simple_query_string": lambda: SimpleQueryStringQuery(query="red + shoes", fields=["name"]),
+}
+
+
+def deep_bool(depth: int, width: int = 4) -> BooleanQuery:
+    """Return boolean query tree ``depth`` levels deep."""
+    if depth == 0:
+        return BooleanQuery(
+            filter=[TermQuery(field=f"f{i}", query=str(i)) for i in range(width)],
+            must=[MatchQuery(field="name", query="red shoes")],
+        )
+    return BooleanQuery(
+        must=[deep_bool(depth - 1, width)],
+        should=[deep_bool(depth - 1, width) for _ in range(2)],
+        filter=[TermQuery(field="tenant", query="acme")],
+    )
+
+
+def aggregation() -> TermsAggregation:
+    return TermsAggregation(
+        name="by_tag",
+        field="tags",
+        bucket_size=100,
+        filter=TermQuery(field="in_stock", query="true"),
+        aggs=[
+            AvgAggregation(name="avg_price", field="price"),
+            StatsAggregation(name="price_stats", field="price"),
+            TermsAggregation(
+                name="by_brand",
+                field="brand.id",
+                aggs=[SumAggregation(name="revenue", field="price")],
+            ),
+        ],
+    )
+
+
+for _name, _factory in QUERIES.items():
+    benchmark(f"build.{_name}")(lambda f=_factory: f)
+    benchmark(f"body.{_name}")(lambda f=_factory: f().body)
+
+for _depth in (2, 4):
+    benchmark(f"build.bool_depth_{_depth}")(lambda d=_depth: lambda: deep_bool(d))
+    benchmark(f"body.bool_depth_{_depth}")(lambda d=_depth: deep_bool(d).body)
+    benchmark(f"body.bool_depth_{_depth}_frozen")(lambda d=_depth: deep_bool(d).freeze().body)
+    benchmark(f"json.bool_depth_{_depth}")(lambda d=_depth: lambda q=deep_bool(d): json.dumps(q.body()))
+
+benchmark("build.aggregation")(lambda: aggregation)
+benchmark("body.aggregation")(lambda: aggregation().body)
+
+
+for _count, _label in ((10, "10"), (1000, "1k"), (100_000, "100k")):
+    @benchmark(f"parse.hits_{_label}")
+    def _parse(count=_count):
+        response = hits_response(count)
+        return lambda: Result(**response)
+
+    @benchmark(f"parse.hits_{_label}_json")
+    def _parse_json(count=_count):
+        raw = json.dumps(hits_response(count))
+        return lambda: Result.parse(raw)
+
+    @benchmark(f"parse.hits_{_label}_lazy")
+    def _parse_lazy(count=_count):
+        response = hits_response(count)
+        return lambda: Result.parse(response, lazy=True)
+
+    @benchmark(f"search.hits_{_label}")
+    def _search(count=_count):
+        client = FakeClient(hits_response(count))
+        query = MatchQuery(field="name", query="red shoes")
+        return lambda: query.search("products", client)
+
+for _count, _label in ((100, "100"), (10_000, "10k")):
+    @benchmark(f"parse.buckets_{_label}")
+    def _buckets(count=_count):
+        response = buckets_response(count)
+        return lambda: Result(**response)
+
+    @benchmark(f"lookup.buckets_{_label}")
+    def _lookup(count=_count):
+        agg = Result(**buckets_response(count)).aggregations["by_tag"]
+        return lambda: agg.bucket(f"tag{count - 1}")
+
+
+def import_time(repeat: int) -> dict[str, Any]:
+    """Time importing the package in a fresh interpreter."""
+    def run(code: str) -> float:
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent.parent,
+        )
+        return float(out.stdout)
+
+    code = (
+        "import time; t = time.perf_counter(); {}; "
+        "print(time.perf_counter() - t)"
+    )
+    samples = [
+        run(code.format(
+            "import opensearch_requests.search.queries, "
+            "opensearch_requests.search.aggregations, "
+            "opensearch_requests.search.result"
+        ))
+        for _ in range(repeat)
+    ]
+    return _stats(samples, 1)
+
+
+def measure(func: Callable[[], Any], repeat: int, min_time: float) -> dict[str, Any]:
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(1, int(number * min_time / elapsed))
+    samples = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return _stats(samples, number)
+
+
+def _stats(samples: list[float], number: int) -> dict[str, Any]:
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "max": max(samples),
+        "loops": number,
+        "repeat": len(samples),
+    }
+
+
+def metadata() -> dict[str, Any]:
+    import pydantic
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "pydantic": pydantic.VERSION,
+        "platform": platform.platform(),
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> None:
+    print(f"\n{'benchmark':<40} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, current in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        change = current["min"] / before["min"] - 1
+        print(
+            f"{name:<40} {_format(before['min']):>12} "
+            f"{_format(current['min']):>12} {change:>+8.1%}"
+        )
+
+
+def _format(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1:
+            return f"{seconds * scale:.2f} {unit}"
+    return f"{seconds * 1e9:.0f} ns"
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="run benchmarks containing this text")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare with")
+    parser.add_argument("--quick", action="store_true", help="fewer and shorter repeats")
+    args = parser.parse_args(argv)
+
+    repeat, min_time = (3, 0.05) if args.quick else (7, 0.2)
+    results: dict[str, Any] = {}
+    for name, setup in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        results[name] = measure(setup(), repeat, min_time)
+        print(f"{name:<40} {_format(results[name]['min']):>12}", file=sys.stderr)
+    # Runs interpreters rather than a function, so it is selected by name only
+    if not args.filter or args.filter == "import_time":
+        results["import_time"] = import_time(repeat)
+        print(f"{'import_time':<40} {_format(results['import_time']['min']):>12}", file=sys.stderr)
+
+    report = {"metadata": metadata(), "results": results}
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())["results"]
+        compare(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
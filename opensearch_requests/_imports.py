@@ -0,0 +1,50 @@
+import importlib
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+
+def lazy_exports(
+    package: str, exports: dict[str, list[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    """Return ``__getattr__``, ``__dir__`` and ``__all__`` of a lazy package.
+
+    ``exports`` maps modules, relative to the package, to names they
+    export. A module is imported the first time one of its names is
+    accessed on the package (PEP 562), so importing the package itself
+    doesn't import any of them. Star imports of the package import all.
+
+    Example:
+
+        __getattr__, __dir__, __all__ = lazy_exports(__name__, {
+            ".term": ["TermQuery", "TermsQuery"],
+        })
+
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = modules.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        # Later lookups find the name in the package without calling this
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(modules))
+
+    return __getattr__, __dir__, list(modules)
+
+
+class DeferredModel(BaseModel):
+    """Model whose validator is built on first use rather than on import.
+
+    Building validators of all query, aggregation and result models
+    takes longer than the rest of the import, and short-lived programs
+    use only a few of them. Subclasses inherit the setting.
+    """
+    class Config:
+        defer_build = True
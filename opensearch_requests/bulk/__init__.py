@@ -0,0 +1,24 @@
+from typing import TYPE_CHECKING
+
+from .._imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .actions import *
+    from .chunks import *
+    from .helpers import *
+    from .result import *
+
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    ".actions": [
+        "BulkAction",
+        "CreateAction",
+        "DeleteAction",
+        "IndexAction",
+        "UpdateAction",
+        "dump_document",
+    ],
+    ".chunks": ["Chunk", "iter_chunks"],
+    ".helpers": ["bulk"],
+    ".result": ["BulkError", "BulkItemError", "BulkResult"],
+})
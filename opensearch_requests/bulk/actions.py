@@ -0,0 +1,110 @@
+import json
+from typing import Any, ClassVar, Optional
+
+from pydantic import BaseModel, Field
+
+from .._imports import DeferredModel
+
+
+def dump_document(document: Any) -> bytes:
+    """Serialize document to compact JSON bytes.
+
+    Pydantic models are serialized by pydantic-core by their aliases,
+    without building an intermediate dict.
+    """
+    if isinstance(document, BaseModel):
+        return document.model_dump_json(by_alias=True).encode("utf-8")
+    if isinstance(document, bytes):
+        return document
+    return json.dumps(
+        document, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+
+
+class BulkAction(DeferredModel):
+    """Base class for operations of a bulk request."""
+    op_type: ClassVar[str]
+
+    index: Optional[str] = Field(None)
+    """Target index. The default is the index passed to ``bulk()``."""
+    id: Optional[str] = Field(None)
+    """Document ID. OpenSearch generates one for new documents if omitted."""
+    routing: Optional[str] = Field(None)
+    """Custom routing value of the document."""
+
+    def header(self, index: Optional[str] = None) -> dict[str, Any]:
+        """Return action and metadata line of the operation."""
+        meta: dict[str, Any] = {}
+        if self.index is not None or index is not None:
+            meta["_index"] = self.index if self.index is not None else index
+        if self.id is not None:
+            meta["_id"] = self.id
+        if self.routing is not None:
+            meta["routing"] = self.routing
+        return {self.op_type: meta}
+
+    def source(self) -> Optional[bytes]:
+        """Return the line following the header, if the operation has one."""
+        return None
+
+    def to_ndjson(self, index: Optional[str] = None) -> bytes:
+        """Serialize operation to newline terminated NDJSON lines."""
+        line = json.dumps(self.header(index), separators=(",", ":")).encode("utf-8")
+        source = self.source()
+        if source is None:
+            return line + b"\n"
+        return b"".join((line, b"\n", source, b"\n"))
+
+
+class IndexAction(BulkAction):
+    """Index a document, replacing any existing document with the same ID."""
+    op_type: ClassVar[str] = "index"
+
+    document: Any = Field(...)
+    """Document source: a pydantic model, a dict or JSON bytes."""
+
+    def source(self) -> Optional[bytes]:
+        return dump_document(self.document)
+
+
+class CreateAction(IndexAction):
+    """Index a document, failing if a document with the same ID exists."""
+    op_type: ClassVar[str] = "create"
+
+
+class UpdateAction(BulkAction):
+    """Partially update an existing document."""
+    op_type: ClassVar[str] = "update"
+
+    id: str = Field(...)
+    doc: Any = Field(None)
+    """Fields to update: a pydantic model, a dict or JSON bytes."""
+    upsert: Any = Field(None)
+    """Document to index if the document doesn't exist yet."""
+    doc_as_upsert: Optional[bool] = Field(None)
+    """Whether to index ``doc`` if the document doesn't exist yet."""
+    retry_on_conflict: Optional[int] = Field(None)
+    """Number of retries of the update on version conflicts."""
+
+    def header(self, index: Optional[str] = None) -> dict[str, Any]:
+        header = super().header(index)
+        if self.retry_on_conflict is not None:
+            header[self.op_type]["retry_on_conflict"] = self.retry_on_conflict
+        return header
+
+    def source(self) -> Optional[bytes]:
+        parts = []
+        if self.doc is not None:
+            parts.append(b'"doc":' + dump_document(self.doc))
+        if self.upsert is not None:
+            parts.append(b'"upsert":' + dump_document(self.upsert))
+        if self.doc_as_upsert is not None:
+            parts.append(b'"doc_as_upsert":' + (b"true" if self.doc_as_upsert else b"false"))
+        return b"{" + b",".join(parts) + b"}"
+
+
+class DeleteAction(BulkAction):
+    """Delete a document."""
+    op_type: ClassVar[str] = "delete"
+
+    id: str = Field(...)
@@ -0,0 +1,51 @@
+from typing import Iterable, Iterator, Optional
+
+from .actions import BulkAction
+
+
+class Chunk:
+    """Operations of a single bulk request with their serialized lines."""
+    __slots__ = ("actions", "lines", "size")
+
+    def __init__(self):
+        self.actions: list[BulkAction] = []
+        self.lines: list[bytes] = []
+        self.size = 0
+
+    def add(self, action: BulkAction, line: bytes) -> None:
+        self.actions.append(action)
+        self.lines.append(line)
+        self.size += len(line)
+
+    def body(self) -> bytes:
+        return b"".join(self.lines)
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+
+def iter_chunks(
+    actions: Iterable[BulkAction],
+    index: Optional[str] = None,
+    max_bytes: int = 5 * 1024 * 1024,
+    max_actions: Optional[int] = None,
+) -> Iterator[Chunk]:
+    """Serialize actions lazily and group them into chunks of bounded size.
+
+    Every chunk body is at most ``max_bytes`` long, unless a single
+    operation is larger, in which case it is sent in a chunk of its own.
+    Actions are serialized one at a time as chunks are consumed, so at
+    most one chunk of serialized data is held by this generator.
+    """
+    chunk = Chunk()
+    for action in actions:
+        line = action.to_ndjson(index)
+        if chunk.actions and (
+            chunk.size + len(line) > max_bytes
+            or (max_actions is not None and len(chunk) >= max_actions)
+        ):
+            yield chunk
+            chunk = Chunk()
+        chunk.add(action, line)
+    if chunk.actions:
+        yield chunk
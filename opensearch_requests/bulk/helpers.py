@@ -0,0 +1,191 @@
+import logging
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from pydantic import BaseModel
+
+from .actions import BulkAction, IndexAction
+from .chunks import Chunk, iter_chunks
+from .result import BulkError, BulkItemError, BulkResult
+
+
+logger = logging.getLogger("opensearch_requests")
+
+
+def bulk(
+    client,
+    actions: Iterable[Union[BulkAction, BaseModel, dict[str, Any]]],
+    index: Optional[str] = None,
+    max_bytes: int = 5 * 1024 * 1024,
+    max_actions: Optional[int] = None,
+    workers: int = 4,
+    max_retries: int = 3,
+    initial_backoff: float = 0.5,
+    max_backoff: float = 30.0,
+    id_field: Optional[str] = None,
+    raise_on_error: bool = False,
+    max_errors: int = 1000,
+) -> BulkResult:
+    """Send operations to the bulk API in byte-sized chunks in parallel.
+
+    ``actions`` is any iterable, e.g. a generator, of ``BulkAction``
+    objects. Plain pydantic models and dicts are indexed as documents,
+    with IDs taken from their ``id_field`` when it is given.
+
+    Operations are serialized to NDJSON as they are consumed and grouped
+    into request bodies of at most ``max_bytes`` (and ``max_actions``
+    operations, if set). Up to ``workers`` requests are in flight at once
+    and no further operations are read until one of them completes, so
+    memory use is bounded by about ``(workers + 1) * max_bytes``
+    regardless of the number and size of documents.
+
+    Operations rejected with status 429 (too many requests), or whole
+    requests rejected with 429, are sent again, without the operations that
+    succeeded, after an exponential backoff with jitter, at most
+    ``max_retries`` times. Other failed operations are counted in the
+    returned ``BulkResult`` and, with ``raise_on_error``, make it raise
+    ``BulkError`` once everything was sent.
+
+    Example:
+
+        result = bulk(
+            client,
+            (Product(**row) for row in rows),
+            index="products",
+            id_field="sku",
+        )
+
+    """
+    if not (hasattr(client, "bulk") and callable(client.bulk)):
+        raise RuntimeError("Wrong OpenSearch client object passed")
+    if workers < 1:
+        raise ValueError("Number of workers must be a positive integer")
+
+    chunks = iter_chunks(_as_actions(actions, id_field), index, max_bytes, max_actions)
+    result = BulkResult()
+
+    def send(chunk: Chunk) -> BulkResult:
+        return _send(
+            client, chunk, index, max_retries, initial_backoff, max_backoff, max_errors
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: set[Future] = set()
+        try:
+            for chunk in chunks:
+                if len(pending) >= workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _merge(result, future.result(), max_errors)
+                pending.add(executor.submit(send, chunk))
+            for future in pending:
+                _merge(result, future.result(), max_errors)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    if result.failed and raise_on_error:
+        raise BulkError(result)
+    return result
+
+
+def _as_actions(
+    items: Iterable[Union[BulkAction, BaseModel, dict[str, Any]]],
+    id_field: Optional[str],
+) -> Iterator[BulkAction]:
+    for item in items:
+        if isinstance(item, BulkAction):
+            yield item
+            continue
+        id = None
+        if id_field is not None:
+            value = item.get(id_field) if isinstance(item, dict) else getattr(item, id_field)
+            id = str(value) if value is not None else None
+        yield IndexAction(document=item, id=id)
+
+
+def _send(
+    client,
+    chunk: Chunk,
+    index: Optional[str],
+    max_retries: int,
+    initial_backoff: float,
+    max_backoff: float,
+    max_errors: int,
+) -> BulkResult:
+    result = BulkResult()
+    attempt = 0
+    while True:
+        body = chunk.body()
+        result.requests += 1
+        result.bytes += len(body)
+        try:
+            response = client.bulk(body=body, index=index)
+        except Exception as e:
+            if _status(e) != 429 or attempt >= max_retries:
+                raise
+            retry = chunk
+        else:
+            del body
+            retry = _process(response, chunk, attempt < max_retries, result, max_errors)
+
+        if not retry:
+            return result
+        attempt += 1
+        result.retried += len(retry)
+        delay = min(max_backoff, initial_backoff * 2 ** (attempt - 1))
+        logger.info(
+            "Retrying %d rejected bulk operations in %.2fs", len(retry), delay
+        )
+        time.sleep(random.uniform(delay / 2, delay))
+        chunk = retry
+
+
+def _process(
+    response: dict[str, Any],
+    chunk: Chunk,
+    can_retry: bool,
+    result: BulkResult,
+    max_errors: int,
+) -> Chunk:
+    """Count outcomes of items and return operations to retry."""
+    retry = Chunk()
+    if response.get("errors") is False:
+        result.successful += len(chunk)
+        return retry
+
+    for action, line, item in zip(chunk.actions, chunk.lines, response["items"]):
+        (op_type, outcome), = item.items()
+        status = outcome.get("status", 500)
+        if 200 <= status < 300:
+            result.successful += 1
+        elif status == 429 and can_retry:
+            retry.add(action, line)
+        else:
+            result.failed += 1
+            if len(result.errors) < max_errors:
+                result.errors.append(BulkItemError(
+                    op_type=op_type,
+                    index=outcome.get("_index"),
+                    id=outcome.get("_id"),
+                    status=status,
+                    error=outcome.get("error"),
+                ))
+    return retry
+
+
+def _merge(total: BulkResult, part: BulkResult, max_errors: int) -> None:
+    total.successful += part.successful
+    total.failed += part.failed
+    total.retried += part.retried
+    total.requests += part.requests
+    total.bytes += part.bytes
+    total.errors.extend(part.errors[:max_errors - len(total.errors)])
+
+
+def _status(error: Exception) -> Optional[int]:
+    # opensearch-py TransportError keeps the HTTP status in status_code
+    status = getattr(error, "status_code", None)
+    return status if isinstance(status, int) else None
@@ -0,0 +1,43 @@
+from typing import Any, Optional
+
+from pydantic import Field
+
+from .._imports import DeferredModel
+
+
+class BulkItemError(DeferredModel):
+    """Operation of a bulk request that failed."""
+    op_type: str = Field(...)
+    """Operation type, e.g. ``index`` or ``delete``."""
+    index: Optional[str] = Field(None)
+    id: Optional[str] = Field(None)
+    status: int = Field(...)
+    """HTTP status code of the item."""
+    error: Any = Field(None)
+    """Error object returned by OpenSearch."""
+
+
+class BulkResult(DeferredModel):
+    """Outcome of all operations sent by ``bulk()``."""
+    successful: int = Field(0)
+    """Number of operations that succeeded."""
+    failed: int = Field(0)
+    """Number of operations that failed, possibly after retries."""
+    retried: int = Field(0)
+    """Number of times an operation was sent again after a 429 response."""
+    requests: int = Field(0)
+    """Number of bulk requests sent, retries included."""
+    bytes: int = Field(0)
+    """Total size of request bodies sent."""
+    errors: list[BulkItemError] = Field(default_factory=list)
+    """Failed operations, at most ``max_errors`` of them."""
+
+
+class BulkError(Exception):
+    """Raised by ``bulk()`` when some operations failed."""
+    def __init__(self, result: BulkResult):
+        self.result = result
+        super().__init__(
+            f"{result.failed} of {result.successful + result.failed} "
+            "bulk operations failed"
+        )
@@ -1,2 +1,34 @@
-from .bucket import *
-from .metric import *
+from typing import TYPE_CHECKING
+
+from ..._imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .bucket import *
+    from .metric import *
+    from .enums import *
+
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    ".base": ["BaseAggregation"],
+    ".bucket": ["CompositeAggregation", "CompositeSource", "TermsAggregation"],
+    ".metric": [
+        "AvgAggregation",
+        "CardinalityAggregation",
+        "ExtendedStatsAggregation",
+        "MatrixStatsAggregation",
+        "MaxAggregation",
+        "MinAggregation",
+        "StatsAggregation",
+        "SumAggregation",
+        "ValueCountAggregation",
+    ],
+    ".enums": ["CompositeSourceType", "SortOrder"],
+    ".options": [
+        "FieldOption",
+        "FieldsOption",
+        "PrecisionThresholdOption",
+        "SigmaOption",
+        "SizeOption",
+    ],
+    "..result": ["Aggregation", "BucketAggregation"],
+})
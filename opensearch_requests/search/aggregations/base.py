@@ -1,23 +1,25 @@
-import logging
 from typing import Any, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from ..result import Result
-from ..queries import BaseQuery
+from ..base import Searchable
+from ..queries.base import BaseQuery
 
 
-logger = logging.getLogger("opensearch_requests")
-
-
-class BaseAggregation(BaseModel):
+class BaseAggregation(Searchable):
     """Base class for all aggregations."""
+    kind = "filter"
     size: Optional[int] = Field(None)
     """Maximum number of results to return in the aggregation."""
     name: str = Field(...)
     """Name of the aggregation."""
     filter: Optional[BaseQuery] = Field(None)
-    """Filter to apply."""
+    """Filter to apply.
+
+    It becomes the query of the request when the aggregation is searched
+    with, and a wrapping ``filter`` aggregation of the same name when the
+    aggregation is nested, see ``filtered()``.
+    """
     aggs: Optional[list["BaseAggregation"]] = Field(None)
     """Nested aggregations."""
 
@@ -26,21 +28,45 @@ class BaseAggregation(BaseModel):
         if self.filter:
             result["filter"] = self.filter.bare()
         if self.aggs:
-            aggs: dict[str, Any] = {}
-            for a in self.aggs:
-                aggs[a.name] = a.bare()
-            result["aggs"] = aggs
+            result["aggs"] = self.nested_bare()
         other_fields = self.non_empty_dict()
         result.update(**other_fields)
         return result
     
+    def nested_bare(self) -> dict[str, Any]:
+        """Serialize nested aggregations keyed by their names."""
+        aggs: dict[str, Any] = {}
+        for a in self.aggs or ():
+            aggs[a.name] = a.filtered()
+        return aggs
+
+    def filtered(self) -> dict[str, Any]:
+        """Serialize aggregation to be nested under another one.
+
+        An aggregation with a ``filter`` is wrapped in a ``filter``
+        aggregation, and its results are nested under the results of the
+        wrapper by the same name, e.g. ``bucket.brands.brands.buckets``.
+        """
+        if self.filter is None:
+            return self.bare()
+        return {
+            "filter": self.filter.bare(),
+            "aggs": {self.name: self.bare()},
+        }
+
     def body(self) -> dict[str, Any]:
-        """Serialize aggregations to dict suitable for API request."""
+        """Serialize aggregations to dict suitable for API request.
+
+        The filter becomes the query of the request, so only matching
+        documents are aggregated.
+        """
         b = {
             "aggs": {
                 self.name: self.bare()
             }
         }
+        if self.filter:
+            b["query"] = self.filter.bare()
         if self.size is not None:
             b["size"] = self.size
         return b
@@ -50,31 +76,17 @@ class BaseAggregation(BaseModel):
     ) -> dict[str, Any]:
         if exclude is None:
             exclude: set[str] = set()
+        # Filter and nested aggregations are serialized by bare()
         if isinstance(exclude, set):
-            exclude = exclude.union({"size", "name"})
+            exclude = exclude.union({"size", "name", "filter", "aggs"})
         elif isinstance(exclude, dict):
             exclude["size"] = True
             exclude["name"] = True
+            exclude["filter"] = True
+            exclude["aggs"] = True
 
-        return self.dict(
+        return self.model_dump(
             exclude=exclude,
             exclude_none=True,
             exclude_unset=True,
         )
-
-    def search(self, index: str, client) -> Result:
-        # Make sure client object has search function as an
-        # attribute that is callable
-        if not (hasattr(client, "search") and callable(client.search)):
-            raise RuntimeError("Wrong OpenSearch client object passed")
-
-        body = self.body()
-        logger.info(f"Aggregation body for search: {body}")
-
-        response = client.search(
-            index=index,
-            body=self.body()
-        )
-
-        return Result(**response)
-
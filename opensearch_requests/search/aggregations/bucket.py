@@ -1,6 +1,11 @@
-from typing import Any
+from typing import Any, Iterator, Optional
 
+from pydantic import Field
+
+from ..._imports import DeferredModel
+from ..result import Aggregation, BucketAggregation
 from .base import BaseAggregation
+from .enums import CompositeSourceType, SortOrder
 from .options import FieldOption
 
 
@@ -9,7 +14,134 @@ class TermsAggregation(
     FieldOption,
 ):
     """Counts number of documents per each field value."""
-    # def bare(self) -> dict[str, Any]:
-    #     return {
-    #         "terms": self.non_empty_dict(),
-    #     }
+    kind = "terms"
+    bucket_size: Optional[int] = Field(None)
+    """Number of buckets of the most frequent values to return.
+
+    Sent as ``size`` of the terms aggregation, the default is 10.
+    ``size`` of this model is the number of search hits instead.
+    """
+
+    def bare(self) -> dict[str, Any]:
+        terms = self.non_empty_dict(exclude={"bucket_size"})
+        if self.bucket_size is not None:
+            terms["size"] = self.bucket_size
+        result: dict[str, Any] = {"terms": terms}
+        if self.aggs:
+            result["aggs"] = self.nested_bare()
+        return result
+
+
+class CompositeSource(DeferredModel):
+    """Single source of composite aggregation buckets."""
+    name: str = Field(...)
+    """Name of the source in bucket keys."""
+    type: CompositeSourceType = Field(CompositeSourceType.terms, validate_default=True)
+    """How values of the field are grouped into buckets."""
+    field: str = Field(...)
+    """Name of the document field to take values from."""
+    order: Optional[SortOrder] = Field(None)
+    """Sort order of values of this source. The default is ascending."""
+    missing_bucket: Optional[bool] = Field(None)
+    """Whether documents without a value get a bucket with a null key."""
+    interval: Optional[float] = Field(None)
+    """Interval of the ``histogram`` source."""
+    calendar_interval: Optional[str] = Field(None)
+    """Interval of the ``date_histogram`` source, e.g. ``1d``."""
+
+    class Config:
+        use_enum_values = True
+
+    def bare(self) -> dict[str, Any]:
+        return {
+            self.name: {
+                self.type: self.model_dump(
+                    exclude={"name", "type"},
+                    exclude_none=True,
+                ),
+            }
+        }
+
+
+class CompositeAggregation(BaseAggregation):
+    """Paginates over all buckets of one or more sources.
+
+    Unlike ``TermsAggregation`` it returns every bucket, a page at a time,
+    so high cardinality fields can be traversed without the cluster ever
+    building one huge list of buckets. Use ``iter_buckets()`` to go over
+    all pages.
+
+    Example:
+
+        agg = CompositeAggregation(
+            name="by_user",
+            sources=[CompositeSource(name="user", field="user_id")],
+            aggs=[SumAggregation(name="spent", field="price")],
+        )
+        for bucket in agg.iter_buckets("orders", client):
+            print(bucket.key["user"], bucket.doc_count)
+
+    """
+    kind = "composite"
+    sources: list[CompositeSource] = Field(...)
+    """Sources whose values make up bucket keys."""
+    page_size: Optional[int] = Field(None)
+    """Number of buckets per page. The default is 10."""
+    after: Optional[dict[str, Any]] = Field(None)
+    """Key after which the page of buckets starts."""
+
+    def bare(self) -> dict[str, Any]:
+        composite: dict[str, Any] = {
+            "sources": [s.bare() for s in self.sources],
+        }
+        if self.page_size is not None:
+            composite["size"] = self.page_size
+        if self.after is not None:
+            composite["after"] = self.after
+
+        result: dict[str, Any] = {"composite": composite}
+        if self.aggs:
+            result["aggs"] = self.nested_bare()
+        return result
+
+    def iter_buckets(
+        self,
+        index: str,
+        client,
+        page_size: Optional[int] = None,
+    ) -> Iterator[BucketAggregation]:
+        """Iterate over all buckets, requesting them page by page.
+
+        Each page starts after the ``after_key`` of the previous one and
+        only the current page is kept in memory. Search hits are not
+        requested. Pages have ``page_size`` buckets, by default the
+        ``page_size`` of the aggregation or 1000 if it is not set.
+        """
+        if not (hasattr(client, "search") and callable(client.search)):
+            raise RuntimeError("Wrong OpenSearch client object passed")
+
+        if page_size is None:
+            page_size = self.page_size if self.page_size is not None else 1000
+
+        body = self.body()
+        bare = body["aggs"][self.name]
+        after = self.after
+        while True:
+            composite = {**bare["composite"], "size": page_size}
+            if after is not None:
+                composite["after"] = after
+            page_body = {
+                **body,
+                "size": 0,
+                "aggs": {self.name: {**bare, "composite": composite}},
+            }
+
+            response = client.search(index=index, body=page_body)
+            page = Aggregation(**response["aggregations"][self.name])
+            del response
+
+            yield from page.buckets or ()
+
+            after = page.after_key
+            if not page.buckets or after is None:
+                break
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class CompositeSourceType(str, Enum):
+    terms = "terms"
+    """Bucket per unique value of the field."""
+    histogram = "histogram"
+    """Bucket per fixed size interval of numeric values."""
+    date_histogram = "date_histogram"
+    """Bucket per calendar or fixed time interval of dates."""
+
+
+class SortOrder(str, Enum):
+    asc = "asc"
+    desc = "desc"
@@ -9,12 +9,11 @@ class SumAggregation(
     FieldOption,
 ):
     """Returns sum value of a field."""
-    # def bare(self) -> dict[str, Any]:
-    #     return = super().bare()
-    #     result["sum"]
-    #      {
-    #         "sum": self.non_empty_dict(),
-    #     }
+    kind = "sum"
+    def bare(self) -> dict[str, Any]:
+        return {
+            "sum": self.non_empty_dict(),
+        }
 
 
 class MinAggregation(
@@ -22,6 +21,7 @@ class MinAggregation(
     FieldOption,
 ):
     """Returns minimum value of a field."""
+    kind = "min"
     def bare(self) -> dict[str, Any]:
         return {
             "min": self.non_empty_dict(),
@@ -33,6 +33,7 @@ class MaxAggregation(
     FieldOption,
 ):
     """Returns maximum value of a field."""
+    kind = "max"
     def bare(self) -> dict[str, Any]:
         return {
             "max": self.non_empty_dict(),
@@ -44,6 +45,7 @@ class AvgAggregation(
     FieldOption,
 ):
     """Returns average value of a field."""
+    kind = "avg"
     def bare(self) -> dict[str, Any]:
         return {
             "avg": self.non_empty_dict(),
@@ -56,6 +58,7 @@ class CardinalityAggregation(
     PrecisionThresholdOption,
 ):
     """Counts number of unique values in a field."""
+    kind = "cardinality"
     def bare(self) -> dict[str, Any]:
         return {
             "cardinality": self.non_empty_dict(),
@@ -67,6 +70,7 @@ class ValueCountAggregation(
     FieldOption,
 ):
     """Calculates number of values that this aggregation is based on."""
+    kind = "value_count"
     def bare(self) -> dict[str, Any]:
         return {
             "value_count": self.non_empty_dict(),
@@ -81,6 +85,7 @@ class StatsAggregation(
     
     Includes: min, max, sum, avg, and value_count.
     """
+    kind = "stats"
     def bare(self) -> dict[str, Any]:
         return {
             "stats": self.non_empty_dict(),
@@ -97,6 +102,7 @@ class ExtendedStatsAggregation(
     Apart from basic stats (min, max, sum, avg, value_count) also returns
     stats such as sum_of_squares, variance, and std_deviation.
     """
+    kind = "extended_stats"
     def bare(self) -> dict[str, Any]:
         return {
             "extended_stats": self.non_empty_dict(),
@@ -108,6 +114,7 @@ class MatrixStatsAggregation(
     FieldsOption,
 ):
     """Generates advanced stats for multiple fields."""
+    kind = "matrix_stats"
     def bare(self) -> dict[str, Any]:
         return {
             "matrix_stats": self.non_empty_dict(),
@@ -1,29 +1,31 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ..._imports import DeferredModel
 
-class FieldOption(BaseModel):
+
+class FieldOption(DeferredModel):
     field: str = Field(...)
     """Name of the specific document field to aggregate."""
 
 
-class FieldsOption(BaseModel):
+class FieldsOption(DeferredModel):
     fields: list[str] = Field(...)
     """Fields to aggregate: ``["taxful_price", "base_price"]``."""
 
 
-class PrecisionThresholdOption(BaseModel):
+class PrecisionThresholdOption(DeferredModel):
     precision_threshold: Optional[int] = Field(None)
     """Threshold below which counts are expected to be close to accurate."""
 
 
-class SigmaOption(BaseModel):
+class SigmaOption(DeferredModel):
     sigma: Optional[int] = Field(None)
     """Configure standard deviation for std_deviation_bounds."""
 
 
-class SizeOption(BaseModel):
+class SizeOption(DeferredModel):
     """Number of top unique terms to request.
     
     Defaults to 10.
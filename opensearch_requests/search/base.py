@@ -0,0 +1,520 @@
+import functools
+import json
+import logging
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, Sequence, Union
+from urllib.parse import quote
+
+from typing_extensions import Self
+
+from .._imports import DeferredModel
+from .result import DocumentT, Result
+
+if TYPE_CHECKING:
+    from .cache import ResultCache
+    from .coalesce import SingleFlight
+    from .cost import Budget
+    from .hooks import SearchStats
+    from .prepared import PreparedQuery
+    from .resilience import ResiliencePolicy
+
+
+logger = logging.getLogger("opensearch_requests")
+
+
+_FROZEN = "_frozen_cache"
+"""Key in instance ``__dict__`` holding memoized output of frozen models.
+
+Pydantic ignores non-field keys of ``__dict__`` when comparing models,
+so the cache does not affect equality.
+"""
+
+
+def _memoized(method: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Cache result of a serialization method on frozen models."""
+    key = method.__qualname__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        cache = self.__dict__.get(_FROZEN)
+        if cache is None:
+            return method(self)
+        try:
+            return cache[key]
+        except KeyError:
+            value = cache[key] = method(self)
+            return value
+
+    wrapper.__memoized__ = True
+    return wrapper
+
+
+class _FrozenList(list):
+    """List field value of a frozen model, which can't be modified.
+
+    Being a list, it compares equal to lists and is serialized by
+    pydantic like the list the field is declared as.
+    """
+    def _frozen(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("List of a frozen model can't be modified")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen
+    append = extend = insert = pop = remove = clear = sort = reverse = _frozen
+
+    def __reduce__(self):
+        # Copies are rebuilt from the items, not by appending them
+        return type(self), (list(self),)
+
+
+def _freeze_value(value: Any) -> Any:
+    if isinstance(value, Searchable):
+        return value.freeze()
+    if isinstance(value, tuple):
+        return tuple(_freeze_value(v) for v in value)
+    if isinstance(value, list):
+        return _FrozenList(_freeze_value(v) for v in value)
+    return value
+
+
+def _raw_connection(client) -> Optional[Any]:
+    """Return connection of an opensearch-py client transport, if any.
+
+    Requests sent through the connection return the response body as is,
+    before the transport deserializes it.
+    """
+    transport = getattr(client, "transport", None)
+    get_connection = getattr(transport, "get_connection", None)
+    if not callable(get_connection):
+        return None
+    return get_connection()
+
+
+def _search_path(index: str) -> str:
+    return f"/{quote(index, safe=',*')}/_search"
+
+
+def _join_paths(paths: Union[str, Sequence[str]]) -> str:
+    return paths if isinstance(paths, str) else ",".join(paths)
+
+
+def _json_size(body: Any) -> int:
+    # Separate pass measuring the size, only made when hooks are registered
+    return len(json.dumps(body, separators=(",", ":")).encode("utf-8"))
+
+
+def _report(stats: "SearchStats", response: Any, result: Result) -> None:
+    from .hooks import emit
+
+    if isinstance(response, (str, bytes)):
+        stats.response_bytes = len(
+            response if isinstance(response, bytes) else response.encode("utf-8")
+        )
+    stats.took = result.took
+    if result.hits is not None:
+        stats.hits = len(result.hits.hits)
+        if result.hits.total is not None:
+            stats.total_hits = result.hits.total.value
+    emit(stats)
+
+
+class Searchable(DeferredModel):
+    """Base class for queries and aggregations sent to the search API."""
+    kind: ClassVar[Optional[str]] = None
+    """Type of the query or aggregation in the body, e.g. ``match``."""
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        for name in ("bare", "body"):
+            method = cls.__dict__.get(name)
+            if method is not None and not hasattr(method, "__memoized__"):
+                setattr(cls, name, _memoized(method))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if _FROZEN in self.__dict__:
+            raise TypeError(f"{type(self).__name__} is frozen")
+        super().__setattr__(name, value)
+
+    def __hash__(self) -> int:
+        if _FROZEN not in self.__dict__:
+            raise TypeError(
+                f"Unhashable {type(self).__name__}, use freeze() to get "
+                "a hashable copy"
+            )
+        return hash((type(self), self.fingerprint()))
+
+    @property
+    def is_frozen(self) -> bool:
+        return _FROZEN in self.__dict__
+
+    def freeze(self) -> Self:
+        """Return immutable and hashable copy of this model.
+
+        Nested queries and aggregations are frozen too, and lists can't
+        be modified. The copy compares equal to this model. Output of
+        ``bare()`` and ``body()`` of a frozen model is computed once and
+        reused by every later call, including calls made by parent
+        queries. Returned dicts are shared between calls, so they must
+        not be modified.
+        """
+        if _FROZEN in self.__dict__:
+            return self
+        frozen = self.model_copy()
+        frozen._freeze_fields()
+        return frozen
+
+    def model_copy(self, *, update: Optional[dict[str, Any]] = None, deep: bool = False) -> Self:
+        """Return copy of this model, which is not frozen.
+
+        Memoized output of a frozen model is not copied, so it doesn't
+        go stale when ``update`` changes fields. Nested models stay frozen.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if _FROZEN in copied.__dict__:
+            del copied.__dict__[_FROZEN]
+            for name, value in copied.__dict__.items():
+                if isinstance(value, _FrozenList):
+                    copied.__dict__[name] = list(value)
+        return copied
+
+    def replace(self, **changes: Any) -> Self:
+        """Return frozen copy of this model with some fields changed.
+
+        Unchanged nested models are reused as is, together with their
+        memoized output, so only the changed path of a tree is serialized
+        again.
+
+        Example:
+
+            tree = BooleanQuery(must=[title, tenant]).freeze()
+            tree = tree.replace(must=[title, other_tenant])
+
+        """
+        data = {name: getattr(self, name) for name in self.model_fields_set}
+        data.update(changes)
+        updated = type(self)(**data)
+        updated._freeze_fields()
+        return updated
+
+    def _freeze_fields(self) -> None:
+        for name in type(self).model_fields:
+            if name in self.__dict__:
+                self.__dict__[name] = _freeze_value(self.__dict__[name])
+        self.__dict__[_FROZEN] = {}
+
+    def body(self) -> dict[str, Any]:
+        raise NotImplementedError
+
+    @_memoized
+    def canonical(self) -> dict[str, Any]:
+        """Return canonical form of ``body()``, see ``canonical.canonical()``.
+
+        Semantically identical requests, e.g. with ``filter`` clauses in
+        different order or with options explicitly set to their defaults,
+        have identical canonical bodies.
+        """
+        from .canonical import canonical
+
+        return canonical(self)
+
+    @_memoized
+    def fingerprint(self) -> str:
+        """Return stable digest of the canonical body.
+
+        Suitable as a cache or deduplication key of the request.
+        """
+        from .canonical import fingerprint
+
+        return fingerprint(self)
+
+    def prepare(self) -> "PreparedQuery":
+        """Compile this request with ``Param`` placeholders into a template.
+
+        See ``opensearch_requests.search.prepared.PreparedQuery``.
+        """
+        from .prepared import PreparedQuery
+
+        return PreparedQuery(self)
+
+    def search(
+        self,
+        index: str,
+        client,
+        lazy: bool = False,
+        raw: bool = False,
+        model: Optional[type[DocumentT]] = None,
+        cache: Union["ResultCache", bool, None] = None,
+        coalesce: Union["SingleFlight", bool] = False,
+        budget: Union["Budget", bool, None] = None,
+        resilience: Union["ResiliencePolicy", bool, None] = None,
+        filter_path: Union[str, Sequence[str], None] = None,
+    ) -> Result[DocumentT]:
+        """Send this request to the search API of the index.
+
+        With ``lazy=True`` the response is parsed with ``Result.lazy()``,
+        so hits and aggregations are only validated when accessed.
+
+        With ``raw=True`` the request is sent straight through a connection
+        of the opensearch-py transport and the undecoded JSON response is
+        validated by ``Result.parse()`` in one pass. Transport level retries
+        and sniffing are skipped in this mode. Clients without such
+        a transport fall back to regular ``client.search()``.
+
+        With ``model`` given, ``_source`` of every hit is validated into
+        that pydantic model as part of parsing the response.
+
+        ``cache`` is a ``ResultCache`` to serve identical searches from.
+        By default the cache set with ``configure_cache()`` is used, if any,
+        and ``cache=False`` bypasses caching for this search.
+
+        With ``coalesce=True``, or a ``SingleFlight`` group, identical
+        searches running concurrently with this one share a single request
+        and all receive the same ``Result`` object, which must not be
+        modified. Searches are identical when they go to the same index
+        through the same client with the same canonical body.
+
+        ``budget`` limits the estimated cost of the request, see
+        ``cost.Budget``. Requests over the budget raise ``QueryTooExpensive``
+        or are downgraded before sending. By default the budget set with
+        ``configure_budget()`` is enforced, if any, and ``budget=False``
+        skips the check.
+
+        ``resilience`` is a ``ResiliencePolicy`` adding retries, a circuit
+        breaker and hedged requests to the search. By default the policy
+        registered for the type of this request with
+        ``configure_resilience()`` is used, if any. ``resilience=True``
+        falls back to the default policy and ``resilience=False`` makes
+        a single attempt.
+
+        ``filter_path`` lists the only parts of the response to return,
+        e.g. ``["hits.hits._id", "hits.hits._source"]``, which makes
+        responses smaller and faster to parse. ``Result`` fields that
+        were left out are None.
+        """
+        return _SearchCall(
+            self, index, client, lazy, raw, model, cache, coalesce, budget,
+            resilience, filter_path,
+        ).run()
+
+    async def asearch(
+        self,
+        index: str,
+        client,
+        lazy: bool = False,
+        raw: bool = False,
+        model: Optional[type[DocumentT]] = None,
+        cache: Union["ResultCache", bool, None] = None,
+        coalesce: Union["SingleFlight", bool] = False,
+        budget: Union["Budget", bool, None] = None,
+        resilience: Union["ResiliencePolicy", bool, None] = None,
+        filter_path: Union[str, Sequence[str], None] = None,
+    ) -> Result[DocumentT]:
+        """Awaitable version of ``search()`` for ``AsyncOpenSearch`` clients.
+
+        The event loop is not blocked while waiting for the response, so
+        many searches can be in flight from a single thread.
+        """
+        return await _SearchCall(
+            self, index, client, lazy, raw, model, cache, coalesce, budget,
+            resilience, filter_path,
+        ).arun()
+
+
+class _SearchCall:
+    """Steps of a single ``search()`` or ``asearch()`` call.
+
+    Everything but sending the request is shared by both, so they only
+    differ in how they wait for the response.
+    """
+    def __init__(
+        self,
+        request: Searchable,
+        index: str,
+        client,
+        lazy: bool,
+        raw: bool,
+        model: Optional[type],
+        cache: Union["ResultCache", bool, None],
+        coalesce: Union["SingleFlight", bool],
+        budget: Union["Budget", bool, None],
+        resilience: Union["ResiliencePolicy", bool, None],
+        filter_path: Union[str, Sequence[str], None],
+    ):
+        # Make sure client object has search function as an
+        # attribute that is callable
+        if not (hasattr(client, "search") and callable(client.search)):
+            raise RuntimeError("Wrong OpenSearch client object passed")
+
+        # Imported here, so importing queries doesn't import what searches use
+        from .cache import resolve_cache
+        from .coalesce import resolve_flight
+        from .cost import resolve_budget
+        from .resilience import resolve_policy
+
+        limit = resolve_budget(budget)
+        if limit is not None:
+            # May be a downgraded copy, which is sent in place of the request
+            request = limit.enforce(request)
+
+        self.request = request
+        self.index = index
+        self.client = client
+        self.lazy = lazy
+        self.raw = raw
+        self.model = model
+        self.filter_path = filter_path
+        self.path = _search_path(index)
+        self.cache = resolve_cache(cache)
+        self.policy = resolve_policy(resilience, type(request))
+        self.flight = resolve_flight(coalesce)
+        self.key: Optional[str] = None
+        if self.cache is not None:
+            self.key = self.cache.key(index, self.canonical(), model, filter_path, client)
+
+    def body(self) -> Union[dict[str, Any], bytes]:
+        """Return body to send, a dict or already serialized JSON."""
+        return self.request.body()
+
+    def canonical(self) -> dict[str, Any]:
+        """Return body identifying the request in cache keys."""
+        return self.request.canonical()
+
+    def run(self) -> Result:
+        """Return result of the search, sending the request if needed."""
+        cached = self.cached()
+        if cached is not None:
+            return cached
+
+        client = self.client
+
+        def fetch(preference: Optional[str] = None) -> Result:
+            stats, body, params = self.start(preference)
+            connection = _raw_connection(client) if self.raw else None
+            if connection is not None:
+                _, _, response = connection.perform_request(
+                    "POST", self.path, params=params, body=self.encode(body, stats)
+                )
+            else:
+                self.measure(body, stats)
+                response = client.search(index=self.index, body=body, **params)
+            return self.finish(response, stats)
+
+        if self.policy is not None:
+            send = lambda: self.policy.execute(client, fetch)
+        else:
+            send = fetch
+
+        if self.flight is not None:
+            result = self.flight.do(self.flight_key(), send)
+        else:
+            result = send()
+        return self.store(result)
+
+    async def arun(self) -> Result:
+        """Awaitable version of ``run()`` for ``AsyncOpenSearch`` clients."""
+        cached = await self.acached()
+        if cached is not None:
+            return cached
+
+        client = self.client
+
+        async def fetch(preference: Optional[str] = None) -> Result:
+            stats, body, params = self.start(preference)
+            connection = None
+            if self.raw:
+                # Async transport creates its connection pool on first use
+                init = getattr(getattr(client, "transport", None), "_async_call", None)
+                if callable(init):
+                    await init()
+                connection = _raw_connection(client)
+            if connection is not None:
+                _, _, response = await connection.perform_request(
+                    "POST", self.path, params=params, body=self.encode(body, stats)
+                )
+            else:
+                self.measure(body, stats)
+                response = await client.search(index=self.index, body=body, **params)
+            return self.finish(response, stats)
+
+        if self.policy is not None:
+            send = lambda: self.policy.aexecute(client, fetch)
+        else:
+            send = fetch
+
+        if self.flight is not None:
+            result = await self.flight.ado(self.flight_key(), send)
+        else:
+            result = await send()
+        return await self.astore(result)
+
+    def cached(self) -> Optional[Result]:
+        if self.cache is None:
+            return None
+        return self.cache.get(self.key)
+
+    async def acached(self) -> Optional[Result]:
+        if self.cache is None:
+            return None
+        return await self.cache.aget(self.key)
+
+    def flight_key(self) -> tuple[Any, ...]:
+        from .coalesce import flight_key
+
+        return flight_key(
+            self.index, self.client, self.request, self.model, self.lazy, self.filter_path
+        )
+
+    def start(
+        self, preference: Optional[str]
+    ) -> tuple[Optional["SearchStats"], Union[dict[str, Any], bytes], dict[str, Any]]:
+        """Return stats to fill in, body and query parameters of a request."""
+        from .hooks import SearchStats, _hooks
+
+        stats = SearchStats(type(self.request).__name__, self.index) if _hooks else None
+        body = self.body()
+        logger.info("%s body for search: %s", type(self.request).__name__, body)
+        params = {}
+        if preference is not None:
+            params["preference"] = preference
+        if self.filter_path:
+            params["filter_path"] = _join_paths(self.filter_path)
+        return stats, body, params
+
+    def encode(self, body: Union[dict[str, Any], bytes], stats: Optional["SearchStats"]) -> bytes:
+        """Return body serialized for sending through a raw connection."""
+        if isinstance(body, bytes):
+            data = body
+        else:
+            data = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        if stats is not None:
+            stats.serialize = stats.lap()
+            stats.body_bytes = len(data)
+        return data
+
+    def measure(self, body: Union[dict[str, Any], bytes], stats: Optional["SearchStats"]) -> None:
+        """Record serialization of a body the client serializes itself."""
+        if stats is not None:
+            stats.serialize = stats.lap()
+            stats.body_bytes = len(body) if isinstance(body, bytes) else _json_size(body)
+            # Measuring the size is not part of any phase
+            stats.lap()
+
+    def finish(self, response: Any, stats: Optional["SearchStats"]) -> Result:
+        """Return parsed response."""
+        if stats is not None:
+            stats.request = stats.lap()
+        result_type = Result[self.model] if self.model is not None else Result
+        result = result_type.parse(response, lazy=self.lazy)
+        if stats is not None:
+            stats.parse = stats.lap()
+            _report(stats, response, result)
+        return result
+
+    def store(self, result: Result) -> Result:
+        if self.cache is not None:
+            self.cache.set(self.key, result)
+        return result
+
+    async def astore(self, result: Result) -> Result:
+        if self.cache is not None:
+            await self.cache.aset(self.key, result)
+        return result
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Sequence, Union
+
+from .result import Result
+
+
+class CacheBackend:
+    """Storage of cached search results.
+
+    Implement this interface to share cached results between processes,
+    e.g. in Redis or Memcached. Such backends are responsible for
+    serializing ``Result`` objects, e.g. with ``model_dump_json()``.
+
+    ``asearch()`` uses ``aget()`` and ``aset()``, which call ``get()`` and
+    ``set()`` on the event loop by default. Backends doing network I/O
+    should override them with non-blocking versions.
+    """
+    def get(self, key: str) -> Optional[Result]:
+        """Return cached result or None if it is missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Result, ttl: float) -> None:
+        """Store result for ``ttl`` seconds."""
+        raise NotImplementedError
+
+    async def aget(self, key: str) -> Optional[Result]:
+        """Awaitable version of ``get()``."""
+        return self.get(key)
+
+    async def aset(self, key: str, value: Result, ttl: float) -> None:
+        """Awaitable version of ``set()``."""
+        self.set(key, value, ttl)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Thread-safe in-process cache with TTL and LRU eviction.
+
+    Holds at most ``maxsize`` results. When full, the least recently
+    used result is evicted. Results are stored as is, so the same
+    ``Result`` object is returned for every hit.
+    """
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("Cache size must be a positive integer")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, Result]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Result]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Result, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResultCache:
+    """Client-side cache of search results keyed by index and request body.
+
+    Pass it to ``search()`` of a query or aggregation, or make it
+    the default cache for all searches with ``configure_cache()``.
+    Cached ``Result`` objects are shared between callers and must
+    not be modified.
+
+    Example:
+
+        cache = ResultCache(ttl=5)
+        query.search("movies", client, cache=cache)
+        print(cache.hits, cache.misses)
+
+    """
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: float = 30.0,
+    ):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        """Storage of cached results, in-process LRU by default."""
+        self.ttl = ttl
+        """Time in seconds a result stays cached."""
+        self.hits = 0
+        """Number of searches served from the cache."""
+        self.misses = 0
+        """Number of searches sent to the cluster."""
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        index: str,
+        body: dict[str, Any],
+        model: Optional[type] = None,
+        filter_path: Union[str, Sequence[str], None] = None,
+        client: Any = None,
+    ) -> str:
+        """Return cache key of a search request.
+
+        Searches pass the canonical body, so semantically identical
+        requests share a key, and the client, so searches of indices
+        with the same name on different clusters don't.
+        """
+        canonical = json.dumps(
+            [cluster_id(client), index, body], sort_keys=True, separators=(",", ":"), default=str
+        )
+        if model is not None:
+            canonical += f"|{model.__module__}.{model.__qualname__}"
+        if filter_path:
+            paths = [filter_path] if isinstance(filter_path, str) else filter_path
+            canonical += "|" + ",".join(paths)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Result]:
+        return self._count(self.backend.get(key))
+
+    async def aget(self, key: str) -> Optional[Result]:
+        """Awaitable version of ``get()``, used by ``asearch()``."""
+        return self._count(await self.backend.aget(key))
+
+    def set(self, key: str, result: Result) -> None:
+        """Store result, unless it is partial.
+
+        Responses that timed out or miss results of failed shards are
+        not cached, so a transient failure isn't served for the whole TTL.
+        """
+        if not _is_partial(result):
+            self.backend.set(key, result, self.ttl)
+
+    async def aset(self, key: str, result: Result) -> None:
+        """Awaitable version of ``set()``, used by ``asearch()``."""
+        if not _is_partial(result):
+            await self.backend.aset(key, result, self.ttl)
+
+    def clear(self) -> None:
+        """Drop all cached results and reset counters."""
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _count(self, result: Optional[Result]) -> Optional[Result]:
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+
+def _is_partial(result: Result) -> bool:
+    return bool(result.timed_out) or (result.shards is not None and bool(result.shards.failed))
+
+
+def cluster_id(client: Any) -> Optional[str]:
+    """Return identifier of the cluster a client sends requests to.
+
+    That is the hosts of an opensearch-py client transport, which are
+    the same in every process, or the identity of other clients.
+    """
+    if client is None:
+        return None
+    hosts = getattr(getattr(client, "transport", None), "hosts", None)
+    if hosts:
+        return json.dumps(hosts, sort_keys=True, default=str)
+    return f"{type(client).__qualname__}@{id(client):x}"
+
+
+_default_cache: Optional[ResultCache] = None
+
+
+def configure_cache(cache: Optional[ResultCache]) -> None:
+    """Set cache used by all searches that don't pass ``cache`` explicitly.
+
+    Pass None to disable default caching again.
+    """
+    global _default_cache
+    _default_cache = cache
+
+
+def resolve_cache(cache: Union[ResultCache, bool, None]) -> Optional[ResultCache]:
+    """Return cache to use for a search given its ``cache`` argument.
+
+    None means the default cache, False bypasses caching.
+    """
+    if cache is None or cache is True:
+        return _default_cache
+    if cache is False:
+        return None
+    return cache
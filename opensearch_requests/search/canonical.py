@@ -0,0 +1,105 @@
+import hashlib
+import json
+from typing import Any
+
+from .base import _FROZEN, Searchable
+
+
+SERVER_DEFAULTS: dict[str, Any] = {
+    "allow_leading_wildcard": True,
+    "analyze_wildcard": False,
+    "auto_generate_synonyms_phrase_query": True,
+    "boost": 1.0,
+    "default_operator": "or",
+    "enable_position_incriments": True,
+    "fuzzy_max_expansions": 50,
+    "fuzzy_prefix_length": 0,
+    "fuzzy_transportations": True,
+    "lenient": False,
+    "low_freq_operator": "or",
+    "max_determined_states": 10000,
+    "max_expansions": 50,
+    "operator": "or",
+    "phrase_slop": 0,
+    "prefix_length": 0,
+    "rewrite": "constant_score",
+    "slop": 0,
+    "tie_breaker": 0.0,
+    "type": "best_fields",
+    "zero_terms_query": "none",
+}
+"""Values OpenSearch uses for query options that are not set."""
+
+UNORDERED_CLAUSES = ("filter", "must_not")
+"""Boolean query clauses whose order does not affect results or scores."""
+
+
+def canonical(request: Searchable) -> dict[str, Any]:
+    """Return canonical form of the request body.
+
+    Semantically identical requests get identical canonical bodies:
+
+    * options explicitly set to the value OpenSearch uses by default
+      are removed;
+    * ``filter`` and ``must_not`` clauses of boolean queries are sorted;
+    * keys of all objects are sorted.
+
+    The canonical body can be sent instead of ``body()`` to make identical
+    requests byte-identical, which lets them hit the shard request cache.
+    """
+    return _sorted(_without_defaults(request).body())
+
+
+def fingerprint(request: Searchable) -> str:
+    """Return stable digest of the canonical form of the request."""
+    data = json.dumps(
+        canonical(request),
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _without_defaults(request: Searchable) -> Searchable:
+    update: dict[str, Any] = {}
+    for name in request.model_fields_set:
+        value = getattr(request, name)
+        if isinstance(value, Searchable):
+            normalized = _without_defaults(value)
+            if normalized is not value:
+                update[name] = normalized
+        elif isinstance(value, (list, tuple)):
+            items = [
+                _without_defaults(v) if isinstance(v, Searchable) else v
+                for v in value
+            ]
+            if any(a is not b for a, b in zip(items, value)):
+                update[name] = items
+        elif name in SERVER_DEFAULTS and value == SERVER_DEFAULTS[name]:
+            update[name] = None
+
+    if not update:
+        return request
+    normalized = request.model_copy(update=update)
+    # The copy differs from the original, so memoized output can't be reused
+    normalized.__dict__.pop(_FROZEN, None)
+    return normalized
+
+
+def _sorted(node: Any) -> Any:
+    if isinstance(node, dict):
+        result = {key: _sorted(node[key]) for key in sorted(node)}
+        clauses = result.get("bool")
+        if isinstance(clauses, dict):
+            for name in UNORDERED_CLAUSES:
+                if isinstance(clauses.get(name), list):
+                    clauses[name] = sorted(clauses[name], key=_sort_key)
+        return result
+    if isinstance(node, (list, tuple)):
+        return [_sorted(v) for v in node]
+    return node
+
+
+def _sort_key(node: Any) -> str:
+    return json.dumps(node, separators=(",", ":"), default=str)
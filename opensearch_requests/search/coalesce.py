@@ -0,0 +1,121 @@
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Hashable, Optional, Sequence, TypeVar, Union
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls into a single call.
+
+    While a call with some key is in flight, further calls with the same
+    key don't start their own but wait for it and receive its outcome,
+    the same returned object or the same raised exception. Once the call
+    completes, the key is forgotten, so the next call starts afresh and
+    never sees a result older than itself.
+
+    Both threads (``do()``) and coroutines (``ado()``) are supported.
+    Coroutines only share calls made from the same event loop.
+
+    Example:
+
+        flight = SingleFlight()
+        result = query.search("products", client, coalesce=flight)
+
+    """
+    def __init__(self):
+        self._calls: dict[Hashable, Future] = {}
+        self._tasks: dict[tuple[int, Hashable], "asyncio.Task"] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, call: Callable[[], T]) -> T:
+        """Return result of ``call()`` or of an identical call in flight."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = call()
+        except BaseException as e:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._calls[key]
+        future.set_result(result)
+        return result
+
+    async def ado(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Awaitable version of ``do()`` for coroutine functions.
+
+        The shared call runs in its own task, so cancelling any of
+        the waiting callers, including the first one, doesn't cancel it
+        for the others.
+        """
+        # Imported here as it is slow to import and only needed by
+        # callers that already run an event loop
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = self._tasks[task_key] = loop.create_task(
+                    self._run(task_key, call)
+                )
+        return await asyncio.shield(task)
+
+    async def _run(self, task_key: tuple[int, Hashable], call: Callable[[], Awaitable[T]]) -> T:
+        try:
+            return await call()
+        finally:
+            with self._lock:
+                del self._tasks[task_key]
+
+    def __len__(self) -> int:
+        """Number of calls currently in flight."""
+        return len(self._calls) + len(self._tasks)
+
+
+def flight_key(
+    index: str,
+    client,
+    request,
+    model: Optional[type] = None,
+    lazy: bool = False,
+    filter_path: Union[str, Sequence[str], None] = None,
+) -> tuple[Any, ...]:
+    """Return key identifying a search for coalescing.
+
+    Requests are compared by their canonical bodies, and only searches
+    through the same client parsing results the same way are coalesced.
+    """
+    if filter_path is not None and not isinstance(filter_path, str):
+        filter_path = tuple(filter_path)
+    return (id(client), index, request.fingerprint(), model, lazy, filter_path)
+
+
+_default_flight = SingleFlight()
+
+
+def resolve_flight(coalesce: Union[SingleFlight, bool]) -> Optional[SingleFlight]:
+    """Return group to coalesce a search in given its ``coalesce`` argument.
+
+    True means the shared default group, False disables coalescing.
+    """
+    if coalesce is True:
+        return _default_flight
+    if coalesce is False:
+        return None
+    return coalesce
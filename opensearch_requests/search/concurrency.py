@@ -0,0 +1,46 @@
+import asyncio
+from typing import Iterable, Union
+
+from .base import Searchable
+from .result import Result
+
+
+async def asearch_many(
+    client,
+    requests: Iterable[tuple[str, Searchable]],
+    concurrency: int = 10,
+    return_exceptions: bool = False,
+) -> list[Union[Result, BaseException]]:
+    """Run many searches concurrently on an ``AsyncOpenSearch`` client.
+
+    Each request is an ``(index, query_or_aggregation)`` pair. At most
+    ``concurrency`` searches are in flight at the same time. Results are
+    returned in the same order as requests.
+
+    Example:
+
+        results = await asearch_many(
+            client,
+            [
+                ("movies", MatchQuery(field="title", query="wind")),
+                ("movies", TermsAggregation(name="genres", field="genre")),
+            ],
+            concurrency=50,
+        )
+
+    If ``return_exceptions`` is true, a failed search puts its exception
+    in place of the result instead of cancelling the whole batch.
+    """
+    if concurrency < 1:
+        raise ValueError("Concurrency must be a positive integer")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(index: str, request: Searchable) -> Result:
+        async with semaphore:
+            return await request.asearch(index, client)
+
+    return await asyncio.gather(
+        *(run(index, request) for index, request in requests),
+        return_exceptions=return_exceptions,
+    )
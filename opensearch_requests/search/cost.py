@@ -0,0 +1,331 @@
+import re
+from enum import Enum
+from typing import Any, Optional, Union
+
+from pydantic import Field
+
+from .._imports import DeferredModel
+from .aggregations.base import BaseAggregation
+from .base import Searchable
+
+
+BASE_COSTS: dict[str, float] = {
+    "match_all": 1,
+    "term": 1,
+    "terms": 1,
+    "match": 2,
+    "match_phrase": 3,
+    "match_phrase_prefix": 4,
+    "match_bool_prefix": 4,
+    "multi_match": 2,
+    "query_string": 5,
+    "simple_query_string": 5,
+    "bool": 1,
+    "sum": 1,
+    "min": 1,
+    "max": 1,
+    "avg": 1,
+    "value_count": 1,
+    "stats": 2,
+    "extended_stats": 3,
+    "cardinality": 3,
+    "matrix_stats": 5,
+    "composite": 5,
+}
+"""Estimated cost of a query or aggregation by its type, before options."""
+
+BUCKET_AGGREGATIONS = ("terms", "composite")
+
+_BUCKET_OPTIONS = {"terms": "bucket_size", "composite": "page_size"}
+"""Options with the number of buckets of bucket aggregations by kind."""
+
+_LEADING_WILDCARD = re.compile(r"(?:^|[\s(:])[*?]")
+_REGEX = re.compile(r"(?:^|[\s(:])/")
+_FUZZY = re.compile(r"\w~")
+
+
+class CostItem(DeferredModel):
+    """Estimated cost of a single query or aggregation of a request."""
+    path: str = Field(...)
+    """Location of the node in the request, e.g. ``must[0]``."""
+    kind: str = Field(...)
+    """Query or aggregation type, e.g. ``match`` or ``terms``."""
+    cost: float = Field(...)
+    """Estimated cost including penalties of risky options."""
+    reasons: list[str] = Field(default_factory=list)
+    """Explanations of penalties added to the base cost."""
+
+
+class CostReport(DeferredModel):
+    """Estimated cost of a request broken down by nodes of its tree."""
+    items: list[CostItem] = Field(default_factory=list)
+
+    @property
+    def total(self) -> float:
+        return sum(item.cost for item in self.items)
+
+    @property
+    def reasons(self) -> list[str]:
+        return [f"{i.path}: {r}" for i in self.items for r in i.reasons]
+
+
+class QueryTooExpensive(Exception):
+    """Raised when a request exceeds the cost budget of a search."""
+    def __init__(self, report: CostReport, budget: "Budget"):
+        self.report = report
+        self.budget = budget
+        reasons = "; ".join(report.reasons) or "too many clauses"
+        super().__init__(
+            f"Estimated cost {report.total:.0f} exceeds budget "
+            f"{budget.max_cost:.0f}: {reasons}"
+        )
+
+
+class BudgetAction(str, Enum):
+    reject = "reject"
+    """Raise ``QueryTooExpensive`` without sending the request."""
+    downgrade = "downgrade"
+    """Cap risky options and send the request if it then fits."""
+
+
+class Budget(DeferredModel):
+    """Maximum estimated cost of requests sent by ``search()``.
+
+    Example:
+
+        budget = Budget(max_cost=50, action="downgrade")
+        query.search("products", client, budget=budget)
+
+    """
+    max_cost: float = Field(100.0)
+    """Maximum estimated cost of a request, see ``analyze()``."""
+    action: BudgetAction = Field(BudgetAction.reject, validate_default=True)
+    """What to do with requests over the budget."""
+    max_expansions: int = Field(50)
+    """Cap of ``max_expansions`` and ``fuzzy_max_expansions`` on downgrade."""
+    min_prefix_length: int = Field(1)
+    """Minimal prefix length of fuzzy queries on downgrade."""
+    max_determined_states: int = Field(10000)
+    """Cap of ``max_determined_states`` on downgrade."""
+    max_size: int = Field(1000)
+    """Cap of number of hits and of terms aggregation buckets on downgrade."""
+
+    class Config:
+        use_enum_values = True
+
+    def enforce(self, request: Searchable) -> Searchable:
+        """Return request to send in place of the given one.
+
+        That is the request itself if it fits the budget, or its
+        downgraded copy. Raises ``QueryTooExpensive`` otherwise.
+        """
+        report = analyze(request)
+        if report.total <= self.max_cost:
+            return request
+        if self.action == BudgetAction.downgrade:
+            request = downgrade(request, self)
+            report = analyze(request)
+            if report.total <= self.max_cost:
+                return request
+        raise QueryTooExpensive(report, self)
+
+
+def analyze(request: Searchable) -> CostReport:
+    """Estimate cost of executing the request on the cluster.
+
+    Every query and aggregation of the tree gets a base cost by its type
+    and penalties for options known to be expensive: leading wildcards,
+    regular expressions, large ``max_expansions``, fuzzy matching without
+    a prefix, high ``max_determined_states``, and large numbers of hits or
+    buckets. Costs of aggregations nested under bucket aggregations are
+    multiplied by the number of parent buckets.
+
+    Costs are relative units for comparison with a ``Budget``, not time.
+    """
+    report = CostReport()
+    _walk(request, "", 1.0, report.items)
+    return report
+
+
+def downgrade(request: Searchable, budget: Budget) -> Searchable:
+    """Return copy of the request with expensive options capped by budget.
+
+    Leading wildcards are disabled, so such queries fail on the cluster
+    instead of scanning whole term dictionaries.
+    """
+    update: dict[str, Any] = {}
+    for name in request.model_fields_set:
+        value = getattr(request, name)
+        if isinstance(value, Searchable):
+            capped = downgrade(value, budget)
+            if capped is not value:
+                update[name] = capped
+        elif isinstance(value, (list, tuple)) and any(isinstance(v, Searchable) for v in value):
+            items = [downgrade(v, budget) if isinstance(v, Searchable) else v for v in value]
+            if any(a is not b for a, b in zip(items, value)):
+                update[name] = items
+    update.update(_capped_options(request, budget))
+
+    if not update:
+        return request
+    data = {name: getattr(request, name) for name in request.model_fields_set}
+    data.update(update)
+    capped = type(request)(**data)
+    return capped.freeze() if request.is_frozen else capped
+
+
+def _walk(
+    node: Searchable, path: str, multiplier: float, items: list[CostItem]
+) -> None:
+    kind = _kind(node)
+    bucket = _is_bucket_aggregation(node, kind)
+    cost, reasons = _node_cost(node, kind, path, bucket)
+    if multiplier != 1:
+        reasons.append(f"evaluated for {multiplier:.0f} parent buckets")
+    items.append(CostItem(
+        path=path or "$", kind=kind, cost=cost * multiplier, reasons=reasons,
+    ))
+
+    if bucket:
+        multiplier *= max(1.0, (_buckets(node, kind) or 10) / 10)
+
+    for name, value in node.__dict__.items():
+        if value is None:
+            continue
+        if isinstance(value, Searchable):
+            _walk(value, _join(path, name), multiplier, items)
+        elif isinstance(value, (list, tuple)):
+            for i, v in enumerate(value):
+                if isinstance(v, Searchable):
+                    _walk(v, f"{_join(path, name)}[{i}]", multiplier, items)
+
+
+def _node_cost(node: Searchable, kind: str, path: str, bucket: bool) -> tuple[float, list[str]]:
+    # Fields are read from __dict__, as missing attributes are slow to look up on models
+    options = node.__dict__
+    cost = float(BASE_COSTS.get(kind, 1))
+    reasons: list[str] = []
+
+    def penalty(amount: float, reason: str) -> None:
+        nonlocal cost
+        cost += amount
+        reasons.append(reason)
+
+    fields = options.get("fields")
+    if kind == "multi_match" and fields:
+        cost *= len(fields)
+    values = options.get("values")
+    if kind == "terms" and isinstance(values, (list, tuple)) and len(values) > 100:
+        penalty(len(values) / 100, f"{len(values)} terms")
+
+    text = options.get("query") if kind in ("query_string", "simple_query_string") else None
+    if isinstance(text, str):
+        if _LEADING_WILDCARD.search(text) and options.get("allow_leading_wildcard") is not False:
+            penalty(100, "leading wildcard")
+        if kind == "query_string" and _REGEX.search(text):
+            penalty(20, "regular expression")
+
+    for option in ("max_expansions", "fuzzy_max_expansions"):
+        value = options.get(option)
+        if value is not None and value > 50:
+            penalty(value / 10, f"{option}={value}")
+
+    fuzziness = options.get("fuzziness")
+    fuzzy = (fuzziness is not None and fuzziness != 0) or (
+        isinstance(text, str) and _FUZZY.search(text) is not None
+    )
+    if fuzzy:
+        prefix_option = "prefix_length" if "prefix_length" in options else "fuzzy_prefix_length"
+        if not options.get(prefix_option):
+            penalty(20, f"fuzzy matching with {prefix_option}=0")
+
+    states = options.get("max_determined_states")
+    if states is not None and states > 10000:
+        penalty(states / 1000, f"max_determined_states={states}")
+
+    # Number of hits is only sent for the whole request
+    size = options.get("size")
+    if size is not None and size > 1000 and not path:
+        penalty(size / 100, f"size={size}")
+    if bucket:
+        buckets = _buckets(node, kind)
+        if buckets is not None and buckets > 1000:
+            penalty(buckets / 100, f"{_BUCKET_OPTIONS[kind]}={buckets}")
+    return cost, reasons
+
+
+def _capped_options(node: Searchable, budget: Budget) -> dict[str, Any]:
+    options = node.__dict__
+    update: dict[str, Any] = {}
+    for option in ("max_expansions", "fuzzy_max_expansions"):
+        value = options.get(option)
+        if value is not None and value > budget.max_expansions:
+            update[option] = budget.max_expansions
+
+    states = options.get("max_determined_states")
+    if states is not None and states > budget.max_determined_states:
+        update["max_determined_states"] = budget.max_determined_states
+
+    kind = _kind(node)
+    if kind in ("query_string", "simple_query_string") and "allow_leading_wildcard" in type(node).model_fields:
+        if _LEADING_WILDCARD.search(node.query) and node.allow_leading_wildcard is not False:
+            update["allow_leading_wildcard"] = False
+
+    fuzziness = options.get("fuzziness")
+    if (fuzziness is not None and fuzziness != 0) or (
+        kind == "query_string" and _FUZZY.search(node.query)
+    ):
+        for option in ("prefix_length", "fuzzy_prefix_length"):
+            if option in type(node).model_fields and (options.get(option) or 0) < budget.min_prefix_length:
+                update[option] = budget.min_prefix_length
+
+    size = options.get("size")
+    if size is not None and size > budget.max_size:
+        update["size"] = budget.max_size
+    if _is_bucket_aggregation(node, kind):
+        buckets = _buckets(node, kind)
+        if buckets is not None and buckets > budget.max_size:
+            update[_BUCKET_OPTIONS[kind]] = budget.max_size
+    return update
+
+
+def _kind(node: Searchable) -> str:
+    # Whole requests, e.g. SearchRequest, have no kind
+    return getattr(type(node), "kind", None) or type(node).__name__
+
+
+def _is_bucket_aggregation(node: Searchable, kind: str) -> bool:
+    # Kinds of queries and aggregations overlap, e.g. terms
+    return kind in BUCKET_AGGREGATIONS and isinstance(node, BaseAggregation)
+
+
+def _buckets(node: Searchable, kind: str) -> Optional[int]:
+    return node.__dict__.get(_BUCKET_OPTIONS[kind])
+
+
+def _join(path: str, name: str) -> str:
+    return f"{path}.{name}" if path else name
+
+
+_default_budget: Optional[Budget] = None
+
+
+def configure_budget(budget: Optional[Budget]) -> None:
+    """Set budget enforced on searches that don't pass ``budget`` explicitly.
+
+    Pass None to stop enforcing a default budget.
+    """
+    global _default_budget
+    _default_budget = budget
+
+
+def resolve_budget(budget: Union[Budget, bool, None]) -> Optional[Budget]:
+    """Return budget to enforce given the ``budget`` argument of a search.
+
+    None means the default budget, False disables enforcement.
+    """
+    if budget is None or budget is True:
+        return _default_budget
+    if budget is False:
+        return None
+    return budget
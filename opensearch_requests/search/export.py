@@ -0,0 +1,193 @@
+import argparse
+import json
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from pydantic import Field
+
+from .queries import BaseQuery, MatchAllQuery
+
+
+logger = logging.getLogger("opensearch_requests")
+
+
+def export(
+    query: BaseQuery,
+    index: str,
+    client_factory: Callable[[], Any],
+    output: str,
+    slices: int = 4,
+    page_size: int = 1000,
+    keep_alive: str = "5m",
+    tiebreaker: str = "_id",
+    processes: bool = False,
+) -> int:
+    """Export all documents matching the query to NDJSON files.
+
+    Opens a point in time (PIT) on the index and splits it into ``slices``
+    independent slices. Each slice is drained concurrently by its own
+    worker with ``search_after`` pagination, sorted by ``tiebreaker``
+    field, and written to ``part-NNNNN.ndjson`` in the ``output``
+    directory. One line per hit is written, containing its ``_index``,
+    ``_id`` and ``_source``.
+
+    Workers create their own clients with ``client_factory``. With
+    ``processes=True`` slices are drained in separate processes, so
+    the factory must be picklable, for example
+    ``functools.partial(OpenSearch, hosts=["https://localhost:9200"])``.
+
+    Returns the total number of exported documents.
+    """
+    if slices < 1:
+        raise ValueError("Number of slices must be a positive integer")
+
+    os.makedirs(output, exist_ok=True)
+    client = client_factory()
+    pit_id = client.create_pit(
+        index=index,
+        params={"keep_alive": keep_alive},
+    )["pit_id"]
+
+    pool: Executor
+    if processes:
+        pool = ProcessPoolExecutor(max_workers=slices)
+    else:
+        pool = ThreadPoolExecutor(max_workers=slices)
+
+    try:
+        with pool:
+            futures = [
+                pool.submit(
+                    _export_slice,
+                    client_factory=client_factory,
+                    query=query.bare(),
+                    pit_id=pit_id,
+                    slice_id=slice_id,
+                    slices=slices,
+                    page_size=page_size,
+                    keep_alive=keep_alive,
+                    tiebreaker=tiebreaker,
+                    path=os.path.join(output, f"part-{slice_id:05d}.ndjson"),
+                )
+                for slice_id in range(slices)
+            ]
+            total = sum(f.result() for f in futures)
+    finally:
+        client.delete_pit(body={"pit_id": [pit_id]})
+
+    logger.info("Exported %d documents from %s to %s", total, index, output)
+    return total
+
+
+def _export_slice(
+    client_factory: Callable[[], Any],
+    query: dict[str, Any],
+    pit_id: str,
+    slice_id: int,
+    slices: int,
+    page_size: int,
+    keep_alive: str,
+    tiebreaker: str,
+    path: str,
+) -> int:
+    client = client_factory()
+    body: dict[str, Any] = {
+        "query": query,
+        "size": page_size,
+        "pit": {"id": pit_id, "keep_alive": keep_alive},
+        "sort": [{tiebreaker: "asc"}],
+    }
+    # Slicing requires at least two slices
+    if slices > 1:
+        body["slice"] = {"id": slice_id, "max": slices}
+
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while True:
+            response = client.search(body=body)
+            hits = response["hits"]["hits"]
+            if not hits:
+                break
+
+            for hit in hits:
+                line = {
+                    "_index": hit.get("_index"),
+                    "_id": hit.get("_id"),
+                    "_source": hit.get("_source"),
+                }
+                f.write(json.dumps(line, separators=(",", ":")))
+                f.write("\n")
+            count += len(hits)
+
+            body["search_after"] = hits[-1]["sort"]
+            body["pit"]["id"] = response.get("pit_id", pit_id)
+
+    logger.info("Exported %d documents from slice %d of %d", count, slice_id, slices)
+    return count
+
+
+class _RawQuery(BaseQuery):
+    """Query given as already serialized query DSL."""
+    raw: dict[str, Any] = Field(...)
+
+    def bare(self) -> dict[str, Any]:
+        return self.raw
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Console entry point: ``opensearch-requests-export``."""
+    from opensearchpy import OpenSearch
+
+    parser = argparse.ArgumentParser(
+        prog="opensearch-requests-export",
+        description="Export documents from an OpenSearch index to NDJSON files "
+        "using sliced point in time search.",
+    )
+    parser.add_argument("index", help="Index name or pattern to export.")
+    parser.add_argument("output", help="Directory for NDJSON part files.")
+    parser.add_argument(
+        "--host", action="append", dest="hosts",
+        help="Cluster URL, can be repeated. Defaults to http://localhost:9200.",
+    )
+    parser.add_argument(
+        "--query", default=None,
+        help='Query DSL as JSON, e.g. \'{"term": {"tenant": "acme"}}\'. '
+        "Defaults to match_all.",
+    )
+    parser.add_argument("--slices", type=int, default=4)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--keep-alive", default="5m")
+    parser.add_argument("--tiebreaker", default="_id")
+    parser.add_argument(
+        "--processes", action="store_true",
+        help="Drain slices in separate processes instead of threads.",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    query: BaseQuery = MatchAllQuery()
+    if args.query:
+        query = _RawQuery(raw=json.loads(args.query))
+
+    total = export(
+        query,
+        index=args.index,
+        client_factory=partial(
+            OpenSearch, hosts=args.hosts or ["http://localhost:9200"]
+        ),
+        output=args.output,
+        slices=args.slices,
+        page_size=args.page_size,
+        keep_alive=args.keep_alive,
+        tiebreaker=args.tiebreaker,
+        processes=args.processes,
+    )
+    print(total)
+
+
+if __name__ == "__main__":
+    main()
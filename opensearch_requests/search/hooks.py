@@ -0,0 +1,218 @@
+import bisect
+import logging
+import math
+import threading
+import time
+from typing import Callable, Optional
+
+
+logger = logging.getLogger("opensearch_requests")
+
+
+class SearchStats:
+    """Timings and sizes of a single search request.
+
+    Durations are in seconds, measured on the client, except ``took``
+    which is the time in milliseconds reported by OpenSearch.
+    """
+    __slots__ = (
+        "request_type",
+        "index",
+        "serialize",
+        "request",
+        "parse",
+        "took",
+        "body_bytes",
+        "response_bytes",
+        "hits",
+        "total_hits",
+        "_mark",
+    )
+
+    def __init__(self, request_type: str, index: str):
+        self.request_type = request_type
+        """Class name of the query or aggregation searched with, or ``MultiSearch``."""
+        self.index = index
+        """Index or comma separated indices searched."""
+        self.serialize = 0.0
+        """Time spent building the request body."""
+        self.request = 0.0
+        """Time spent waiting for the response, including transport."""
+        self.parse = 0.0
+        """Time spent validating the response into a ``Result``."""
+        self.took: Optional[int] = None
+        """Server side time in milliseconds from ``took`` of the response."""
+        self.body_bytes: Optional[int] = None
+        """Size of compact JSON request body."""
+        self.response_bytes: Optional[int] = None
+        """Size of response body. Only known for ``raw=True`` searches."""
+        self.hits: Optional[int] = None
+        """Number of hits returned."""
+        self.total_hits: Optional[int] = None
+        """Total number of matching documents reported by OpenSearch."""
+        self._mark = time.perf_counter()
+
+    def lap(self) -> float:
+        """Return seconds elapsed since the previous lap or creation."""
+        now = time.perf_counter()
+        elapsed, self._mark = now - self._mark, now
+        return elapsed
+
+    @property
+    def total(self) -> float:
+        """Time spent in the client call from start to parsed result."""
+        return self.serialize + self.request + self.parse
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__[:-1]
+        )
+        return f"SearchStats({fields})"
+
+
+SearchHook = Callable[[SearchStats], None]
+
+_hooks: list[SearchHook] = []
+"""Registered hooks. Searches skip all instrumentation while it is empty."""
+
+
+def register_hook(hook: SearchHook) -> SearchHook:
+    """Call ``hook`` with ``SearchStats`` after every search request.
+
+    Hooks are called synchronously in the searching thread, after the
+    response is parsed, so they should be fast. Exceptions raised by
+    hooks are logged and ignored. Searches served from a result cache or
+    by a coalesced request of another caller don't report stats.
+
+    A ``MultiSearch`` reports one ``SearchStats`` for the whole batch,
+    with hits and total hits summed over its searches. Searches rendered
+    on the server by ``PreparedQuery.search_template()`` report no stats.
+
+    Returns the hook, so it can be used as a decorator.
+    """
+    if hook not in _hooks:
+        _hooks.append(hook)
+    return hook
+
+
+def unregister_hook(hook: SearchHook) -> None:
+    """Stop calling a hook registered with ``register_hook()``."""
+    try:
+        _hooks.remove(hook)
+    except ValueError:
+        pass
+
+
+def emit(stats: SearchStats) -> None:
+    """Pass stats of a finished search to all registered hooks."""
+    for hook in tuple(_hooks):
+        try:
+            hook(stats)
+        except Exception:
+            logger.exception("Search hook %r failed", hook)
+
+
+class Histogram:
+    """Histogram of durations with logarithmic buckets.
+
+    Bucket boundaries grow by ``factor`` from ``start`` seconds, so memory
+    is constant and percentiles are accurate within one bucket width.
+    """
+    def __init__(
+        self, start: float = 0.0001, factor: float = 1.5, buckets: int = 40
+    ):
+        self.bounds = [start * factor ** i for i in range(buckets)]
+        self.counts = [0] * (buckets + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Return upper bound of the bucket holding ``q`` percentile."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.bounds[i], self.max) if i < len(self.bounds) else self.max
+        return self.max
+
+
+class TimingCollector:
+    """Hook aggregating per-phase timings of all searches into histograms.
+
+    Phases are ``serialize``, ``request``, ``parse``, ``took`` (server
+    time, converted to seconds) and ``total``.
+
+    Example:
+
+        timings = register_hook(TimingCollector())
+        ...
+        print(timings.summary()["request"]["p95"])
+
+    """
+    PHASES = ("serialize", "request", "took", "parse", "total")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __call__(self, stats: SearchStats) -> None:
+        values = {
+            "serialize": stats.serialize,
+            "request": stats.request,
+            "parse": stats.parse,
+            "total": stats.total,
+        }
+        if stats.took is not None:
+            values["took"] = stats.took / 1000
+        with self._lock:
+            for phase, value in values.items():
+                self.histograms[phase].add(value)
+            self.body_bytes += stats.body_bytes or 0
+            self.response_bytes += stats.response_bytes or 0
+            self.hits += stats.hits or 0
+
+    def reset(self) -> None:
+        """Forget all collected timings."""
+        with self._lock:
+            self.histograms = {phase: Histogram() for phase in self.PHASES}
+            self.body_bytes = 0
+            """Total size of request bodies sent."""
+            self.response_bytes = 0
+            """Total size of raw responses received."""
+            self.hits = 0
+            """Total number of hits returned."""
+
+    @property
+    def count(self) -> int:
+        """Number of searches collected."""
+        return self.histograms["total"].count
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return count, mean, p50, p95, p99 and max in seconds per phase."""
+        with self._lock:
+            return {
+                phase: {
+                    "count": h.count,
+                    "mean": h.mean,
+                    "p50": h.percentile(50),
+                    "p95": h.percentile(95),
+                    "p99": h.percentile(99),
+                    "max": h.max,
+                }
+                for phase, h in self.histograms.items()
+            }
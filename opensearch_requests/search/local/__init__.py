@@ -0,0 +1,15 @@
+from typing import TYPE_CHECKING
+
+from ..._imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .client import *
+    from .executor import *
+    from .index import *
+
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    ".client": ["LocalClient"],
+    ".executor": ["Executor", "Matches", "compare_sort", "sort_fields", "BM25_K1", "BM25_B"],
+    ".index": ["LocalIndex", "analyze", "flatten", "term_keys"],
+})
@@ -0,0 +1,192 @@
+import fnmatch
+import functools
+import json
+import time
+from typing import Any, Iterable, Optional, Union
+
+from .executor import Executor, Matches, compare_sort, sort_fields
+from .index import LocalIndex
+
+
+class LocalClient:
+    """In-process stand-in for an OpenSearch client.
+
+    Implements ``index()``, ``search()`` and ``msearch()`` with the same
+    signatures as opensearch-py, so queries and aggregations can be
+    searched with it like with a real cluster. Documents are kept in
+    ``LocalIndex`` inverted indices, so queries are evaluated with set
+    operations on postings rather than by scanning documents.
+
+    See ``Executor`` for the supported subset of the query DSL. Scores of
+    ``match`` queries use BM25 like OpenSearch, but with index wide
+    statistics, so they don't exactly match scores of a cluster.
+
+    Example:
+
+        client = LocalClient()
+        client.add_documents("movies", [{"title": "Gone with the Wind"}])
+        result = MatchQuery(field="title", query="wind").search("movies", client)
+
+    """
+    def __init__(self):
+        self.indices: dict[str, LocalIndex] = {}
+
+    def index(
+        self,
+        index: str,
+        body: dict[str, Any],
+        id: Optional[str] = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Index a single document, replacing a document with the same id."""
+        target = self._index(index)
+        created = id is None or id not in target.numbers
+        id = target.add(body, id)
+        return {
+            "_index": index,
+            "_id": id,
+            "result": "created" if created else "updated",
+        }
+
+    def add_documents(
+        self,
+        index: str,
+        documents: Iterable[Union[dict[str, Any], tuple[str, dict[str, Any]]]],
+    ) -> int:
+        """Index many documents, given as sources or ``(id, source)`` pairs.
+
+        Returns number of documents indexed.
+        """
+        target = self._index(index)
+        count = 0
+        for document in documents:
+            if isinstance(document, tuple):
+                target.add(document[1], document[0])
+            else:
+                target.add(document)
+            count += 1
+        return count
+
+    def delete(self, index: str, id: str, **kwargs: Any) -> dict[str, Any]:
+        """Remove a document."""
+        target = self.indices.get(index)
+        found = target is not None and target.delete(id)
+        return {"_index": index, "_id": id, "result": "deleted" if found else "not_found"}
+
+    def search(
+        self,
+        index: Optional[str] = None,
+        body: Union[dict[str, Any], str, bytes, None] = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Execute search request body and return response dict.
+
+        The body is a dict or serialized JSON, as with opensearch-py.
+        Hits of several indices are ranked and paged together, but
+        aggregations are only supported on a single index.
+        """
+        started = time.perf_counter()
+        if isinstance(body, (str, bytes)):
+            body = json.loads(body)
+        body = body or {}
+        targets = self._resolve(index)
+        aggs = body.get("aggs") or body.get("aggregations")
+        if aggs and len(targets) > 1:
+            raise NotImplementedError(
+                "Aggregations over several indices are not supported by the local backend"
+            )
+
+        size = body.get("size", 10)
+        offset = body.get("from", 0)
+        sort = body.get("sort")
+        fields = sort_fields(sort) if sort else None
+        total = 0
+        aggregations: dict[str, Any] = {}
+        # Every index contributes its best hits up to the end of the page,
+        # so the page of the merged ranking is complete
+        candidates: list[tuple[int, int, LocalIndex, Matches, Optional[list[Any]]]] = []
+        for position, target in enumerate(targets):
+            executor = Executor(target)
+            matches = executor.query(body.get("query"))
+            total += len(matches.docs)
+            for number in executor.top(matches, offset + size, 0, sort, body.get("search_after")):
+                values = executor.sort_values(matches, number, fields) if fields else None
+                candidates.append((position, number, target, matches, values))
+            if aggs:
+                aggregations = executor.aggregate(aggs, matches.docs)
+
+        if fields:
+            candidates.sort(key=functools.cmp_to_key(
+                lambda a, b: compare_sort(a[4], b[4], fields) or (a[0] - b[0]) or (a[1] - b[1])
+            ))
+        else:
+            candidates.sort(key=lambda c: (-c[3].score(c[1]), c[0], c[1]))
+
+        hits: list[dict[str, Any]] = []
+        max_score: Optional[float] = None
+        for _, number, target, matches, values in candidates[offset:offset + size]:
+            score = matches.score(number)
+            hit = {
+                "_index": target.name,
+                "_id": target.ids[number],
+                "_score": score,
+                "_source": target.sources[number],
+            }
+            if values is not None:
+                hit["sort"] = values
+            hits.append(hit)
+            max_score = score if max_score is None else max(max_score, score)
+
+        response: dict[str, Any] = {
+            "took": int((time.perf_counter() - started) * 1000),
+            "timed_out": False,
+            "_shards": {
+                "total": len(targets),
+                "successful": len(targets),
+                "skipped": 0,
+                "failed": 0,
+            },
+            "hits": {
+                "total": {"value": total, "relation": "eq"},
+                "max_score": max_score,
+                "hits": hits,
+            },
+        }
+        if aggregations:
+            response["aggregations"] = aggregations
+        return response
+
+    def msearch(
+        self, body: Union[str, bytes, list[Any]], index: Optional[str] = None, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Execute NDJSON multi-search body, see ``MultiSearch``."""
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        lines = body if isinstance(body, list) else [
+            json.loads(line) for line in body.splitlines() if line.strip()
+        ]
+        responses = []
+        for header, search in zip(lines[::2], lines[1::2]):
+            try:
+                response = self.search(index=header.get("index", index), body=search)
+                response["status"] = 200
+            except (KeyError, ValueError, NotImplementedError) as e:
+                response = {"status": 400, "error": {"type": type(e).__name__, "reason": str(e)}}
+            responses.append(response)
+        return {"took": 0, "responses": responses}
+
+    def _index(self, name: str) -> LocalIndex:
+        target = self.indices.get(name)
+        if target is None:
+            target = self.indices[name] = LocalIndex(name)
+        return target
+
+    def _resolve(self, index: Optional[str]) -> list[LocalIndex]:
+        patterns = (index or "_all").split(",")
+        targets = []
+        for name, target in self.indices.items():
+            if any(p in ("_all", "*") or fnmatch.fnmatchcase(name, p) for p in patterns):
+                targets.append(target)
+        if not targets and not any("*" in p or p == "_all" for p in patterns):
+            raise KeyError(f"no such index [{index}]")
+        return targets
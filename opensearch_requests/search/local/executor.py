@@ -0,0 +1,391 @@
+import functools
+import heapq
+import math
+from collections import Counter
+from typing import Any, Callable, Iterable, Optional
+
+from .index import LocalIndex, analyze, term_keys
+
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+class Matches:
+    """Documents matched by a query with their scores.
+
+    ``scores`` is None when every matching document has the same
+    ``constant`` score, which avoids a dict entry per document for
+    filters and ``match_all``.
+    """
+    __slots__ = ("docs", "scores", "constant")
+
+    def __init__(
+        self,
+        docs: set[int],
+        scores: Optional[dict[int, float]] = None,
+        constant: float = 1.0,
+    ):
+        self.docs = docs
+        self.scores = scores
+        self.constant = constant
+
+    def score(self, number: int) -> float:
+        if self.scores is None:
+            return self.constant
+        return self.scores.get(number, 0.0)
+
+
+class Executor:
+    """Evaluates query and aggregation bodies against a local index.
+
+    Supported queries are ``match_all``, ``term``, ``terms``, ``match``
+    and ``bool``. Supported aggregations are ``terms``, ``filter`` and
+    the ``sum``, ``min``, ``max``, ``avg``, ``value_count``,
+    ``cardinality``, ``stats`` and ``extended_stats`` metrics, with
+    nested aggregations under bucket aggregations.
+    """
+    def __init__(self, index: LocalIndex):
+        self.index = index
+        self._queries: dict[str, Callable[[Any], Matches]] = {
+            "match_all": self._match_all,
+            "term": self._term,
+            "terms": self._terms,
+            "match": self._match,
+            "bool": self._bool,
+        }
+
+    def query(self, query: Optional[dict[str, Any]]) -> Matches:
+        """Return documents matching query DSL dict, all when None."""
+        if not query:
+            return self._match_all({})
+        (kind, params), = query.items()
+        evaluate = self._queries.get(kind)
+        if evaluate is None:
+            raise NotImplementedError(f"Query {kind!r} is not supported by the local backend")
+        return evaluate(params)
+
+    def top(
+        self,
+        matches: Matches,
+        size: int,
+        offset: int = 0,
+        sort: Optional[list[Any]] = None,
+        search_after: Optional[list[Any]] = None,
+    ) -> list[int]:
+        """Return numbers of documents on the requested page.
+
+        With ``search_after``, only documents sorted after those sort
+        values are considered, see ``sort_values()``.
+        """
+        count = offset + size
+        if count <= 0:
+            return []
+        if not sort:
+            if search_after is not None:
+                raise ValueError("search_after requires sort")
+            if matches.scores is None:
+                ranked = heapq.nsmallest(count, matches.docs)
+            else:
+                ranked = heapq.nsmallest(
+                    count, matches.docs, key=lambda n: (-matches.score(n), n)
+                )
+            return ranked[offset:]
+
+        fields = sort_fields(sort)
+        keyed = [(self.sort_values(matches, n, fields), n) for n in matches.docs]
+        if search_after is not None:
+            keyed = [item for item in keyed if compare_sort(item[0], search_after, fields) > 0]
+        ranked = heapq.nsmallest(count, keyed, key=functools.cmp_to_key(
+            lambda a, b: compare_sort(a[0], b[0], fields) or a[1] - b[1]
+        ))
+        return [n for _, n in ranked[offset:]]
+
+    def sort_values(
+        self, matches: Matches, number: int, fields: list[tuple[str, bool]]
+    ) -> list[Any]:
+        """Return ``sort`` values of a hit given ``sort_fields()`` of a request.
+
+        A field with many values sorts by the smallest one in ascending
+        order and by the largest in descending order. Missing values are
+        None and sort last in both orders.
+        """
+        values = []
+        for field, descending in fields:
+            if field == "_score":
+                values.append(matches.score(number))
+            elif field == "_doc":
+                values.append(number)
+            elif field == "_id":
+                values.append(self.index.ids[number])
+            else:
+                found = self.index.values(field, number)
+                values.append((max(found) if descending else min(found)) if found else None)
+        return values
+
+    def aggregate(
+        self, aggs: dict[str, Any], docs: set[int]
+    ) -> dict[str, Any]:
+        """Return response of aggregations over given documents."""
+        return {name: self._aggregation(body, docs) for name, body in aggs.items()}
+
+    def _match_all(self, params: dict[str, Any]) -> Matches:
+        return Matches(set(self.index.live), constant=params.get("boost", 1.0))
+
+    def _term(self, params: dict[str, Any]) -> Matches:
+        (field, value), = params.items()
+        boost = 1.0
+        if isinstance(value, dict):
+            boost = value.get("boost", 1.0)
+            value = value["value"]
+        return Matches(self._exact(field, [value]), constant=boost)
+
+    def _terms(self, params: dict[str, Any]) -> Matches:
+        params = dict(params)
+        boost = params.pop("boost", 1.0)
+        (field, values), = params.items()
+        return Matches(self._exact(field, values), constant=boost)
+
+    def _exact(self, field: str, values: Iterable[Any]) -> set[int]:
+        docs: set[int] = set()
+        text = self.index.text.get(field)
+        exact = self.index.exact.get(field)
+        for value in values:
+            if text is not None and isinstance(value, str):
+                docs.update(text.get(value, ()))
+            if exact is not None:
+                for key in term_keys(value):
+                    docs.update(exact.get(key, ()))
+        return docs
+
+    def _match(self, params: dict[str, Any]) -> Matches:
+        (field, options), = params.items()
+        if not isinstance(options, dict):
+            options = {"query": options}
+        boost = options.get("boost", 1.0)
+        postings = self.index.text.get(field)
+        if postings is None:
+            # Not a text field, the value is matched exactly
+            return Matches(self._exact(field, [options["query"]]), constant=boost)
+
+        tokens = list(dict.fromkeys(analyze(str(options["query"]))))
+        if not tokens:
+            if options.get("zero_terms_query") == "all":
+                return self._match_all({"boost": boost})
+            return Matches(set())
+
+        frequencies = [postings.get(token, {}) for token in tokens]
+        required = len(tokens) if options.get("operator", "or").lower() == "and" else 1
+        if options.get("minimum_should_match") is not None:
+            required = max(required, _minimum(options["minimum_should_match"], len(tokens)))
+
+        if required <= 1:
+            docs = set().union(*frequencies)
+        elif required >= len(tokens):
+            docs = set(frequencies[0]).intersection(*frequencies[1:])
+        else:
+            counts = Counter(n for f in frequencies for n in f)
+            docs = {n for n, count in counts.items() if count >= required}
+
+        lengths = self.index.lengths.get(field, {})
+        average = sum(lengths.values()) / len(lengths) if lengths else 1.0
+        total = len(lengths)
+        scores = dict.fromkeys(docs, 0.0)
+        for f in frequencies:
+            if not f:
+                continue
+            idf = math.log(1 + (total - len(f) + 0.5) / (len(f) + 0.5))
+            for number, tf in f.items():
+                if number in scores:
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths.get(number, 0) / average)
+                    scores[number] += boost * idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return Matches(docs, scores)
+
+    def _bool(self, params: dict[str, Any]) -> Matches:
+        must = [self.query(q) for q in _clauses(params.get("must"))]
+        should = [self.query(q) for q in _clauses(params.get("should"))]
+        must_not = [self.query(q) for q in _clauses(params.get("must_not"))]
+        filter = [self.query(q) for q in _clauses(params.get("filter"))]
+
+        required = must + filter
+        if required:
+            docs = set.intersection(*(m.docs for m in sorted(required, key=lambda m: len(m.docs))))
+        else:
+            docs = set(self.index.live)
+
+        default_minimum = 0 if required else 1
+        minimum = _minimum(params.get("minimum_should_match", default_minimum), len(should))
+        if should and minimum == 1:
+            docs &= set().union(*(m.docs for m in should))
+        elif should and minimum > 1:
+            counts = Counter(n for m in should for n in m.docs)
+            docs = {n for n in docs if counts[n] >= minimum}
+
+        for m in must_not:
+            docs -= m.docs
+
+        boost = params.get("boost", 1.0)
+        scoring = must + should
+        if not scoring:
+            return Matches(docs, constant=0.0)
+        if len(scoring) == 1 and scoring[0].scores is None and not should:
+            return Matches(docs, constant=boost * scoring[0].constant)
+
+        scores = dict.fromkeys(docs, 0.0)
+        for m in must:
+            for number in docs:
+                scores[number] += m.score(number)
+        for m in should:
+            for number in docs & m.docs:
+                scores[number] += m.score(number)
+        if boost != 1.0:
+            scores = {n: s * boost for n, s in scores.items()}
+        return Matches(docs, scores)
+
+    def _aggregation(self, body: dict[str, Any], docs: set[int]) -> dict[str, Any]:
+        nested = body.get("aggs") or body.get("aggregations") or {}
+        kinds = [k for k in body if k not in ("aggs", "aggregations", "meta")]
+        if len(kinds) != 1:
+            raise NotImplementedError(f"Aggregation {kinds!r} is not supported by the local backend")
+        kind = kinds[0]
+        params = body[kind]
+
+        if kind == "filter":
+            matched = docs & self.query(params).docs
+            return {"doc_count": len(matched), **self.aggregate(nested, matched)}
+        if kind == "terms":
+            return self._terms_aggregation(params, nested, docs)
+
+        metric = _METRICS.get(kind)
+        if metric is None:
+            raise NotImplementedError(f"Aggregation {kind!r} is not supported by the local backend")
+        field = params["field"]
+        values = [v for n in docs for v in self.index.values(field, n)]
+        return metric(values)
+
+    def _terms_aggregation(
+        self, params: dict[str, Any], nested: dict[str, Any], docs: set[int]
+    ) -> dict[str, Any]:
+        field = params["field"]
+        size = params.get("size", 10)
+        min_doc_count = params.get("min_doc_count", 1)
+
+        members: dict[Any, set[int]] = {}
+        for number in docs:
+            for value in set(self.index.values(field, number)):
+                bucket = members.get(value)
+                if bucket is None:
+                    bucket = members[value] = set()
+                bucket.add(number)
+
+        ranked = sorted(
+            (item for item in members.items() if len(item[1]) >= min_doc_count),
+            key=lambda item: (-len(item[1]), _key_order(item[0])),
+        )
+        buckets = []
+        for key, numbers in ranked[:size]:
+            bucket: dict[str, Any] = {"key": key, "doc_count": len(numbers)}
+            if isinstance(key, bool):
+                bucket["key"] = int(key)
+                bucket["key_as_string"] = "true" if key else "false"
+            bucket.update(self.aggregate(nested, numbers))
+            buckets.append(bucket)
+        return {
+            "doc_count_error_upper_bound": 0,
+            "sum_other_doc_count": sum(len(numbers) for _, numbers in ranked[size:]),
+            "buckets": buckets,
+        }
+
+
+def _clauses(value: Any) -> list[dict[str, Any]]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _minimum(value: Any, count: int) -> int:
+    """Resolve ``minimum_should_match`` given as a number or a percentage."""
+    if isinstance(value, str):
+        if value.endswith("%"):
+            percent = int(value[:-1])
+            required = int(count * abs(percent) / 100)
+            return required if percent >= 0 else count - required
+        value = int(value)
+    return value if value >= 0 else count + value
+
+
+def sort_fields(sort: list[Any]) -> list[tuple[str, bool]]:
+    """Return ``(field, descending)`` pairs of a request ``sort``."""
+    fields = []
+    for item in sort if isinstance(sort, list) else [sort]:
+        if isinstance(item, str):
+            fields.append((item, item == "_score"))
+            continue
+        (field, order), = item.items()
+        if isinstance(order, dict):
+            order = order.get("order", "desc" if field == "_score" else "asc")
+        fields.append((field, order == "desc"))
+    return fields
+
+
+def compare_sort(a: list[Any], b: list[Any], fields: list[tuple[str, bool]]) -> int:
+    """Compare sort values of two hits, negative if ``a`` goes first."""
+    for x, y, (_, descending) in zip(a, b, fields):
+        if x == y:
+            continue
+        # Documents missing the field go last in both orders
+        if x is None:
+            return 1
+        if y is None:
+            return -1
+        order = -1 if x < y else 1
+        return -order if descending else order
+    return 0
+
+
+def _key_order(key: Any) -> tuple[int, Any]:
+    # Buckets with equal counts are ordered by key, numbers before strings
+    return (0, key) if isinstance(key, (int, float)) else (1, str(key))
+
+
+def _stats(values: list[Any]) -> dict[str, Any]:
+    numbers = [float(v) for v in values]
+    count = len(numbers)
+    total = sum(numbers)
+    return {
+        "count": count,
+        "min": min(numbers) if numbers else None,
+        "max": max(numbers) if numbers else None,
+        "avg": total / count if count else None,
+        "sum": total,
+    }
+
+
+def _extended_stats(values: list[Any]) -> dict[str, Any]:
+    stats = _stats(values)
+    count = stats["count"]
+    squares = sum(float(v) ** 2 for v in values)
+    variance = squares / count - stats["avg"] ** 2 if count else None
+    deviation = math.sqrt(max(variance, 0.0)) if variance is not None else None
+    return {
+        **stats,
+        "sum_of_squares": squares,
+        "variance": variance,
+        "std_deviation": deviation,
+        "std_deviation_bounds": {
+            "upper": stats["avg"] + 2 * deviation if count else None,
+            "lower": stats["avg"] - 2 * deviation if count else None,
+        },
+    }
+
+
+_METRICS: dict[str, Callable[[list[Any]], dict[str, Any]]] = {
+    "sum": lambda values: {"value": float(sum(values))},
+    "min": lambda values: {"value": float(min(values)) if values else None},
+    "max": lambda values: {"value": float(max(values)) if values else None},
+    "avg": lambda values: {"value": sum(values) / len(values) if values else None},
+    "value_count": lambda values: {"value": len(values)},
+    "cardinality": lambda values: {"value": len(set(values))},
+    "stats": _stats,
+    "extended_stats": _extended_stats,
+}
@@ -0,0 +1,161 @@
+import math
+import re
+from typing import Any, Iterator, Optional
+
+
+_TOKEN = re.compile(r"\w+")
+
+
+def analyze(text: str) -> list[str]:
+    """Split text into lowercase word tokens, like the standard analyzer."""
+    return _TOKEN.findall(text.lower())
+
+
+def term_keys(value: Any) -> tuple[Any, ...]:
+    """Return keys an exact value is indexed under or looked up by.
+
+    Values are coerced the way OpenSearch coerces them for numeric and
+    boolean fields, so ``"42"`` finds ``42`` and ``"true"`` finds ``True``.
+    """
+    if isinstance(value, bool):
+        return ("true" if value else "false",)
+    if isinstance(value, (int, float)):
+        return (float(value),)
+    if isinstance(value, str):
+        try:
+            number = float(value)
+        except ValueError:
+            return (value,)
+        return (value, number) if math.isfinite(number) else (value,)
+    return (value,)
+
+
+def flatten(document: dict[str, Any], prefix: str = "") -> Iterator[tuple[str, list[Any]]]:
+    """Yield dotted field paths of a document with lists of their values."""
+    for key, value in document.items():
+        path = f"{prefix}{key}"
+        values = value if isinstance(value, list) else [value]
+        objects = [v for v in values if isinstance(v, dict)]
+        for obj in objects:
+            yield from flatten(obj, f"{path}.")
+        scalars = [v for v in values if v is not None and not isinstance(v, dict)]
+        if scalars:
+            yield path, scalars
+
+
+class LocalIndex:
+    """In-memory inverted index with columnar doc values.
+
+    Every document gets a sequential integer number. String fields are
+    analyzed into ``text`` postings, mapping each token to term
+    frequencies per document, and their exact values are indexed into
+    ``exact`` postings of the ``<field>.keyword`` subfield. Other values
+    go to ``exact`` postings of the field itself. Original values of every
+    field are also kept in ``columns``, one list slot per document number,
+    for aggregations and sorting.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self.ids: list[Optional[str]] = []
+        """Document ``_id`` by document number, None for deleted documents."""
+        self.sources: list[Optional[dict[str, Any]]] = []
+        """Document ``_source`` by document number."""
+        self.numbers: dict[str, int] = {}
+        """Document number by ``_id``."""
+        self.live: set[int] = set()
+        """Numbers of documents that are not deleted."""
+        self.text: dict[str, dict[str, dict[int, int]]] = {}
+        """Field -> token -> document number -> term frequency."""
+        self.lengths: dict[str, dict[int, int]] = {}
+        """Field -> document number -> number of tokens."""
+        self.exact: dict[str, dict[Any, set[int]]] = {}
+        """Field -> exact value key -> document numbers."""
+        self.columns: dict[str, list[Optional[list[Any]]]] = {}
+        """Field -> values by document number, None when missing."""
+
+    def __len__(self) -> int:
+        return len(self.live)
+
+    def add(self, source: dict[str, Any], id: Optional[str] = None) -> str:
+        """Index document, replacing a document with the same ``id``."""
+        if id is None:
+            id = str(len(self.ids))
+        if id in self.numbers:
+            self.delete(id)
+
+        number = len(self.ids)
+        self.ids.append(id)
+        self.sources.append(source)
+        self.numbers[id] = number
+        self.live.add(number)
+
+        for field, values in flatten(source):
+            column = self.columns.get(field)
+            if column is None:
+                column = self.columns[field] = []
+            column.extend([None] * (number + 1 - len(column)))
+            column[number] = values
+
+            for value in values:
+                if isinstance(value, str):
+                    self._add_text(field, number, value)
+                    self._add_exact(f"{field}.keyword", number, value)
+                else:
+                    self._add_exact(field, number, value)
+        return id
+
+    def delete(self, id: str) -> bool:
+        """Remove document with given ``id``. Return whether it existed."""
+        number = self.numbers.pop(id, None)
+        if number is None:
+            return False
+        for field, values in flatten(self.sources[number]):
+            self.columns[field][number] = None
+            for value in values:
+                if isinstance(value, str):
+                    postings = self.text[field]
+                    for token in analyze(value):
+                        frequencies = postings.get(token)
+                        if frequencies is not None:
+                            frequencies.pop(number, None)
+                    self.lengths[field].pop(number, None)
+                    self._remove_exact(f"{field}.keyword", number, value)
+                else:
+                    self._remove_exact(field, number, value)
+        self.ids[number] = None
+        self.sources[number] = None
+        self.live.discard(number)
+        return True
+
+    def values(self, field: str, number: int) -> list[Any]:
+        """Return values of the field in the document, empty if missing."""
+        column = self.columns.get(field)
+        if column is None and field.endswith(".keyword"):
+            column = self.columns.get(field[:-len(".keyword")])
+        if column is None or number >= len(column):
+            return []
+        return column[number] or []
+
+    def _add_text(self, field: str, number: int, value: str) -> None:
+        tokens = analyze(value)
+        postings = self.text.setdefault(field, {})
+        for token in tokens:
+            frequencies = postings.get(token)
+            if frequencies is None:
+                frequencies = postings[token] = {}
+            frequencies[number] = frequencies.get(number, 0) + 1
+        lengths = self.lengths.setdefault(field, {})
+        lengths[number] = lengths.get(number, 0) + len(tokens)
+
+    def _add_exact(self, field: str, number: int, value: Any) -> None:
+        postings = self.exact.setdefault(field, {})
+        for key in term_keys(value)[:1]:
+            docs = postings.get(key)
+            if docs is None:
+                docs = postings[key] = set()
+            docs.add(number)
+
+    def _remove_exact(self, field: str, number: int, value: Any) -> None:
+        docs = self.exact.get(field, {}).get(term_keys(value)[0])
+        if docs is not None:
+            docs.discard(number)
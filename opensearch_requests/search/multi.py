@@ -0,0 +1,122 @@
+import json
+import logging
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from pydantic import Field
+
+from .._imports import DeferredModel
+from .base import Searchable
+from .result import Result, SearchError
+
+if TYPE_CHECKING:
+    from .hooks import SearchStats
+
+
+logger = logging.getLogger("opensearch_requests")
+
+
+class MultiSearch(DeferredModel):
+    """Batch of independent searches sent in a single ``_msearch`` request.
+
+    Example:
+
+        multi = MultiSearch()
+        multi.add("movies", MatchQuery(field="title", query="wind"))
+        multi.add("movies", TermsAggregation(name="genres", field="genre"))
+        results = multi.search(client)
+
+    Each item of the returned list is either a ``Result`` or
+    a ``SearchError`` and corresponds to the request at the same position.
+    """
+    requests: list[tuple[str, Searchable]] = Field(default_factory=list)
+    """Pairs of index name and query or aggregation to run against it."""
+
+    def add(self, index: str, request: Searchable) -> "MultiSearch":
+        """Append a search to the batch and return the batch itself."""
+        self.requests.append((index, request))
+        return self
+
+    def body(self) -> str:
+        """Serialize all searches to NDJSON body of the ``_msearch`` API."""
+        lines = []
+        for index, request in self.requests:
+            lines.append(json.dumps({"index": index}, separators=(",", ":")))
+            lines.append(json.dumps(request.body(), separators=(",", ":")))
+        return "\n".join(lines) + "\n"
+
+    def search(self, client) -> list[Union[Result, SearchError]]:
+        if not (hasattr(client, "msearch") and callable(client.msearch)):
+            raise RuntimeError("Wrong OpenSearch client object passed")
+        if not self.requests:
+            return []
+
+        stats, body = self._start()
+        response = client.msearch(body=body)
+        return self._finish(response, stats)
+
+    async def asearch(self, client) -> list[Union[Result, SearchError]]:
+        """Awaitable version of ``search()`` for ``AsyncOpenSearch`` clients."""
+        if not (hasattr(client, "msearch") and callable(client.msearch)):
+            raise RuntimeError("Wrong OpenSearch client object passed")
+        if not self.requests:
+            return []
+
+        stats, body = self._start()
+        response = await client.msearch(body=body)
+        return self._finish(response, stats)
+
+    def parse(self, response: dict[str, Any]) -> list[Union[Result, SearchError]]:
+        """Split ``_msearch`` response into one item per request."""
+        items = response["responses"]
+        if len(items) != len(self.requests):
+            raise RuntimeError(
+                f"Multi-search returned {len(items)} responses "
+                f"for {len(self.requests)} requests"
+            )
+
+        results: list[Union[Result, SearchError]] = []
+        for item in items:
+            if "error" in item:
+                results.append(SearchError(**item))
+            else:
+                results.append(Result(**item))
+        return results
+
+    def _start(self) -> tuple[Optional["SearchStats"], str]:
+        """Return stats to fill in and body of the request."""
+        from .hooks import SearchStats, _hooks
+
+        stats = None
+        if _hooks:
+            indices = dict.fromkeys(index for index, _ in self.requests)
+            stats = SearchStats(type(self).__name__, ",".join(indices))
+        body = self.body()
+        logger.info("Multi-search body with %d searches: %s", len(self.requests), body)
+        if stats is not None:
+            stats.serialize = stats.lap()
+            stats.body_bytes = len(body.encode("utf-8"))
+            # Measuring the size is not part of any phase
+            stats.lap()
+        return stats, body
+
+    def _finish(
+        self, response: dict[str, Any], stats: Optional["SearchStats"]
+    ) -> list[Union[Result, SearchError]]:
+        """Return parsed response, reporting stats of the whole batch."""
+        if stats is None:
+            return self.parse(response)
+
+        from .hooks import emit
+
+        stats.request = stats.lap()
+        results = self.parse(response)
+        stats.parse = stats.lap()
+        stats.took = response.get("took")
+        stats.hits = 0
+        for result in results:
+            if isinstance(result, Result) and result.hits is not None:
+                stats.hits += len(result.hits.hits)
+                if result.hits.total is not None and result.hits.total.value is not None:
+                    stats.total_hits = (stats.total_hits or 0) + result.hits.total.value
+        emit(stats)
+        return results
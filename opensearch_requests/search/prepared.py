@@ -0,0 +1,256 @@
+import copy
+import json
+import re
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, Union
+
+from pydantic import TypeAdapter
+
+from .base import Searchable, _SearchCall
+from .result import DocumentT, Result
+
+if TYPE_CHECKING:
+    from .cache import ResultCache
+    from .coalesce import SingleFlight
+    from .cost import Budget
+    from .resilience import ResiliencePolicy
+
+
+_NAME = re.compile(r"\w+")
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+_QUOTED_PLACEHOLDER = re.compile(r'"\{\{(\w+)\}\}"')
+_VALUE = TypeAdapter(str)
+_OPTIONS = frozenset((
+    "index", "client", "lazy", "raw", "model", "cache", "coalesce", "budget",
+    "resilience", "filter_path",
+))
+"""Arguments of ``PreparedQuery.search()``, which can't name parameters."""
+
+
+class Param(str):
+    """Named placeholder for a string value of a prepared query.
+
+    Can be used in place of any string field of a query, including field
+    names. The placeholder is rendered as ``{{name}}`` which is also
+    the mustache syntax of OpenSearch search templates.
+
+    Only fields validated as strings can hold a placeholder and values
+    are bound as strings. Fields of other types, e.g. ``size`` or
+    ``boost``, keep the value the query was prepared with, so prepare
+    one query per such value.
+
+    Example:
+
+        query = BooleanQuery(
+            must=[MatchQuery(field="title", query=Param("title"))],
+            filter=[TermQuery(field="tenant", query=Param("tenant"))],
+            size=20,
+        )
+        prepared = query.prepare()
+        prepared.search("movies", client, title="wind", tenant="acme")
+
+    """
+    def __new__(cls, name: str) -> "Param":
+        if not _NAME.fullmatch(name):
+            raise ValueError(f"Invalid parameter name: {name!r}")
+        return super().__new__(cls, "{{" + name + "}}")
+
+
+class PreparedQuery:
+    """Query or aggregation compiled once into a body template.
+
+    The request is validated and serialized only when it is prepared.
+    Binding values afterwards validates just the placeholder values and
+    fills them into the precompiled template, skipping validation and
+    serialization of the models.
+
+    Parts of the template without placeholders are shared between all
+    bound bodies, so bound bodies must not be modified.
+    """
+    def __init__(self, request: Searchable):
+        self.request: Searchable = request.freeze()
+        """Frozen copy of the prepared request."""
+        self.template: dict[str, Any] = copy.deepcopy(self.request.body())
+        """Request body with ``{{name}}`` placeholders."""
+        self.source: str = json.dumps(self.template, separators=(",", ":"))
+        """Template serialized to JSON, also used as search template source."""
+        self.id: Optional[str] = None
+        """Identifier of the stored search template, once registered."""
+
+        self._segments = _QUOTED_PLACEHOLDER.split(self.source)
+        self.params: frozenset[str] = frozenset(self._segments[1::2])
+        """Names of all placeholders in the template."""
+        if self.params & _OPTIONS:
+            raise ValueError(
+                f"Parameter names clash with search() arguments: {sorted(self.params & _OPTIONS)}"
+            )
+        self._build = _compile(self.template)
+
+    def bind(self, **values: str) -> dict[str, Any]:
+        """Return request body with placeholders replaced by values."""
+        return self._bind(self._validate(values))
+
+    def bind_json(self, **values: str) -> bytes:
+        """Return request body serialized to JSON bytes."""
+        return self._bind_json(self._validate(values))
+
+    def search(
+        self,
+        index: str,
+        client,
+        lazy: bool = False,
+        raw: bool = False,
+        model: Optional[type[DocumentT]] = None,
+        cache: Union["ResultCache", bool, None] = None,
+        coalesce: Union["SingleFlight", bool] = False,
+        budget: Union["Budget", bool, None] = None,
+        resilience: Union["ResiliencePolicy", bool, None] = None,
+        filter_path: Union[str, Sequence[str], None] = None,
+        **values: str,
+    ) -> Result[DocumentT]:
+        """Search with the body bound from ``values``.
+
+        Takes the same arguments as ``Searchable.search()``, so hooks,
+        caching, coalescing, budgets and resilience policies apply as for
+        the request itself. The budget is enforced on the prepared request.
+        """
+        return _PreparedCall(
+            self, self._validate(values), index, client, lazy, raw, model,
+            cache, coalesce, budget, resilience, filter_path,
+        ).run()
+
+    async def asearch(
+        self,
+        index: str,
+        client,
+        lazy: bool = False,
+        raw: bool = False,
+        model: Optional[type[DocumentT]] = None,
+        cache: Union["ResultCache", bool, None] = None,
+        coalesce: Union["SingleFlight", bool] = False,
+        budget: Union["Budget", bool, None] = None,
+        resilience: Union["ResiliencePolicy", bool, None] = None,
+        filter_path: Union[str, Sequence[str], None] = None,
+        **values: str,
+    ) -> Result[DocumentT]:
+        """Awaitable version of ``search()`` for ``AsyncOpenSearch`` clients."""
+        return await _PreparedCall(
+            self, self._validate(values), index, client, lazy, raw, model,
+            cache, coalesce, budget, resilience, filter_path,
+        ).arun()
+
+    def register(self, client, id: str) -> None:
+        """Store the template on the cluster as a mustache search template.
+
+        After registration ``search_template()`` sends only the template
+        identifier and parameter values instead of the whole body.
+        """
+        client.put_script(
+            id=id,
+            body={"script": {"lang": "mustache", "source": self.source}},
+        )
+        self.id = id
+
+    def search_template(self, index: str, client, **values: str) -> Result:
+        """Search with the template rendered on the server side.
+
+        Uses the stored template if it was registered, otherwise sends
+        the template source inline.
+        """
+        if not (
+            hasattr(client, "search_template")
+            and callable(client.search_template)
+        ):
+            raise RuntimeError("Wrong OpenSearch client object passed")
+
+        values = self._validate(values)
+        body: dict[str, Any] = {"params": values}
+        if self.id is not None:
+            body["id"] = self.id
+        else:
+            body["source"] = self.source
+
+        response = client.search_template(
+            index=index,
+            body=body,
+        )
+
+        return Result(**response)
+
+    def _validate(self, values: dict[str, Any]) -> dict[str, str]:
+        missing = self.params.difference(values)
+        if missing:
+            raise ValueError(f"Missing values for parameters: {sorted(missing)}")
+        unknown = set(values).difference(self.params)
+        if unknown:
+            raise ValueError(f"Unknown parameters: {sorted(unknown)}")
+        return {name: _VALUE.validate_python(value) for name, value in values.items()}
+
+    def _bind(self, values: dict[str, str]) -> dict[str, Any]:
+        if self._build is None:
+            return self.template
+        return self._build(values)
+
+    def _bind_json(self, values: dict[str, str]) -> bytes:
+        segments = self._segments
+        parts = [segments[0]]
+        for i in range(1, len(segments), 2):
+            parts.append(json.dumps(values[segments[i]]))
+            parts.append(segments[i + 1])
+        return "".join(parts).encode("utf-8")
+
+
+class _PreparedCall(_SearchCall):
+    """Search call sending a body bound from a prepared template."""
+    def __init__(self, prepared: PreparedQuery, values: dict[str, str], *args: Any):
+        self.prepared = prepared
+        self.values = values
+        self.data: Optional[bytes] = None
+        super().__init__(prepared.request, *args)
+
+    def template(self) -> PreparedQuery:
+        if self.request is not self.prepared.request:
+            # Budget sends a downgraded copy of the request in its place
+            self.prepared = PreparedQuery(self.request)
+        return self.prepared
+
+    def body(self) -> bytes:
+        if self.data is None:
+            self.data = self.template()._bind_json(self.values)
+        return self.data
+
+    def canonical(self) -> dict[str, Any]:
+        return self.template()._bind(self.values)
+
+    def flight_key(self) -> tuple[Any, ...]:
+        # Fingerprint of the request doesn't depend on the bound values
+        return super().flight_key() + (self.body(),)
+
+
+def _compile(node: Any) -> Optional[Callable[[dict[str, str]], Any]]:
+    """Compile template node into a function building it from values.
+
+    Returns None for nodes without placeholders, which are reused as is.
+    """
+    if isinstance(node, str):
+        match = _PLACEHOLDER.fullmatch(node)
+        if match is None:
+            return None
+        name = match.group(1)
+        return lambda values: values[name]
+
+    if isinstance(node, dict):
+        items = [(_compile(k), k, _compile(v), v) for k, v in node.items()]
+        if all(kb is None and vb is None for kb, _, vb, _ in items):
+            return None
+        return lambda values: {
+            (k if kb is None else kb(values)): (v if vb is None else vb(values))
+            for kb, k, vb, v in items
+        }
+
+    if isinstance(node, list):
+        elements = [(_compile(v), v) for v in node]
+        if all(b is None for b, _ in elements):
+            return None
+        return lambda values: [v if b is None else b(values) for b, v in elements]
+
+    return None
@@ -1,5 +1,65 @@
-from .full_text import *
-from .match_all import *
-from .term import *
-from .boolean import *
-from .enums import *
+from typing import TYPE_CHECKING
+
+from ..._imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .full_text import *
+    from .match_all import *
+    from .term import *
+    from .boolean import *
+    from .optimizer import *
+    from .enums import *
+
+
+# Submodules are imported on first access, so using one query type
+# doesn't build models of all the others
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    ".base": ["BaseQuery", "BaseTextQuery"],
+    ".full_text": [
+        "BaseFullTextQuery",
+        "MatchQuery",
+        "MultiMatchQuery",
+        "MatchBoolPrefixQuery",
+        "MatchPhraseQuery",
+        "MatchPhrasePrefixQuery",
+        "QueryStringQuery",
+        "SimpleQueryStringQuery",
+    ],
+    ".match_all": ["MatchAllQuery"],
+    ".term": ["TermQuery", "TermsQuery"],
+    ".boolean": ["BooleanQuery"],
+    ".optimizer": ["optimize"],
+    ".enums": ["Analyzer", "Operator", "QueryType", "Rewrite", "ZeroTermsQuery"],
+    ".options": [
+        "AllowLeadingWildcardOption",
+        "AnalyzeWildcardOption",
+        "AutoGenerateSynonymsPhraseQueryOption",
+        "BoostOption",
+        "DefaultFieldOption",
+        "DefaultOperatorOption",
+        "EnablePositionIncrimentsOption",
+        "FieldOption",
+        "FieldsOption",
+        "FlagsOption",
+        "FuzzinessOption",
+        "FuzzyMaxExpansionsOption",
+        "FuzzyPrefixLengthOption",
+        "FuzzyTransportationsOption",
+        "LenientOption",
+        "LowFreqOperatorOption",
+        "MaxDeterminedStatesOption",
+        "MaxExpansionsOption",
+        "MinimumShouldMatchOption",
+        "OperatorOption",
+        "PhraseSlopOption",
+        "PrefixLengthOption",
+        "QuoteAnalyzerOption",
+        "QuoteFieldSuffixOption",
+        "RewriteOption",
+        "SlopOption",
+        "TieBreakerOption",
+        "TimeZoneOption",
+        "TypeOption",
+        "ZeroTermsQueryOption",
+    ],
+})
@@ -1,18 +1,49 @@
-import logging
-from typing import Any, Optional, Union
+from contextlib import closing
+from typing import Any, Iterator, Optional, Sequence, Union
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from ..result import Result
+from ..base import Searchable
+from ..result import DocumentT, Hit, hits_adapter
+from ..result.columns import hits_to_columns
 
 
-logger = logging.getLogger("opensearch_requests")
+REQUEST_OPTIONS = {
+    "size",
+    "source",
+    "source_includes",
+    "source_excludes",
+    "stored_fields",
+    "docvalue_fields",
+    "track_total_hits",
+}
+"""Fields of queries that are options of the search request, not the query."""
 
 
-class BaseQuery(BaseModel):
+class BaseQuery(Searchable):
     """Base class for all queries."""
     size: Optional[int] = Field(None)
     """Maximum number of results to return in the query."""
+    source: Optional[bool] = Field(None)
+    """Whether to return ``_source`` of hits. The default is true."""
+    source_includes: Optional[list[str]] = Field(None)
+    """Fields of ``_source`` to return, wildcards are supported."""
+    source_excludes: Optional[list[str]] = Field(None)
+    """Fields of ``_source`` to leave out, wildcards are supported."""
+    stored_fields: Optional[list[str]] = Field(None)
+    """Stored fields to return in ``fields`` of hits."""
+    docvalue_fields: Optional[list[Union[str, dict[str, Any]]]] = Field(None)
+    """Fields to return from doc values in ``fields`` of hits.
+
+    Either field names or objects with ``field`` and ``format`` keys.
+    Reading doc values is cheaper than loading and parsing ``_source``.
+    """
+    track_total_hits: Optional[Union[bool, int]] = Field(None)
+    """Whether to count matching documents exactly, or up to which number.
+
+    The default counts up to 10 000. Pass false to skip counting when
+    the total is not needed.
+    """
 
     def bare(self) -> dict[str, Any]:
         raise NotImplementedError
@@ -23,6 +54,22 @@ class BaseQuery(BaseModel):
         b = { "query": self.bare() }
         if self.size is not None:
             b["size"] = self.size
+        if self.source is False:
+            b["_source"] = False
+        elif self.source_includes or self.source_excludes:
+            b["_source"] = {}
+            if self.source_includes:
+                b["_source"]["includes"] = self.source_includes
+            if self.source_excludes:
+                b["_source"]["excludes"] = self.source_excludes
+        elif self.source is True:
+            b["_source"] = True
+        if self.stored_fields is not None:
+            b["stored_fields"] = self.stored_fields
+        if self.docvalue_fields is not None:
+            b["docvalue_fields"] = self.docvalue_fields
+        if self.track_total_hits is not None:
+            b["track_total_hits"] = self.track_total_hits
         return b
 
     def non_empty_dict(
@@ -31,30 +78,112 @@ class BaseQuery(BaseModel):
         if exclude is None:
             exclude: set[str] = set()
         if isinstance(exclude, set):
-            exclude = exclude.union({"size"})
+            exclude = exclude.union(REQUEST_OPTIONS)
         elif isinstance(exclude, dict):
-            exclude["size"] = True
-        return self.dict(
+            exclude.update(dict.fromkeys(REQUEST_OPTIONS, True))
+        return self.model_dump(
             exclude=exclude,
             exclude_none=True,
             exclude_unset=True,
         )
 
-    def search(self, index: str, client) -> Result:
-        # Make sure client object has search function as an
-        # attribute that is callable
-        if not (hasattr(client, "search") and callable(client.search)):
+    def iter_hits(
+        self,
+        index: str,
+        client,
+        page_size: int = 1000,
+        keep_alive: str = "1m",
+        model: Optional[type[DocumentT]] = None,
+    ) -> Iterator[Hit[DocumentT]]:
+        """Iterate over all matching documents using the scroll API.
+
+        Hits are fetched ``page_size`` at a time and only the current page
+        is kept in memory. The ``size`` of the query is replaced with
+        ``page_size``. The scroll context is cleared once iteration stops,
+        whether it is exhausted, interrupted with ``break`` (when the
+        generator is closed), or fails with an exception.
+
+        Each page is validated in a single call, with ``_source`` of hits
+        validated into ``model`` when it is given.
+
+        Example:
+
+            for hit in MatchAllQuery().iter_hits("movies", client):
+                export(hit.source)
+
+        """
+        if not (
+            hasattr(client, "scroll") and callable(client.scroll)
+            and hasattr(client, "clear_scroll") and callable(client.clear_scroll)
+        ):
+            raise RuntimeError("Wrong OpenSearch client object passed")
+
+        adapter = hits_adapter(model)
+        pages = self._scroll_pages(index, client, page_size, keep_alive)
+        with closing(pages):
+            for page in pages:
+                hits = adapter.validate_python(page)
+                del page
+                yield from hits
+                del hits
+
+    def iter_columns(
+        self,
+        index: str,
+        client,
+        fields: Sequence[str] = (),
+        page_size: int = 10000,
+        keep_alive: str = "1m",
+        backend: str = "numpy",
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all matching documents as columnar pages.
+
+        Same as ``iter_hits()``, but every scroll page is pivoted straight
+        from the raw response into NumPy or Arrow arrays, see
+        ``hits_to_columns()``. No ``Hit`` objects are created.
+        """
+        if not (
+            hasattr(client, "scroll") and callable(client.scroll)
+            and hasattr(client, "clear_scroll") and callable(client.clear_scroll)
+        ):
             raise RuntimeError("Wrong OpenSearch client object passed")
 
-        body = self.body()
-        logger.info(f"Query body for search: {body}")
+        pages = self._scroll_pages(index, client, page_size, keep_alive)
+        with closing(pages):
+            for page in pages:
+                columns = hits_to_columns(page, fields, backend)
+                del page
+                yield columns
 
-        response = client.search(
-            index=index,
-            body=self.body()
-        )
+    def _scroll_pages(
+        self,
+        index: str,
+        client,
+        page_size: int,
+        keep_alive: str,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield raw hits of each scroll page and clear the scroll at the end."""
+        body = {**self.body(), "size": page_size}
+        # Sorting by _doc is the cheapest order for scrolling
+        body.setdefault("sort", ["_doc"])
+
+        response = client.search(index=index, body=body, scroll=keep_alive)
+        scroll_id = response.get("_scroll_id")
+        try:
+            while True:
+                page = response["hits"]["hits"]
+                del response
+                if not page:
+                    break
+
+                yield page
+                del page
 
-        return Result(**response)
+                response = client.scroll(scroll_id=scroll_id, scroll=keep_alive)
+                scroll_id = response.get("_scroll_id", scroll_id)
+        finally:
+            if scroll_id:
+                client.clear_scroll(scroll_id=scroll_id)
 
 
 class BaseTextQuery(BaseQuery):
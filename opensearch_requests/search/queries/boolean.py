@@ -6,6 +6,7 @@ from .base import BaseQuery
 
 
 class BooleanQuery(BaseQuery):
+    kind = "bool"
     must: Optional[list[BaseQuery]] = Field(None)
     should: Optional[list[BaseQuery]] = Field(None)
     minimum_should_match: Optional[int] = Field(None, example=1)
@@ -29,3 +30,12 @@ class BooleanQuery(BaseQuery):
             result["bool"]["minimum_should_match"] = self.minimum_should_match
 
         return result
+
+    def optimize(self, scoring: bool = True) -> BaseQuery:
+        """Return smaller equivalent query, see ``optimizer.optimize()``.
+
+        Pass ``scoring=False`` when scores of results are not needed.
+        """
+        from .optimizer import optimize
+
+        return optimize(self, scoring)
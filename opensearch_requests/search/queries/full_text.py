@@ -34,6 +34,7 @@ class MatchQuery(
     The match query analyzes the provided search string and returns
     documents that match any of the string's terms.
     """
+    kind = "match"
     class Config:
         use_enum_values = True
 
@@ -66,6 +67,7 @@ class MultiMatchQuery(
 
     Multi-match operation functions similarly to the match operation.
     """
+    kind = "multi_match"
     class Config:
         use_enum_values = True
 
@@ -103,6 +105,7 @@ class MatchBoolPrefixQuery(
         ``brown`` and a term starting with ``f``, appearing in any position.
 
     """
+    kind = "match_bool_prefix"
     class Config:
         use_enum_values = True
     
@@ -125,6 +128,7 @@ class MatchPhraseQuery(
     You can add flexibility to phrase matching by providing the ``slop``
     parameter.
     """
+    kind = "match_phrase"
     class Config:
         use_enum_values = True
     
@@ -155,6 +159,7 @@ class MatchPhrasePrefixQuery(
         ``two quick brown ferrets``, but not ``the fox is quick and brown``.
 
     """
+    kind = "match_phrase_prefix"
     class Config:
         use_enum_values = True
     
@@ -201,6 +206,7 @@ class QueryStringQuery(
         ``the wind AND (rises OR rising)``
 
     """
+    kind = "query_string"
 
     class Config:
         use_enum_values = True
@@ -242,6 +248,7 @@ class SimpleQueryStringQuery(
     * `~n`: Set fuzziness (for example, `wnid~3`)
     * `-`:  Negate term
     """
+    kind = "simple_query_string"
 
     class Config:
         use_enum_values = True
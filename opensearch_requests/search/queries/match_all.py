@@ -9,6 +9,7 @@ class MatchAllQuery(BaseQuery):
     This type can be useful in testing large document sets if you need
     to return the entire set.
     """
+    kind = "match_all"
 
     def bare(self) -> dict[str, Any]:
         return {
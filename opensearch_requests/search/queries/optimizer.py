@@ -0,0 +1,176 @@
+from typing import Any, Optional
+
+from .base import BaseQuery
+from .boolean import BooleanQuery
+from .term import TermQuery, TermsQuery
+
+
+_CLAUSES = ("must", "should", "must_not", "filter")
+_BOOL_FIELDS = {*_CLAUSES, "minimum_should_match"}
+
+
+def optimize(query: BaseQuery, scoring: bool = True) -> BaseQuery:
+    """Rewrite query into a smaller equivalent one.
+
+    Boolean queries are simplified bottom up:
+
+    * a boolean query with a single ``must`` or ``should`` clause is
+      replaced with the clause itself;
+    * nested boolean queries without ``should`` clauses are merged into
+      ``must``, ``filter`` or ``must_not`` of the parent, and nested
+      ``should`` only queries into ``should`` or ``must_not``;
+    * duplicate clauses are removed where that doesn't change scores;
+    * ``TermQuery`` clauses on the same field in ``must_not`` are merged
+      into one ``TermsQuery``.
+
+    With ``scoring=False`` the caller doesn't need scores, so ``must``
+    clauses are moved into ``filter``, which is cached by OpenSearch and
+    skips scoring, and same field ``should`` terms are merged as well.
+
+    Matching documents are never changed. Query objects are not modified,
+    rewritten parts are new objects, frozen if the query was frozen.
+    """
+    return _unwrap(_optimize(query, scoring), scoring)
+
+
+def _optimize(query: BaseQuery, scoring: bool) -> BaseQuery:
+    if not isinstance(query, BooleanQuery):
+        return query
+
+    msm = query.minimum_should_match
+    optional_should = msm is None or msm == 1
+    must: list[BaseQuery] = []
+    should: list[BaseQuery] = []
+    must_not: list[BaseQuery] = []
+    filter: list[BaseQuery] = []
+
+    moved_must = () if scoring else query.must or ()
+    for clause in (*moved_must, *(query.filter or ())):
+        clause = _unwrap(_optimize(clause, False), False)
+        if _is_plain(clause) and not clause.should and (clause.must or clause.filter):
+            filter.extend((*(clause.must or ()), *(clause.filter or ())))
+            must_not.extend(clause.must_not or ())
+        else:
+            filter.append(clause)
+
+    for clause in (query.must or ()) if scoring else ():
+        clause = _unwrap(_optimize(clause, True), True)
+        if _is_plain(clause) and not clause.should and (clause.must or clause.filter):
+            must.extend(clause.must or ())
+            filter.extend(clause.filter or ())
+            must_not.extend(clause.must_not or ())
+        else:
+            must.append(clause)
+
+    for clause in query.should or ():
+        clause = _unwrap(_optimize(clause, scoring), scoring)
+        if optional_should and _is_should_only(clause):
+            should.extend(clause.should)
+        else:
+            should.append(clause)
+
+    for clause in query.must_not or ():
+        clause = _unwrap(_optimize(clause, False), False)
+        if _is_should_only(clause):
+            must_not.extend(clause.should)
+        else:
+            must_not.append(clause)
+
+    filter = _deduplicate(filter)
+    must_not = _merge_terms(_deduplicate(must_not))
+    if not scoring and msm is None:
+        should = _deduplicate(should)
+    if not scoring and optional_should:
+        should = _merge_terms(should)
+
+    clauses = {"must": must, "should": should, "must_not": must_not, "filter": filter}
+    if all(_same(clauses[name], getattr(query, name)) for name in _CLAUSES):
+        return query
+
+    data = {
+        name: getattr(query, name)
+        for name in query.model_fields_set
+        if name not in _CLAUSES
+    }
+    data.update({name: value for name, value in clauses.items() if value})
+    optimized = type(query)(**data)
+    return optimized.freeze() if query.is_frozen else optimized
+
+
+def _unwrap(query: BaseQuery, scoring: bool) -> BaseQuery:
+    """Return the only clause of a boolean query if it is equivalent."""
+    if not _is_plain(query):
+        return query
+    clauses = [(name, getattr(query, name)) for name in _CLAUSES if getattr(query, name)]
+    if len(clauses) != 1 or len(clauses[0][1]) != 1:
+        return query
+
+    name, (clause,) = clauses[0]
+    if name == "must":
+        return clause
+    if name == "should" and query.minimum_should_match in (None, 1):
+        return clause
+    if name == "filter" and not scoring:
+        return clause
+    return query
+
+
+def _is_plain(query: BaseQuery) -> bool:
+    """Whether query is a boolean query with nothing but clauses set."""
+    return type(query) is BooleanQuery and query.model_fields_set <= _BOOL_FIELDS
+
+
+def _is_should_only(query: BaseQuery) -> bool:
+    return (
+        _is_plain(query)
+        and bool(query.should)
+        and not (query.must or query.filter or query.must_not)
+        and query.minimum_should_match in (None, 1)
+    )
+
+
+def _same(clauses: list[BaseQuery], original: Optional[Any]) -> bool:
+    original = original or ()
+    return len(clauses) == len(original) and all(a is b for a, b in zip(clauses, original))
+
+
+def _deduplicate(clauses: list[BaseQuery]) -> list[BaseQuery]:
+    seen: set[str] = set()
+    unique: list[BaseQuery] = []
+    for clause in clauses:
+        key = clause.fingerprint()
+        if key not in seen:
+            seen.add(key)
+            unique.append(clause)
+    return unique if len(unique) != len(clauses) else clauses
+
+
+def _merge_terms(clauses: list[BaseQuery]) -> list[BaseQuery]:
+    """Merge term clauses on the same field into a single terms clause."""
+    by_field: dict[str, list[BaseQuery]] = {}
+    for clause in clauses:
+        if _is_mergeable(clause):
+            by_field.setdefault(clause.field, []).append(clause)
+    if all(len(group) < 2 for group in by_field.values()):
+        return clauses
+
+    merged: list[BaseQuery] = []
+    for clause in clauses:
+        group = by_field.get(clause.field) if _is_mergeable(clause) else None
+        if group is None or len(group) < 2:
+            merged.append(clause)
+        elif clause is group[0]:
+            values = dict.fromkeys(
+                value
+                for term in group
+                for value in (term.values if isinstance(term, TermsQuery) else (term.query,))
+            )
+            terms = TermsQuery(field=clause.field, values=list(values))
+            merged.append(terms.freeze() if clause.is_frozen else terms)
+    return merged
+
+
+def _is_mergeable(query: BaseQuery) -> bool:
+    return type(query) in (TermQuery, TermsQuery) and query.model_fields_set <= {
+        "field", "query", "values"
+    }
@@ -1,11 +1,12 @@
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ..._imports import DeferredModel
 from .enums import Operator, Rewrite, QueryType, ZeroTermsQuery
 
 
-class AllowLeadingWildcardOption(BaseModel):
+class AllowLeadingWildcardOption(DeferredModel):
     allow_leading_wildcard: Optional[bool] = Field(None)
     """Whether * and ? are allowed as the first character of a search term.
     
@@ -13,7 +14,7 @@ class AllowLeadingWildcardOption(BaseModel):
     """
 
 
-class AnalyzeWildcardOption(BaseModel):
+class AnalyzeWildcardOption(DeferredModel):
     analyze_wildcard: Optional[
         bool
     ] = Field(None)
@@ -23,7 +24,7 @@ class AnalyzeWildcardOption(BaseModel):
     """
 
 
-class AutoGenerateSynonymsPhraseQueryOption(BaseModel):
+class AutoGenerateSynonymsPhraseQueryOption(DeferredModel):
     auto_generate_synonyms_phrase_query: Optional[
         bool
     ] = Field(None)
@@ -36,24 +37,24 @@ class AutoGenerateSynonymsPhraseQueryOption(BaseModel):
     """
 
 
-class BoostOption(BaseModel):
+class BoostOption(DeferredModel):
     boost: Optional[float] = Field(None)
     """Boosts the clause by the given multiplier.
     Useful for weighing clauses in compound queries. The default is 1.0.
     """
 
 
-class DefaultFieldOption(BaseModel):
+class DefaultFieldOption(DeferredModel):
     default_field: Optional[str] = Field(None)
 
 
-class DefaultOperatorOption(BaseModel):
+class DefaultOperatorOption(DeferredModel):
     default_operator: Optional[
         Operator
     ] = Field(None)
 
 
-class EnablePositionIncrimentsOption(BaseModel):
+class EnablePositionIncrimentsOption(DeferredModel):
     enable_position_incriments: Optional[bool] = Field(None)
     """When true, result queries are aware of position increments.
     
@@ -62,12 +63,12 @@ class EnablePositionIncrimentsOption(BaseModel):
     """
 
 
-class FieldOption(BaseModel):
+class FieldOption(DeferredModel):
     field: str = Field(...)
     """Name of the specific document field to match."""
 
 
-class FieldsOption(BaseModel):
+class FieldsOption(DeferredModel):
     fields: Optional[list[str]] = Field(None)
     """Fields to search: ``["title^4", "description"]``.
 
@@ -79,11 +80,11 @@ class FieldsOption(BaseModel):
     """
 
 
-class FlagsOption(BaseModel):
+class FlagsOption(DeferredModel):
     flags: Optional[str] = Field(None)
 
 
-class FuzzinessOption(BaseModel):
+class FuzzinessOption(DeferredModel):
     fuzziness: Optional[
         int
     ] = Field(None)
@@ -97,7 +98,7 @@ class FuzzinessOption(BaseModel):
     """
 
 
-class FuzzyMaxExpansionsOption(BaseModel):
+class FuzzyMaxExpansionsOption(DeferredModel):
     fuzzy_max_expansions: Optional[
         int
     ] = Field(None)
@@ -109,13 +110,13 @@ class FuzzyMaxExpansionsOption(BaseModel):
     """
 
 
-class FuzzyPrefixLengthOption(BaseModel):
+class FuzzyPrefixLengthOption(DeferredModel):
     fuzzy_prefix_length: Optional[
         int
     ] = Field(None)
 
 
-class FuzzyTransportationsOption(BaseModel):
+class FuzzyTransportationsOption(DeferredModel):
     fuzzy_transportations: Optional[
         bool
     ] = Field(None)
@@ -132,7 +133,7 @@ class FuzzyTransportationsOption(BaseModel):
     """
 
 
-class LenientOption(BaseModel):
+class LenientOption(DeferredModel):
     lenient: Optional[
         bool
     ] = Field(None)
@@ -144,7 +145,7 @@ class LenientOption(BaseModel):
     """
 
 
-class LowFreqOperatorOption(BaseModel):
+class LowFreqOperatorOption(DeferredModel):
     low_freq_operator: Optional[Operator] = Field(None)
     """The operator for low-frequency terms.
     
@@ -152,7 +153,7 @@ class LowFreqOperatorOption(BaseModel):
     """
 
 
-class MaxExpansionsOption(BaseModel):
+class MaxExpansionsOption(DeferredModel):
     max_expansions: Optional[
         int
     ] = Field(None)
@@ -162,7 +163,7 @@ class MaxExpansionsOption(BaseModel):
     """
 
 
-class MaxDeterminedStatesOption(BaseModel):
+class MaxDeterminedStatesOption(DeferredModel):
     max_determined_states: Optional[int] = Field(None)
     """Maximum number of states for regex.
 
@@ -174,7 +175,7 @@ class MaxDeterminedStatesOption(BaseModel):
     """
 
 
-class MinimumShouldMatchOption(BaseModel):
+class MinimumShouldMatchOption(DeferredModel):
     minimum_should_match: Optional[
         int
     ] = Field(None)
@@ -192,7 +193,7 @@ class MinimumShouldMatchOption(BaseModel):
     """
 
 
-class OperatorOption(BaseModel):
+class OperatorOption(DeferredModel):
     operator: Optional[
         Operator
     ] = Field(None)
@@ -204,12 +205,12 @@ class OperatorOption(BaseModel):
     """
 
 
-class PhraseSlopOption(BaseModel):
+class PhraseSlopOption(DeferredModel):
     phrase_slop: Optional[int] = Field(None)
     """Slop value for the phrase."""
 
 
-class PrefixLengthOption(BaseModel):
+class PrefixLengthOption(DeferredModel):
     prefix_length: Optional[
         int
     ] = Field(None)
@@ -219,11 +220,11 @@ class PrefixLengthOption(BaseModel):
     """
 
 
-class QuoteAnalyzerOption(BaseModel):
+class QuoteAnalyzerOption(DeferredModel):
     quote_analyzer: Optional[str] = Field(None)
 
 
-class QuoteFieldSuffixOption(BaseModel):
+class QuoteFieldSuffixOption(DeferredModel):
     quote_field_suffix: Optional[
         str
     ] = Field(None)
@@ -240,7 +241,7 @@ class QuoteFieldSuffixOption(BaseModel):
     """
 
 
-class RewriteOption(BaseModel):
+class RewriteOption(DeferredModel):
     rewrite: Optional[Rewrite] = Field(None)
     """Determines how OpenSearch rewrites and scores multi-term queries.
     
@@ -248,7 +249,7 @@ class RewriteOption(BaseModel):
     """
 
 
-class SlopOption(BaseModel):
+class SlopOption(DeferredModel):
     slop: Optional[int] = Field(None)
     """How far words in a query can be misordered and still be a match.
     
@@ -262,7 +263,7 @@ class SlopOption(BaseModel):
     """
 
 
-class TieBreakerOption(BaseModel):
+class TieBreakerOption(DeferredModel):
     tie_breaker: Optional[float] = Field(None)
     """Changes the way OpenSearch scores searches.
     
@@ -275,7 +276,7 @@ class TieBreakerOption(BaseModel):
     """
 
 
-class TimeZoneOption(BaseModel):
+class TimeZoneOption(DeferredModel):
     time_zone: Optional[str] = Field(None)
     """Number of hours to offset the derired time zone from UTC.
 
@@ -290,7 +291,7 @@ class TimeZoneOption(BaseModel):
     """
 
 
-class TypeOption(BaseModel):
+class TypeOption(DeferredModel):
     type: Optional[QueryType] = Field(None)
     """Determines how OpenSearch executes the query and scores the results.
 
@@ -298,7 +299,7 @@ class TypeOption(BaseModel):
     """
 
 
-class ZeroTermsQueryOption(BaseModel):
+class ZeroTermsQueryOption(DeferredModel):
     zero_terms_query: Optional[
         ZeroTermsQuery
     ] = Field(None)
@@ -1,8 +1,8 @@
-from typing import Any
+from typing import Any, Union
 
 from pydantic import Field
 
-from .base import BaseTextQuery
+from .base import BaseQuery, BaseTextQuery
 from .options import *
 
 
@@ -21,6 +21,7 @@ class TermQuery(
     queries on text data, only use them for fields mapped as keywords
     or arrays of strings that are explicitly ``not_analyzed``.
     """
+    kind = "term"
 
     def bare(self) -> dict[str, Any]:
         return {
@@ -28,3 +29,24 @@ class TermQuery(
                 self.field: self.query,
             }
         }
+
+
+class TermsQuery(
+    BaseQuery,
+    FieldOption,
+):
+    """Search for documents matching any of the exact values.
+
+    Equivalent of several ``TermQuery`` clauses on the same field
+    in ``should``, but evaluated as a single non-scoring clause.
+    """
+    kind = "terms"
+    values: list[Union[str, int, float, bool]] = Field(...)
+    """Exact values to look for in the field."""
+
+    def bare(self) -> dict[str, Any]:
+        return {
+            "terms": {
+                self.field: list(self.values),
+            }
+        }
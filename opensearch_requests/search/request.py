@@ -0,0 +1,91 @@
+from typing import Any, Optional, Union
+
+from pydantic import Field, model_validator
+
+from .aggregations.base import BaseAggregation
+from .base import Searchable
+from .queries.base import BaseQuery
+from .result import Result
+
+
+class SearchRequest(Searchable):
+    """Search combining a query, sibling aggregations, sorting and paging.
+
+    Everything is sent in a single request, so a page of hits with all
+    its facets costs one round-trip and one fan-out to shards. Request
+    options of the query, such as ``source_includes``, are kept.
+
+    Example:
+
+        request = SearchRequest(
+            query=MatchQuery(field="title", query="shoes"),
+            aggs=[
+                TermsAggregation(name="brands", field="brand", bucket_size=50),
+                AvgAggregation(name="avg_price", field="price"),
+            ],
+            size=20,
+            sort=[{"price": "asc"}, "_id"],
+        )
+        result = request.search("products", client)
+        next_page = request.after(result).search("products", client)
+
+    """
+    query: Optional[BaseQuery] = Field(None)
+    """Query selecting documents, all documents if omitted."""
+    aggs: Optional[list[BaseAggregation]] = Field(None)
+    """Aggregations over the matched documents, computed side by side.
+
+    An aggregation with a ``filter`` is wrapped in a ``filter``
+    aggregation, see ``BaseAggregation.filtered()``. Its own ``size`` is
+    ignored, the number of hits is ``size`` of the request.
+    """
+    size: Optional[int] = Field(None)
+    """Number of hits to return. Use 0 for aggregations only."""
+    from_: Optional[int] = Field(None)
+    """Number of hits to skip."""
+    sort: Optional[list[Union[str, dict[str, Any]]]] = Field(None)
+    """Sort order of hits, e.g. ``[{"price": "desc"}, "_id"]``."""
+    search_after: Optional[list[Any]] = Field(None)
+    """Sort values of the last hit of the previous page."""
+
+    @model_validator(mode="after")
+    def _unique_aggregation_names(self) -> "SearchRequest":
+        names = set()
+        for a in self.aggs or ():
+            if a.name in names:
+                raise ValueError(f"Duplicate aggregation name: {a.name}")
+            names.add(a.name)
+        return self
+
+    def body(self) -> dict[str, Any]:
+        """Serialize request to dict suitable for API request."""
+        b: dict[str, Any] = dict(self.query.body()) if self.query else {}
+        if self.aggs:
+            b["aggs"] = {a.name: a.filtered() for a in self.aggs}
+        if self.size is not None:
+            b["size"] = self.size
+        if self.from_ is not None:
+            b["from"] = self.from_
+        if self.sort is not None:
+            b["sort"] = self.sort
+        if self.search_after is not None:
+            b["search_after"] = self.search_after
+        return b
+
+    def after(self, result: Result) -> "SearchRequest":
+        """Return request of the page following the given result.
+
+        Paging uses ``search_after`` with the sort values of the last hit,
+        so ``sort`` must be set and should end with a unique field.
+        Aggregations are dropped, as they don't change between pages.
+        """
+        if not self.sort:
+            raise ValueError("Paging with search_after requires sort")
+        hits = result.hits.hits if result.hits is not None else []
+        if not hits or hits[-1].sort is None:
+            raise ValueError("Result has no sorted hits to page after")
+
+        data = {name: getattr(self, name) for name in self.model_fields_set}
+        data.update(search_after=hits[-1].sort, from_=None, aggs=None)
+        page = type(self)(**data)
+        return page.freeze() if self.is_frozen else page
@@ -0,0 +1,378 @@
+import logging
+import random
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Optional, TypeVar, Union
+
+from pydantic import Field, PrivateAttr
+
+from .._imports import DeferredModel
+
+
+logger = logging.getLogger("opensearch_requests")
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a search to a cluster deemed unhealthy."""
+
+
+class CircuitBreaker:
+    """Stops sending requests to a cluster after consecutive failures.
+
+    After ``failure_threshold`` transient failures in a row the circuit
+    opens and requests fail fast with ``CircuitOpenError``. Once
+    ``reset_timeout`` seconds pass, a single trial request is let through:
+    its success closes the circuit, its failure opens it again. A trial
+    that never reports back, e.g. a cancelled one, is replaced by a new
+    trial after another ``reset_timeout``.
+    """
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        """Number of consecutive failures."""
+        self.state = "closed"
+        """One of ``closed``, ``open`` or ``half_open``."""
+        self._opened_at = 0.0
+        self._trial_at = 0.0
+        self._lock = threading.Lock()
+
+    def before(self) -> None:
+        """Raise ``CircuitOpenError`` if a request may not be sent now."""
+        with self._lock:
+            if self.state == "closed":
+                return
+            now = time.monotonic()
+            if self.state == "open" and now - self._opened_at >= self.reset_timeout or (
+                self.state == "half_open" and now - self._trial_at >= self.reset_timeout
+            ):
+                self.state = "half_open"
+                self._trial_at = now
+                return
+            raise CircuitOpenError(
+                f"Circuit is {self.state} after {self.failures} consecutive failures"
+            )
+
+    def success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.state = "closed"
+
+    def failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning(
+                        "Opening circuit after %d consecutive failures", self.failures
+                    )
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+
+class ResiliencePolicy(DeferredModel):
+    """How searches recover from transient failures and slow responses.
+
+    A search is attempted up to ``max_attempts`` times. It is retried
+    after jittered exponential backoff when it fails with one of
+    ``retry_statuses`` or a connection error, and, with ``retry_partial``,
+    when the response reports timed out or failed shards. The last partial
+    response is returned if all attempts are partial.
+
+    Every client (cluster) has a ``CircuitBreaker`` shared by all policies,
+    created with the thresholds of the first policy used with it.
+
+    With ``hedge`` enabled, a search that takes longer than the
+    ``hedge_percentile`` of recent latencies of this policy is sent once
+    more with a random ``preference``, so it is likely served by other
+    shard copies, and the first response to arrive is used. Hedging
+    starts after ``hedge_min_samples`` searches were measured. Blocking
+    searches are hedged by a pool of ``hedge_workers`` threads; while all
+    of them are busy, searches are sent from the calling thread unhedged.
+
+    Register policies per query or aggregation type with
+    ``configure_resilience()``.
+    """
+    max_attempts: int = Field(3)
+    """Maximum number of attempts, including the first one."""
+    initial_backoff: float = Field(0.1)
+    """Delay in seconds before the first retry, doubled for each next one."""
+    max_backoff: float = Field(5.0)
+    """Maximum delay in seconds between attempts."""
+    retry_statuses: frozenset[int] = Field(frozenset({429, 502, 503, 504}))
+    """HTTP statuses of failed requests that are retried."""
+    retry_partial: bool = Field(True)
+    """Whether responses with timed out or failed shards are retried."""
+    failure_threshold: int = Field(5)
+    """Consecutive failures that open the circuit of a cluster."""
+    reset_timeout: float = Field(30.0)
+    """Seconds an open circuit waits before letting a trial request through."""
+    hedge: bool = Field(False)
+    """Whether slow searches are hedged with a second request."""
+    hedge_percentile: float = Field(95.0)
+    """Latency percentile after which a hedged request is sent."""
+    hedge_min_samples: int = Field(20)
+    """Number of measured searches needed before hedging starts."""
+    hedge_min_delay: float = Field(0.005)
+    """Minimal delay in seconds before a hedged request is sent."""
+    hedge_workers: int = Field(16)
+    """Threads sending hedged searches, shared by policies of the same size."""
+
+    _latencies: deque = PrivateAttr(default_factory=lambda: deque(maxlen=1000))
+
+    def backoff(self, attempt: int) -> float:
+        """Return jittered delay before the attempt after ``attempt``."""
+        delay = min(self.max_backoff, self.initial_backoff * 2 ** (attempt - 1))
+        return random.uniform(delay / 2, delay)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Return delay before sending a hedged request, None to not hedge."""
+        if not self.hedge or len(self._latencies) < self.hedge_min_samples:
+            return None
+        latencies = sorted(self._latencies)
+        rank = min(len(latencies) - 1, int(len(latencies) * self.hedge_percentile / 100))
+        return max(self.hedge_min_delay, latencies[rank])
+
+    def is_retryable(self, error: BaseException) -> bool:
+        status = getattr(error, "status_code", None)
+        if isinstance(status, int):
+            return status in self.retry_statuses
+        return _is_transport_error(error)
+
+    def is_partial(self, result: Any) -> bool:
+        shards = getattr(result, "shards", None)
+        return bool(getattr(result, "timed_out", False)) or bool(
+            shards is not None and shards.failed
+        )
+
+    def execute(self, client, call: Callable[[Optional[str]], T]) -> T:
+        """Run ``call(preference)`` with retries, circuit breaker and hedging."""
+        breaker = circuit_breaker(client, self)
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker.before()
+            started = time.perf_counter()
+            try:
+                result = self._hedged(call)
+            except Exception as e:
+                if not self._failed(breaker, e) or attempt >= self.max_attempts:
+                    raise
+                logger.info("Retrying search after %r", e)
+            else:
+                breaker.success()
+                self._latencies.append(time.perf_counter() - started)
+                if attempt >= self.max_attempts or not (
+                    self.retry_partial and self.is_partial(result)
+                ):
+                    return result
+                logger.info("Retrying search with partial results")
+            time.sleep(self.backoff(attempt))
+
+    async def aexecute(self, client, call: Callable[[Optional[str]], Awaitable[T]]) -> T:
+        """Awaitable version of ``execute()``."""
+        import asyncio
+
+        breaker = circuit_breaker(client, self)
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker.before()
+            started = time.perf_counter()
+            try:
+                result = await self._ahedged(call)
+            except Exception as e:
+                if not self._failed(breaker, e) or attempt >= self.max_attempts:
+                    raise
+                logger.info("Retrying search after %r", e)
+            else:
+                breaker.success()
+                self._latencies.append(time.perf_counter() - started)
+                if attempt >= self.max_attempts or not (
+                    self.retry_partial and self.is_partial(result)
+                ):
+                    return result
+                logger.info("Retrying search with partial results")
+            await asyncio.sleep(self.backoff(attempt))
+
+    def _failed(self, breaker: CircuitBreaker, error: Exception) -> bool:
+        """Record failed attempt on the breaker, return whether to retry it."""
+        retryable = self.is_retryable(error)
+        if retryable or _is_transport_error(error):
+            breaker.failure()
+        else:
+            # The cluster responded, so it is healthy
+            breaker.success()
+        return retryable
+
+    def _hedged(self, call: Callable[[Optional[str]], T]) -> T:
+        delay = self.hedge_delay()
+        if delay is None:
+            return call(None)
+
+        # Searches never wait in the queue of the pool: without an idle
+        # worker the search is sent from this thread and isn't hedged
+        pool = _hedge_pool(self.hedge_workers)
+        primary = pool.submit(call, None)
+        if primary is None:
+            return call(None)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        hedge = pool.submit(call, _preference())
+        if hedge is None:
+            logger.info("Not hedging search slower than %.3fs, all workers are busy", delay)
+            return primary.result()
+        logger.info("Hedging search slower than %.3fs", delay)
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    # The slower request can't be interrupted, its result is dropped
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    async def _ahedged(self, call: Callable[[Optional[str]], Awaitable[T]]) -> T:
+        import asyncio
+
+        delay = self.hedge_delay()
+        if delay is None:
+            return await call(None)
+
+        primary = asyncio.ensure_future(call(None))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        logger.info("Hedging search slower than %.3fs", delay)
+        pending = {primary, asyncio.ensure_future(call(_preference()))}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+        raise error
+
+
+def _preference() -> str:
+    return f"hedge-{random.getrandbits(32):08x}"
+
+
+def _is_transport_error(error: BaseException) -> bool:
+    """Return whether the request failed without a response of the cluster."""
+    # opensearch-py connection errors have statuses like "N/A" or "TIMEOUT"
+    status = getattr(error, "status_code", None)
+    return (status is not None and not isinstance(status, int)) or isinstance(
+        error, (ConnectionError, TimeoutError)
+    )
+
+
+class _HedgePool:
+    """Thread pool that only accepts work while it has an idle worker."""
+    def __init__(self, workers: int):
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="opensearch-hedge")
+        self._idle = threading.Semaphore(workers)
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> "Optional[Future[T]]":
+        """Run ``fn(*args)`` in the pool, return None if all workers are busy."""
+        if not self._idle.acquire(blocking=False):
+            return None
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(lambda _: self._idle.release())
+        return future
+
+
+_pools: dict[int, _HedgePool] = {}
+_pools_lock = threading.Lock()
+
+
+def _hedge_pool(workers: int) -> _HedgePool:
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = _HedgePool(workers)
+        return pool
+
+
+_breakers: "weakref.WeakKeyDictionary[Any, CircuitBreaker]" = weakref.WeakKeyDictionary()
+_breakers_lock = threading.Lock()
+
+
+def circuit_breaker(client, policy: ResiliencePolicy) -> CircuitBreaker:
+    """Return circuit breaker of the cluster of the client."""
+    with _breakers_lock:
+        breaker = _breakers.get(client)
+        if breaker is None:
+            breaker = _breakers[client] = CircuitBreaker(
+                policy.failure_threshold, policy.reset_timeout
+            )
+        return breaker
+
+
+_policies: dict[type, ResiliencePolicy] = {}
+
+
+def configure_resilience(
+    policy: Optional[ResiliencePolicy], request_type: type = object
+) -> None:
+    """Set policy of searches of the query or aggregation type.
+
+    The policy applies to subclasses of ``request_type`` too, unless they
+    have a policy of their own. The default ``object`` sets the policy of
+    all searches. Pass None as ``policy`` to remove it.
+
+    Example:
+
+        configure_resilience(ResiliencePolicy())
+        configure_resilience(ResiliencePolicy(hedge=True), TermsAggregation)
+
+    """
+    if policy is None:
+        _policies.pop(request_type, None)
+    else:
+        _policies[request_type] = policy
+
+
+def resolve_policy(
+    resilience: Union[ResiliencePolicy, bool, None], request_type: type
+) -> Optional[ResiliencePolicy]:
+    """Return policy of a search given its ``resilience`` argument.
+
+    None means the policy configured for the request type, if any, True
+    the configured or otherwise default policy, False disables it.
+    """
+    if resilience is False:
+        return None
+    if isinstance(resilience, ResiliencePolicy):
+        return resilience
+    if resilience is None and not _policies:
+        return None
+    for cls in request_type.__mro__:
+        policy = _policies.get(cls)
+        if policy is not None:
+            return policy
+    if resilience is not True:
+        return None
+    global _default_policy
+    if _default_policy is None:
+        # Created on first use, so importing doesn't build the model
+        _default_policy = ResiliencePolicy()
+    return _default_policy
+
+
+_default_policy: Optional[ResiliencePolicy] = None
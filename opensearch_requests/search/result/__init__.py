@@ -1,14 +1,25 @@
 from enum import Enum
-from typing import Any, Optional
+import functools
+import json
+from typing import Any, Generic, Optional, Sequence, Union
 
-from pydantic import BaseModel, Field
+from pydantic import Field, TypeAdapter, field_serializer
+from typing_extensions import TypeVar
 
+from ..._imports import DeferredModel
+from .columns import hits_to_columns, import_numpy
+from .lazy import LazyMapping, LazySequence
 
-class Shards(BaseModel):
-    total: int = Field(...)
-    successful: int = Field(...)
-    skipped: int = Field(...)
-    failed: int = Field(...)
+
+DocumentT = TypeVar("DocumentT", default=dict[str, Any])
+"""Type of ``_source`` documents, a user model or a plain dict."""
+
+
+class Shards(DeferredModel):
+    total: Optional[int] = Field(None)
+    successful: Optional[int] = Field(None)
+    skipped: Optional[int] = Field(None)
+    failed: Optional[int] = Field(None)
 
 
 class Relation(str, Enum):
@@ -16,29 +27,49 @@ class Relation(str, Enum):
     gte = "gte"
 
 
-class Total(BaseModel):
-    value: int = Field(...)
-    relation: Relation = Field(...)
+class Total(DeferredModel):
+    value: Optional[int] = Field(None)
+    relation: Optional[Relation] = Field(None)
 
     class Config:
         use_enum_values = True
 
 
-class Hit(BaseModel):
-    index: str = Field(..., alias="_index")
-    id: str = Field(..., alias="_id")
-    score: str = Field(..., alias="_score")
-    source: Optional[dict[str, Any]] = Field(None, alias="_source")
+class Hit(DeferredModel, Generic[DocumentT]):
+    index: Optional[str] = Field(None, alias="_index")
+    id: Optional[str] = Field(None, alias="_id")
+    score: Optional[float] = Field(None, alias="_score")
+    source: Optional[DocumentT] = Field(None, alias="_source")
     fields: Optional[dict[str, list[Any]]] = Field(None)
+    sort: Optional[list[Any]] = Field(None)
+    """Sort values of the hit, used for ``search_after`` paging."""
+
+
+@functools.lru_cache(maxsize=None)
+def hits_adapter(model: Optional[type] = None) -> TypeAdapter:
+    """Return adapter validating a whole page of raw hits in one call.
 
+    Sources of the hits are validated into ``model`` when it is given.
+    """
+    if model is None:
+        return TypeAdapter(list[Hit])
+    return TypeAdapter(list[Hit[model]])
 
-class Hits(BaseModel):
-    total: Total = Field(...)
+
+class Hits(DeferredModel, Generic[DocumentT]):
+    total: Optional[Total] = Field(None)
+    """Number of matching documents, missing with ``track_total_hits=False``."""
     max_score: Optional[float] = Field(None)
-    hits: list[Hit] = Field(...)
+    hits: list[Hit[DocumentT]] = Field(default_factory=list)
+
+    @field_serializer("hits", mode="wrap")
+    def _serialize_hits(self, value, handler):
+        if isinstance(value, LazySequence):
+            value = list(value)
+        return handler(value)
 
 
-class StdDeviationBounds(BaseModel):
+class StdDeviationBounds(DeferredModel):
     upper: Optional[float] = Field(None)
     lower: Optional[float] = Field(None)
     upper_population: Optional[float] = Field(None)
@@ -47,7 +78,7 @@ class StdDeviationBounds(BaseModel):
     lower_sampling: Optional[float] = Field(None)
 
 
-class MatrixAggregation(BaseModel):
+class MatrixAggregation(DeferredModel):
     name: Optional[str] = Field(None)
     count: Optional[int] = Field(None)
     mean: Optional[float] = Field(None)
@@ -58,12 +89,39 @@ class MatrixAggregation(BaseModel):
     correlation: Optional[dict[str, float]] = Field(None)
 
 
-class BucketAggregation(BaseModel):
-    key: str = Field(...)
-    doc_count: int = Field(...)
+class BucketAggregation(DeferredModel):
+    """Single bucket of a bucket aggregation.
 
+    Results of nested aggregations are kept as extra attributes named
+    after the aggregations, e.g. ``bucket.avg_price.value``, and are
+    listed in ``aggregations``.
+    """
+    key: Union[str, int, float, dict[str, Any], None] = Field(None)
+    """Bucket key, a dict of source values for composite aggregations."""
+    key_as_string: Optional[str] = Field(None)
+    doc_count: Optional[int] = Field(None)
 
-class Aggregation(BaseModel):
+    __pydantic_extra__: dict[str, Union["Aggregation", Any]] = Field(init=False)
+
+    class Config:
+        extra = "allow"
+
+    @property
+    def aggregations(self) -> dict[str, "Aggregation"]:
+        """Results of nested aggregations of this bucket by their names."""
+        return {
+            name: value
+            for name, value in (self.__pydantic_extra__ or {}).items()
+            if isinstance(value, Aggregation)
+        }
+
+
+class Aggregation(DeferredModel):
+    """Result of a single aggregation.
+
+    Results of aggregations nested under a single bucket aggregation,
+    e.g. ``filter``, are kept as extra attributes like in buckets.
+    """
     doc_count: Optional[int] = Field(None)
     value: Optional[Any] = Field(None)
     type: Optional[Any] = Field(None)
@@ -87,12 +145,172 @@ class Aggregation(BaseModel):
     doc_count_error_upper_bound: Optional[int] = Field(None)
     sum_other_doc_count: Optional[int] = Field(None)
     buckets: Optional[list[BucketAggregation]] = Field(None)
+    after_key: Optional[dict[str, Any]] = Field(None)
+    """Key of the last bucket of a composite aggregation page."""
+
+    __pydantic_extra__: dict[str, Union["Aggregation", Any]] = Field(init=False)
+
+    class Config:
+        extra = "allow"
+
+    @property
+    def aggregations(self) -> dict[str, "Aggregation"]:
+        """Results of nested aggregations of a single bucket aggregation."""
+        return {
+            name: value
+            for name, value in (self.__pydantic_extra__ or {}).items()
+            if isinstance(value, Aggregation)
+        }
+
+    def bucket(
+        self, key: Union[str, int, float, dict[str, Any]]
+    ) -> Optional[BucketAggregation]:
+        """Return bucket with given key or ``key_as_string``, if any.
 
+        Lookup is done in a dict built on first call, so it takes constant
+        time regardless of the number of buckets. The buckets list must
+        not be modified afterwards.
+        """
+        index = self.__dict__.get("_bucket_index")
+        if index is None:
+            index = {}
+            for bucket in reversed(self.buckets or ()):
+                if bucket.key_as_string is not None:
+                    index[bucket.key_as_string] = bucket
+            for bucket in reversed(self.buckets or ()):
+                index[_bucket_key(bucket.key)] = bucket
+            # Kept out of model fields, so it is not validated or dumped
+            self.__dict__["_bucket_index"] = index
+        return index.get(_bucket_key(key))
 
-class Result(BaseModel):
+    def to_arrays(self, metrics: Sequence[str] = ()) -> dict[str, Any]:
+        """Return bucket keys, doc counts and nested metrics as NumPy arrays.
+
+        Each entry of ``metrics`` is the name of a nested aggregation,
+        whose ``value`` is taken, or a dotted ``name.attribute`` path for
+        multi-value metrics, e.g. ``"price_stats.avg"``. Buckets missing
+        a metric get NaN.
+        """
+        np = import_numpy()
+        buckets = self.buckets or []
+        keys = [b.key for b in buckets]
+        if any(isinstance(k, dict) for k in keys):
+            key_array = np.empty(len(keys), dtype=object)
+            key_array[:] = keys
+        else:
+            key_array = np.array(keys)
+
+        counts = [b.doc_count for b in buckets]
+        arrays = {
+            "key": key_array,
+            # Counts left out by filter_path are NaN
+            "doc_count": (
+                np.array(counts, dtype=np.int64) if None not in counts
+                else np.array([np.nan if c is None else c for c in counts])
+            ),
+        }
+        for metric in metrics:
+            name, _, attribute = metric.partition(".")
+            attribute = attribute or "value"
+            values = np.full(len(buckets), np.nan)
+            for i, b in enumerate(buckets):
+                aggregation = (b.__pydantic_extra__ or {}).get(name)
+                value = getattr(aggregation, attribute, None)
+                if value is not None:
+                    values[i] = value
+            arrays[metric] = values
+        return arrays
+
+
+def _bucket_key(key: Any) -> Any:
+    if isinstance(key, dict):
+        return tuple(sorted(key.items()))
+    return key
+
+
+class Result(DeferredModel, Generic[DocumentT]):
+    """Search response.
+
+    Parametrize with a user model, e.g. ``Result[Product]``, to validate
+    ``_source`` of every hit straight into that model.
+
+    All parts of the response are optional, so responses pruned with
+    ``filter_path`` are parsed too.
+    """
     scroll_id_: Optional[str] = Field(None, alias="_scroll_id")
-    took: int = Field(...)
-    timed_out: bool = Field(...)
-    shards: Shards = Field(..., alias="_shards")
-    hits: Optional[Hits] = Field(None)
+    took: Optional[int] = Field(None)
+    timed_out: Optional[bool] = Field(None)
+    shards: Optional[Shards] = Field(None, alias="_shards")
+    hits: Optional[Hits[DocumentT]] = Field(None)
     aggregations: Optional[dict[str, Aggregation]] = Field(None)
+
+    @field_serializer("aggregations", mode="wrap")
+    def _serialize_aggregations(self, value, handler):
+        if isinstance(value, LazyMapping):
+            value = dict(value)
+        return handler(value)
+
+    def to_columns(
+        self, fields: Sequence[str] = (), backend: str = "numpy"
+    ) -> dict[str, Any]:
+        """Return hits as NumPy or Arrow arrays, one per column.
+
+        See ``hits_to_columns()`` for the columns produced. Hits of a lazy
+        result are read from the raw response without creating ``Hit``
+        objects, which is the cheapest way to pivot large results.
+        """
+        hits = self.hits.hits if self.hits is not None else []
+        if isinstance(hits, LazySequence):
+            hits = hits.raw
+        return hits_to_columns(hits, fields, backend)
+
+    @classmethod
+    def parse(
+        cls, response: Union[dict[str, Any], str, bytes], lazy: bool = False
+    ) -> "Result":
+        """Parse search response given as a dict or as raw JSON.
+
+        Raw JSON is validated directly by pydantic-core without building
+        an intermediate tree of Python dicts, unless ``lazy`` is requested.
+        """
+        if isinstance(response, (str, bytes)):
+            if lazy:
+                return cls.lazy(json.loads(response))
+            return cls.model_validate_json(response)
+        if lazy:
+            return cls.lazy(response)
+        return cls(**response)
+
+    @classmethod
+    def lazy(cls, response: dict[str, Any]) -> "Result":
+        """Parse search response validating hits and aggregations on access.
+
+        Only the response envelope and hits total are validated right away.
+        ``hits.hits`` and ``aggregations`` become read-only views that
+        validate each ``Hit`` or ``Aggregation`` the first time it is
+        accessed, so reading just the total or a single aggregation does
+        not pay for parsing the rest of the response.
+        """
+        envelope = dict(response)
+        raw_aggregations = envelope.pop("aggregations", None)
+        raw_hits = None
+        if envelope.get("hits") is not None:
+            raw_hits = envelope["hits"].get("hits")
+            envelope["hits"] = {**envelope["hits"], "hits": []}
+
+        result = cls(**envelope)
+        if raw_hits is not None:
+            args = cls.__pydantic_generic_metadata__["args"]
+            hit = Hit[args[0]] if args else Hit
+            result.hits.hits = LazySequence(raw_hits, hit)
+        if raw_aggregations is not None:
+            result.aggregations = LazyMapping(raw_aggregations, Aggregation)
+        return result
+
+
+class SearchError(DeferredModel):
+    """Failed item of a multi-search response."""
+    status: Optional[int] = Field(None)
+    """HTTP status code reported for the failed search."""
+    error: Any = Field(...)
+    """Error object or message returned by OpenSearch."""
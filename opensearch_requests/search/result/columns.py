@@ -0,0 +1,113 @@
+from typing import Any, Iterable, Sequence, Union
+
+from pydantic import BaseModel
+
+
+def import_numpy():
+    """Import optional NumPy dependency."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for columnar results: "
+            "pip install opensearch-requests[numpy]"
+        ) from e
+    return numpy
+
+
+def import_pyarrow():
+    """Import optional PyArrow dependency."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "PyArrow is required for Arrow columnar results: "
+            "pip install opensearch-requests[arrow]"
+        ) from e
+    return pyarrow
+
+
+def hits_to_columns(
+    hits: Iterable[Union[dict[str, Any], BaseModel]],
+    fields: Sequence[str] = (),
+    backend: str = "numpy",
+) -> dict[str, Any]:
+    """Pivot hits into one array per column.
+
+    Hits can be raw hit dicts from a response or ``Hit`` models. Raw hits
+    are read directly, without building a ``Hit`` per document.
+
+    Columns ``_id`` and ``_score`` are always present. Every dotted path
+    in ``fields`` becomes a column as well. A path is taken from the
+    ``fields`` section of the hit when present (first value only),
+    otherwise from its ``_source``. Missing values are null in Arrow
+    arrays and NaN (numbers) or None (objects) in NumPy arrays.
+
+    ``backend`` is either ``"numpy"`` or ``"arrow"``. Both libraries are
+    optional dependencies.
+    """
+    if backend == "numpy":
+        convert = _numpy_column(import_numpy())
+    elif backend == "arrow":
+        convert = import_pyarrow().array
+    else:
+        raise ValueError(f"Unknown columnar backend: {backend!r}")
+
+    paths = [(field, field.split(".")) for field in fields]
+    ids: list[Any] = []
+    scores: list[Any] = []
+    values: dict[str, list[Any]] = {field: [] for field in fields}
+
+    for hit in hits:
+        if isinstance(hit, dict):
+            ids.append(hit.get("_id"))
+            scores.append(hit.get("_score"))
+            source = hit.get("_source")
+            hit_fields = hit.get("fields")
+        else:
+            ids.append(hit.id)
+            scores.append(hit.score)
+            source = hit.source
+            hit_fields = hit.fields
+
+        for field, parts in paths:
+            if hit_fields and field in hit_fields:
+                found = hit_fields[field]
+                values[field].append(found[0] if found else None)
+            else:
+                values[field].append(_lookup(source, parts))
+
+    columns = {"_id": convert(ids), "_score": convert(scores)}
+    for field in fields:
+        columns[field] = convert(values[field])
+    return columns
+
+
+def _lookup(value: Any, parts: list[str]) -> Any:
+    for part in parts:
+        if isinstance(value, dict):
+            value = value.get(part)
+        elif isinstance(value, BaseModel):
+            value = getattr(value, part, None)
+        else:
+            return None
+    return value
+
+
+def _numpy_column(np):
+    def convert(values: list[Any]):
+        if not any(v is None for v in values):
+            return np.array(values)
+
+        present = [v for v in values if v is not None]
+        if present and all(
+            isinstance(v, (int, float)) and not isinstance(v, bool)
+            for v in present
+        ):
+            return np.array(
+                [np.nan if v is None else v for v in values],
+                dtype=np.float64,
+            )
+        return np.array(values, dtype=object)
+
+    return convert
@@ -0,0 +1,80 @@
+from collections.abc import Mapping, Sequence
+from typing import Any, Generic, Iterator, TypeVar, Union, overload
+
+from pydantic import BaseModel
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_MISSING = object()
+
+
+class LazySequence(Sequence, Generic[ModelT]):
+    """Read-only list of models validated on first access to each element.
+
+    Raw elements stay available in ``raw``.
+    """
+    __slots__ = ("raw", "model", "_items")
+
+    def __init__(self, raw: list[dict[str, Any]], model: type[ModelT]):
+        self.raw = raw
+        self.model = model
+        self._items: list[Any] = [_MISSING] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    @overload
+    def __getitem__(self, index: int) -> ModelT: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ModelT]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ModelT, list[ModelT]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if item is _MISSING:
+            item = self._items[index] = self.model(**self.raw[index])
+        return item
+
+    def __iter__(self) -> Iterator[ModelT]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, LazySequence)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazySequence[{self.model.__name__}]({len(self)} items)"
+
+
+class LazyMapping(Mapping, Generic[ModelT]):
+    """Read-only dict of models validated on first access to each value.
+
+    Raw values stay available in ``raw``.
+    """
+    __slots__ = ("raw", "model", "_items")
+
+    def __init__(self, raw: dict[str, dict[str, Any]], model: type[ModelT]):
+        self.raw = raw
+        self.model = model
+        self._items: dict[str, ModelT] = {}
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __getitem__(self, key: str) -> ModelT:
+        try:
+            return self._items[key]
+        except KeyError:
+            item = self._items[key] = self.model(**self.raw[key])
+            return item
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw)
+
+    def __repr__(self) -> str:
+        return f"LazyMapping[{self.model.__name__}]({list(self.raw)})"
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from opensearch_requests.search import cache as cache_module
+from opensearch_requests.search.cache import CacheBackend, MemoryCacheBackend, ResultCache
+from opensearch_requests.search.local import LocalClient
+from opensearch_requests.search.queries import TermQuery
+from opensearch_requests.search.result import Result
+
+
+def result(**fields) -> Result:
+    return Result(**{"took": 1, "timed_out": False, **fields})
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    backend = MemoryCacheBackend()
+    value = result()
+    backend.set("key", value, ttl=5)
+    clock[0] += 4.9
+    assert backend.get("key") is value
+    clock[0] += 0.1
+    assert backend.get("key") is None
+    assert len(backend) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    backend = MemoryCacheBackend(maxsize=2)
+    a, b, c = result(), result(), result()
+    backend.set("a", a, ttl=60)
+    backend.set("b", b, ttl=60)
+    assert backend.get("a") is a
+    backend.set("c", c, ttl=60)
+    assert backend.get("b") is None
+    assert backend.get("a") is a
+    assert backend.get("c") is c
+
+
+def test_partial_results_are_not_cached():
+    cache = ResultCache()
+    cache.set("timed_out", result(timed_out=True))
+    cache.set("failed", result(_shards={"total": 2, "successful": 1, "failed": 1}))
+    cache.set("complete", result(_shards={"total": 2, "successful": 2, "failed": 0}))
+    assert cache.get("timed_out") is None
+    assert cache.get("failed") is None
+    assert cache.get("complete") is not None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_keys_are_scoped_by_cluster():
+    first, second = LocalClient(), LocalClient()
+    first.add_documents("products", [("1", {"color": "red"})])
+    second.add_documents("products", [("2", {"color": "red"}), ("3", {"color": "red"})])
+    cache = ResultCache()
+    query = TermQuery(field="color.keyword", query="red")
+
+    assert [h.id for h in query.search("products", first, cache=cache).hits.hits] == ["1"]
+    assert [h.id for h in query.search("products", second, cache=cache).hits.hits] == ["2", "3"]
+    assert cache.misses == 2
+    assert query.search("products", first, cache=cache).hits.hits[0].id == "1"
+    assert cache.hits == 1
+
+
+def test_key_of_equivalent_requests():
+    cache = ResultCache()
+    client = LocalClient()
+    body = TermQuery(field="color", query="red").canonical()
+    assert cache.key("a", body, client=client) == cache.key("a", dict(body), client=client)
+    assert cache.key("a", body, client=client) != cache.key("b", body, client=client)
+    assert cache.key("a", body, filter_path="hits.total") != cache.key("a", body)
+
+
+class AsyncBackend(CacheBackend):
+    def __init__(self):
+        self.entries = {}
+        self.calls = []
+
+    def get(self, key):
+        raise AssertionError("blocking get() called from asearch()")
+
+    def set(self, key, value, ttl):
+        raise AssertionError("blocking set() called from asearch()")
+
+    async def aget(self, key):
+        self.calls.append("aget")
+        return self.entries.get(key)
+
+    async def aset(self, key, value, ttl):
+        self.calls.append("aset")
+        self.entries[key] = value
+
+
+class AsyncLocalClient(LocalClient):
+    async def search(self, *args, **kwargs):
+        return super().search(*args, **kwargs)
+
+
+def test_async_search_uses_async_backend():
+    backend = AsyncBackend()
+    cache = ResultCache(backend)
+    client = AsyncLocalClient()
+    client.add_documents("products", [("1", {"color": "red"})])
+    query = TermQuery(field="color.keyword", query="red")
+
+    async def search_twice():
+        first = await query.asearch("products", client, cache=cache)
+        second = await query.asearch("products", client, cache=cache)
+        return first, second
+
+    first, second = asyncio.run(search_twice())
+    assert second is first
+    assert backend.calls == ["aget", "aset", "aget"]
+    assert (cache.hits, cache.misses) == (1, 1)
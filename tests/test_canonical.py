@@ -0,0 +1,67 @@
+from opensearch_requests.search.canonical import canonical, fingerprint
+from opensearch_requests.search.queries import BooleanQuery, MatchQuery, QueryStringQuery, TermQuery
+
+
+def term(value):
+    return TermQuery(field="color", query=value)
+
+
+def test_unordered_clauses_are_sorted():
+    a = BooleanQuery(filter=[term("red"), term("blue")], must_not=[term("green"), term("black")])
+    b = BooleanQuery(filter=[term("blue"), term("red")], must_not=[term("black"), term("green")])
+    assert canonical(a) == canonical(b)
+    assert fingerprint(a) == fingerprint(b)
+
+
+def test_nested_unordered_clauses_are_sorted():
+    a = BooleanQuery(must=[BooleanQuery(filter=[term("red"), term("blue")])])
+    b = BooleanQuery(must=[BooleanQuery(filter=[term("blue"), term("red")])])
+    assert fingerprint(a) == fingerprint(b)
+
+
+def test_order_of_scoring_clauses_is_kept():
+    a = BooleanQuery(should=[term("red"), term("blue")])
+    b = BooleanQuery(should=[term("blue"), term("red")])
+    assert fingerprint(a) != fingerprint(b)
+    a = BooleanQuery(must=[term("red"), term("blue")])
+    b = BooleanQuery(must=[term("blue"), term("red")])
+    assert fingerprint(a) != fingerprint(b)
+
+
+def test_explicit_defaults_are_removed():
+    plain = MatchQuery(field="title", query="shoes")
+    explicit = MatchQuery(
+        field="title", query="shoes", operator="or", boost=1.0, max_expansions=50, prefix_length=0,
+    )
+    assert canonical(explicit) == canonical(plain)
+    assert fingerprint(explicit) == fingerprint(plain)
+
+    plain = QueryStringQuery(query="title:shoes")
+    explicit = QueryStringQuery(query="title:shoes", allow_leading_wildcard=True, default_operator="or")
+    assert fingerprint(explicit) == fingerprint(plain)
+
+
+def test_non_default_values_are_kept():
+    plain = MatchQuery(field="title", query="shoes")
+    assert fingerprint(MatchQuery(field="title", query="shoes", operator="and")) != fingerprint(plain)
+    assert fingerprint(MatchQuery(field="title", query="shoes", boost=2.0)) != fingerprint(plain)
+    assert fingerprint(MatchQuery(field="title", query="boots")) != fingerprint(plain)
+    assert canonical(MatchQuery(field="title", query="shoes", operator="and")) != canonical(plain)
+
+
+def test_canonical_keeps_request_unchanged():
+    query = BooleanQuery(
+        filter=[term("red"), term("blue")],
+        must=[MatchQuery(field="title", query="shoes", operator="or")],
+    )
+    body = query.body()
+    canonical(query)
+    assert query.body() == body
+    assert query.must[0].operator == "or"
+
+
+def test_frozen_and_mutable_requests_agree():
+    query = BooleanQuery(filter=[term("red"), term("blue")], must=[MatchQuery(field="t", query="x", boost=1.0)])
+    frozen = query.freeze()
+    assert frozen.fingerprint() == query.fingerprint() == fingerprint(query)
+    assert frozen.canonical() == canonical(query)
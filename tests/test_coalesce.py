@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from opensearch_requests.search.coalesce import SingleFlight, flight_key
+from opensearch_requests.search.queries import TermQuery
+
+
+class Boom(Exception):
+    pass
+
+
+def concurrently(flight, key, call, callers=5):
+    """Run do() from several threads while the first call is blocked."""
+    release = threading.Event()
+    calls = []
+
+    def blocked():
+        calls.append(key)
+        release.wait(5)
+        return call()
+
+    with ThreadPoolExecutor(callers) as pool:
+        leader = pool.submit(flight.do, key, blocked)
+        while not calls:
+            time.sleep(0.001)
+        followers = [pool.submit(flight.do, key, blocked) for _ in range(callers - 1)]
+        # Followers are waiting for the leader once they can't start a call
+        time.sleep(0.05)
+        release.set()
+        futures = [leader, *followers]
+        outcomes = []
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except Boom as e:
+                outcomes.append(e)
+    return calls, outcomes
+
+
+def test_identical_calls_share_one_request():
+    flight = SingleFlight()
+    result = object()
+    calls, outcomes = concurrently(flight, "key", lambda: result)
+    assert calls == ["key"]
+    assert all(outcome is result for outcome in outcomes)
+    assert len(flight) == 0
+
+
+def test_waiters_receive_leader_exception():
+    flight = SingleFlight()
+    error = Boom()
+
+    def fail():
+        raise error
+
+    calls, outcomes = concurrently(flight, "key", fail)
+    assert calls == ["key"]
+    assert all(outcome is error for outcome in outcomes)
+    assert len(flight) == 0
+
+
+def test_key_is_released_after_completion_and_failure():
+    flight = SingleFlight()
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+
+    with pytest.raises(Boom):
+        flight.do("key", lambda: (_ for _ in ()).throw(Boom()))
+    assert flight.do("key", lambda: 3) == 3
+    assert len(flight) == 0
+
+
+def test_different_keys_do_not_coalesce():
+    flight = SingleFlight()
+    started = []
+    release = threading.Event()
+
+    def call(key):
+        started.append(key)
+        release.wait(5)
+        return key
+
+    with ThreadPoolExecutor(2) as pool:
+        a = pool.submit(flight.do, "a", lambda: call("a"))
+        b = pool.submit(flight.do, "b", lambda: call("b"))
+        while len(started) < 2:
+            time.sleep(0.001)
+        assert len(flight) == 2
+        release.set()
+        assert (a.result(), b.result()) == ("a", "b")
+
+
+def test_async_calls_share_one_request():
+    flight = SingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    async def main():
+        same = await asyncio.gather(*(flight.ado("key", call) for _ in range(5)))
+        other = await flight.ado("other", call)
+        return same, other
+
+    same, other = asyncio.run(main())
+    assert len(calls) == 2
+    assert all(result is same[0] for result in same)
+    assert other is not same[0]
+    assert len(flight) == 0
+
+
+def test_async_waiters_receive_exception_and_key_is_released():
+    flight = SingleFlight()
+    calls = []
+
+    async def fail():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise Boom()
+
+    async def main():
+        outcomes = await asyncio.gather(
+            *(flight.ado("key", fail) for _ in range(3)), return_exceptions=True
+        )
+        assert len(flight) == 0
+        return outcomes, await flight.ado("key", lambda: asyncio.sleep(0, "again"))
+
+    outcomes, again = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(isinstance(o, Boom) and o is outcomes[0] for o in outcomes)
+    assert again == "again"
+
+
+def test_flight_key_identifies_equivalent_searches():
+    client = object()
+    a = TermQuery(field="color", query="red")
+    b = TermQuery(field="color", query="red", boost=1.0)
+    assert flight_key("i", client, a) == flight_key("i", client, b)
+    assert flight_key("i", client, a) != flight_key("i", object(), a)
+    assert flight_key("i", client, a) != flight_key("j", client, a)
+    assert flight_key("i", client, a, filter_path=["x"]) == flight_key("i", client, a, filter_path=("x",))
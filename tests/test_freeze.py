@@ -0,0 +1,94 @@
+import pytest
+
+from opensearch_requests.search.queries import BooleanQuery, TermQuery, TermsQuery
+
+
+calls = []
+
+
+class CountingTermQuery(TermQuery):
+    def bare(self):
+        calls.append(self.query)
+        return super().bare()
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+def tree():
+    return BooleanQuery(
+        must=[CountingTermQuery(field="color", query="red")],
+        filter=[TermsQuery(field="size", values=["s", "m"])],
+        size=5,
+    )
+
+
+def test_frozen_query_rejects_mutation():
+    frozen = tree().freeze()
+    with pytest.raises(TypeError):
+        frozen.size = 10
+    with pytest.raises(TypeError):
+        frozen.must[0].query = "blue"
+    with pytest.raises(TypeError):
+        frozen.must.append(TermQuery(field="color", query="blue"))
+    with pytest.raises(TypeError):
+        frozen.filter[0].values.append("l")
+    with pytest.raises(TypeError):
+        frozen.filter[0] = TermQuery(field="size", query="l")
+    assert frozen.body()["query"]["bool"]["filter"] == [{"terms": {"size": ["s", "m"]}}]
+
+
+def test_freeze_keeps_equality_and_types():
+    query = tree()
+    frozen = query.freeze()
+    assert frozen == query
+    assert frozen.freeze() is frozen
+    assert not query.is_frozen
+    assert hash(frozen) == hash(tree().freeze())
+    assert frozen.model_dump() == query.model_dump()
+    with pytest.raises(TypeError):
+        hash(query)
+
+
+def test_body_is_computed_once():
+    frozen = tree().freeze()
+    first = frozen.body()
+    assert frozen.body() is first
+    assert frozen.must[0].bare() is first["query"]["bool"]["must"][0]
+    assert calls == ["red"]
+
+    query = tree()
+    query.body()
+    query.body()
+    assert calls == ["red", "red", "red"]
+
+
+def test_replace_serializes_changed_path_only():
+    frozen = tree().freeze()
+    frozen.body()
+    replaced = frozen.replace(size=10)
+    assert replaced.is_frozen
+    assert replaced.body()["size"] == 10
+    assert frozen.body()["size"] == 5
+    # The unchanged clause is reused with its memoized output
+    assert replaced.must[0] is frozen.must[0]
+    assert calls == ["red"]
+
+    other = frozen.replace(must=[CountingTermQuery(field="color", query="blue")])
+    assert other.body()["query"]["bool"]["must"] == [{"term": {"color": "blue"}}]
+    assert calls == ["red", "blue"]
+
+
+def test_model_copy_drops_memoized_output():
+    frozen = tree().freeze()
+    assert frozen.body()["size"] == 5
+    fingerprint = frozen.fingerprint()
+
+    copied = frozen.model_copy(update={"size": 10})
+    assert not copied.is_frozen
+    assert copied.body()["size"] == 10
+    assert copied.fingerprint() != fingerprint
+    copied.must.append(TermQuery(field="color", query="blue"))
+    assert len(frozen.must) == 1
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from opensearch_requests.search.cache import ResultCache
+from opensearch_requests.search.hooks import register_hook, unregister_hook
+from opensearch_requests.search.local import LocalClient
+from opensearch_requests.search.multi import MultiSearch
+from opensearch_requests.search.queries import MatchAllQuery, TermQuery
+
+
+@pytest.fixture
+def client():
+    client = LocalClient()
+    client.add_documents("products", [("a", {"color": "red"}), ("b", {"color": "red"}), ("c", {"color": "blue"})])
+    client.add_documents("archive", [("d", {"color": "red"})])
+    return client
+
+
+@pytest.fixture
+def reported():
+    reported = []
+    hook = register_hook(reported.append)
+    yield reported
+    unregister_hook(hook)
+
+
+def test_search_reports_stats(client, reported):
+    TermQuery(field="color.keyword", query="red").search("products", client)
+    (stats,) = reported
+    assert (stats.request_type, stats.index) == ("TermQuery", "products")
+    assert (stats.hits, stats.total_hits, stats.took) == (2, 2, 0)
+    assert stats.body_bytes == len(b'{"query":{"term":{"color.keyword":"red"}}}')
+    assert stats.total == stats.serialize + stats.request + stats.parse
+
+
+def test_cached_search_doesnt_report_stats(client, reported):
+    cache = ResultCache()
+    query = TermQuery(field="color.keyword", query="red")
+    query.search("products", client, cache=cache)
+    query.search("products", client, cache=cache)
+    assert len(reported) == 1
+
+
+class AsyncLocalClient:
+    def __init__(self, client):
+        self.client = client
+
+    async def msearch(self, body):
+        return self.client.msearch(body=body)
+
+
+def test_multi_search_reports_stats_of_batch(client, reported):
+    multi = (
+        MultiSearch()
+        .add("products", TermQuery(field="color.keyword", query="red"))
+        .add("archive", MatchAllQuery())
+        .add("products", MatchAllQuery())
+    )
+    results = multi.search(client)
+    asyncio.run(multi.asearch(AsyncLocalClient(client)))
+
+    assert len(reported) == 2
+    for stats in reported:
+        assert (stats.request_type, stats.index) == ("MultiSearch", "products,archive")
+        assert (stats.hits, stats.total_hits) == (6, 6)
+        assert stats.body_bytes == len(multi.body().encode("utf-8"))
+    assert sum(len(result.hits.hits) for result in results) == 6
+
+
+def test_hooks_are_not_called_once_unregistered(client):
+    reported = []
+    hook = register_hook(reported.append)
+    unregister_hook(hook)
+    MultiSearch().add("products", MatchAllQuery()).search(client)
+    TermQuery(field="color.keyword", query="red").search("products", client)
+    assert reported == []
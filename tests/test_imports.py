@@ -0,0 +1,32 @@
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_import_budget():
+    spec = importlib.util.spec_from_file_location("import_budget", ROOT / "benchmarks" / "import_budget.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_import_is_lazy():
+    # Forbidden eager imports and validators built on import, see benchmarks/import_budget.py
+    assert load_import_budget().problems() == []
+
+
+def test_queries_dont_import_search_helpers():
+    code = (
+        "import sys\n"
+        "from opensearch_requests.search.queries import MatchQuery\n"
+        "MatchQuery(field='title', query='shoes').body()\n"
+        "for name in ('cache', 'canonical', 'coalesce', 'cost', 'hooks', 'resilience'):\n"
+        "    if f'opensearch_requests.search.{name}' in sys.modules:\n"
+        "        print(name)\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT)
+    assert out.stdout.split() == []
@@ -0,0 +1,154 @@
+import json
+import math
+
+import pytest
+
+from opensearch_requests.search.local import LocalClient
+from opensearch_requests.search.local.executor import BM25_B, BM25_K1
+from opensearch_requests.search.local.index import LocalIndex
+from opensearch_requests.search.prepared import Param
+from opensearch_requests.search.queries import MatchQuery, TermQuery
+
+
+DOCUMENTS = [
+    ("a", {"title": "red shoes", "color": "red", "price": 10, "tags": ["sale"]}),
+    ("b", {"title": "red red socks", "color": "blue", "price": 20, "tags": ["sale", "new"]}),
+    ("c", {"title": "blue jacket", "color": "red", "price": 30, "tags": []}),
+]
+
+
+@pytest.fixture
+def client():
+    client = LocalClient()
+    client.add_documents("products", DOCUMENTS)
+    return client
+
+
+def search(client, body, index="products"):
+    return client.search(index=index, body=body)
+
+
+def ids(response):
+    return [hit["_id"] for hit in response["hits"]["hits"]]
+
+
+def test_index_postings():
+    index = LocalIndex("products")
+    for id, source in DOCUMENTS:
+        index.add(source, id)
+
+    assert index.text["title"]["red"] == {0: 1, 1: 2}
+    assert index.lengths["title"] == {0: 2, 1: 3, 2: 2}
+    assert index.exact["color.keyword"]["red"] == {0, 2}
+    assert index.exact["price"][20.0] == {1}
+    assert index.values("tags.keyword", 1) == ["sale", "new"]
+
+    assert index.delete("a")
+    assert index.text["title"]["red"] == {1: 2}
+    assert index.exact["color.keyword"]["red"] == {2}
+    assert index.live == {1, 2}
+    assert not index.delete("a")
+
+
+def test_bm25_scores(client):
+    response = search(client, {"query": {"match": {"title": "red"}}})
+
+    # 2 of 3 documents contain "red", titles have 2, 3 and 2 tokens
+    idf = math.log(1 + (3 - 2 + 0.5) / (2 + 0.5))
+    average = 7 / 3
+
+    def score(tf, length):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average)
+        return idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+    scores = {hit["_id"]: hit["_score"] for hit in response["hits"]["hits"]}
+    assert scores == pytest.approx({"b": score(2, 3), "a": score(1, 2)})
+    assert ids(response) == ["b", "a"]
+    assert response["hits"]["max_score"] == pytest.approx(score(2, 3))
+
+
+def test_term_and_terms(client):
+    assert ids(search(client, {"query": {"term": {"color.keyword": "red"}}})) == ["a", "c"]
+    assert ids(search(client, {"query": {"term": {"price": "20"}}})) == ["b"]
+    assert ids(search(client, {"query": {"terms": {"tags": ["new", "missing"]}}})) == ["b"]
+
+
+def test_bool(client):
+    body = {
+        "query": {
+            "bool": {
+                "should": [{"term": {"tags": "sale"}}, {"term": {"color.keyword": "red"}}],
+                "minimum_should_match": 2,
+            }
+        }
+    }
+    assert ids(search(client, body)) == ["a"]
+
+    body = {
+        "query": {
+            "bool": {
+                "must": [{"match": {"title": "red"}}],
+                "filter": [{"terms": {"tags": ["sale"]}}],
+                "must_not": [{"term": {"color.keyword": "blue"}}],
+            }
+        }
+    }
+    response = search(client, body)
+    assert ids(response) == ["a"]
+    assert response["hits"]["total"] == {"value": 1, "relation": "eq"}
+
+    body = {"query": {"bool": {"filter": [{"match_all": {}}], "must_not": [{"term": {"price": 10}}]}}}
+    response = search(client, body)
+    assert ids(response) == ["b", "c"]
+    assert {hit["_score"] for hit in response["hits"]["hits"]} == {0.0}
+
+
+def test_aggregations(client):
+    body = {
+        "size": 0,
+        "aggs": {
+            "colors": {
+                "terms": {"field": "color.keyword"},
+                "aggs": {"avg_price": {"avg": {"field": "price"}}},
+            },
+            "prices": {"stats": {"field": "price"}},
+            "on_sale": {
+                "filter": {"term": {"tags": "sale"}},
+                "aggs": {"total": {"sum": {"field": "price"}}},
+            },
+        },
+    }
+    aggregations = search(client, body)["aggregations"]
+    assert aggregations["colors"]["buckets"] == [
+        {"key": "red", "doc_count": 2, "avg_price": {"value": 20.0}},
+        {"key": "blue", "doc_count": 1, "avg_price": {"value": 20.0}},
+    ]
+    assert aggregations["prices"] == {"count": 3, "min": 10.0, "max": 30.0, "avg": 20.0, "sum": 60.0}
+    assert aggregations["on_sale"] == {"doc_count": 2, "total": {"value": 30.0}}
+
+
+def test_accepts_serialized_bodies(client):
+    body = {"query": {"term": {"color.keyword": "blue"}}}
+    assert ids(search(client, json.dumps(body))) == ["b"]
+    assert ids(search(client, json.dumps(body).encode("utf-8"))) == ["b"]
+
+    prepared = MatchQuery(field="title", query=Param("text")).prepare()
+    assert [hit.id for hit in prepared.search("products", client, text="jacket").hits.hits] == ["c"]
+
+
+def test_pages_across_indices(client):
+    client.add_documents("archive", [("d", {"title": "red hat", "price": 15})])
+    body = {"query": {"match_all": {}}, "sort": [{"price": "asc"}], "size": 2, "from": 1}
+    response = search(client, body, index="products,archive")
+    assert ids(response) == ["d", "b"]
+    assert [hit["sort"] for hit in response["hits"]["hits"]] == [[15], [20]]
+    assert response["hits"]["total"]["value"] == 4
+
+    with pytest.raises(NotImplementedError):
+        search(client, {"aggs": {"n": {"value_count": {"field": "price"}}}}, index="products,archive")
+
+
+def test_searches_models(client):
+    result = TermQuery(field="color.keyword", query="red", size=1).search("products", client)
+    assert result.hits.total.value == 2
+    assert [hit.id for hit in result.hits.hits] == ["a"]
@@ -0,0 +1,115 @@
+import pytest
+
+from opensearch_requests.search.local import LocalClient
+from opensearch_requests.search.queries import BooleanQuery, MatchQuery, TermQuery, TermsQuery
+from opensearch_requests.search.queries.optimizer import optimize
+
+
+DOCUMENTS = [
+    ("1", {"color": "red", "size": "s", "tags": ["sale", "new"], "title": "red running shoes"}),
+    ("2", {"color": "blue", "size": "m", "tags": ["new"], "title": "blue shoes and socks"}),
+    ("3", {"color": "red", "size": "l", "tags": ["sale"], "title": "red socks"}),
+    ("4", {"color": "green", "size": "s", "tags": [], "title": "green running jacket"}),
+    ("5", {"color": "blue", "size": "l", "tags": ["sale", "new", "last"], "title": "blue jacket"}),
+]
+
+
+@pytest.fixture(scope="module")
+def client():
+    client = LocalClient()
+    client.add_documents("products", DOCUMENTS)
+    return client
+
+
+def term(field, value):
+    return TermQuery(field=field, query=value)
+
+
+def scores(client, query):
+    response = client.search(index="products", body={"query": query.bare(), "size": 100})
+    return {hit["_id"]: hit["_score"] for hit in response["hits"]["hits"]}
+
+
+def assert_equivalent(client, query, scoring=True):
+    optimized = optimize(query, scoring=scoring)
+    assert optimized.bare() != query.bare(), "query was not rewritten"
+    expected, actual = scores(client, query), scores(client, optimized)
+    assert actual.keys() == expected.keys()
+    if scoring:
+        assert actual == pytest.approx(expected)
+    return optimized
+
+
+@pytest.mark.parametrize("scoring", [True, False])
+def test_flattens_nested_bool(client, scoring):
+    query = BooleanQuery(
+        must=[
+            BooleanQuery(must=[MatchQuery(field="title", query="shoes")], filter=[term("color", "red")]),
+            BooleanQuery(must_not=[term("size", "m")], filter=[term("tags", "sale")]),
+        ],
+        filter=[BooleanQuery(filter=[term("tags", "new")])],
+    )
+    optimized = assert_equivalent(client, query, scoring)
+    assert not any(isinstance(c, BooleanQuery) for c in optimized.filter)
+
+
+def test_unwraps_single_clause(client):
+    query = BooleanQuery(must=[BooleanQuery(should=[term("color", "red")])])
+    assert optimize(query) == term("color", "red")
+    assert_equivalent(client, query)
+
+
+def test_keeps_should_terms_with_minimum_should_match(client):
+    query = BooleanQuery(
+        should=[term("tags", "sale"), term("tags", "new"), term("tags", "last")],
+        minimum_should_match=2,
+        filter=[BooleanQuery(filter=[term("size", "l")])],
+    )
+    optimized = assert_equivalent(client, query, scoring=False)
+    assert optimized.should == query.should
+    assert set(scores(client, optimized)) == {"5"}
+
+
+def test_merges_should_terms_without_minimum_should_match(client):
+    query = BooleanQuery(should=[term("color", "red"), term("color", "green")])
+    optimized = assert_equivalent(client, query, scoring=False)
+    assert optimized == TermsQuery(field="color", values=["red", "green"])
+
+
+def test_should_only_with_must_not(client):
+    query = BooleanQuery(
+        should=[BooleanQuery(should=[term("color", "red"), term("color", "blue")])],
+        must_not=[
+            BooleanQuery(should=[term("size", "s"), term("size", "m")]),
+            term("size", "s"),
+        ],
+    )
+    optimized = assert_equivalent(client, query, scoring=False)
+    assert optimized.must_not == [TermsQuery(field="size", values=["s", "m"])]
+    assert set(scores(client, optimized)) == {"3", "5"}
+    assert_equivalent(client, query)
+
+
+def test_keeps_boosted_clauses(client):
+    boosted = MatchQuery(field="title", query="jacket", boost=3.0)
+    query = BooleanQuery(
+        must=[BooleanQuery(must=[boosted, MatchQuery(field="title", query="running")])],
+        should=[TermQuery(field="color", query="green", boost=2.0), term("color", "green")],
+    )
+    optimized = assert_equivalent(client, query)
+    assert boosted in optimized.must
+    # Identical should clauses add up to the score, so they are kept
+    assert len(optimized.should) == 2
+
+
+def test_moves_boosted_must_to_filter_without_scoring(client):
+    query = BooleanQuery(
+        must=[MatchQuery(field="title", query="shoes", boost=3.0)],
+        must_not=[term("color", "blue")],
+    )
+    optimized = assert_equivalent(client, query, scoring=False)
+    assert optimized.must is None
+    assert optimized.filter == query.must
+    # Scores are dropped, which is only valid when the caller doesn't need them
+    assert set(scores(client, optimized).values()) == {0.0}
+    assert set(scores(client, query).values()) != {0.0}
@@ -0,0 +1,110 @@
+import json
+
+import pytest
+
+from opensearch_requests.search.cache import ResultCache
+from opensearch_requests.search.cost import Budget, QueryTooExpensive
+from opensearch_requests.search.hooks import register_hook, unregister_hook
+from opensearch_requests.search.local import LocalClient
+from opensearch_requests.search.prepared import Param
+from opensearch_requests.search.queries import BooleanQuery, MatchQuery, QueryStringQuery, TermQuery
+
+
+class RecordingClient(LocalClient):
+    def __init__(self):
+        super().__init__()
+        self.bodies = []
+
+    def search(self, index, body, **params):
+        self.bodies.append(body)
+        return super().search(index=index, body=body, **params)
+
+
+@pytest.fixture
+def client():
+    client = RecordingClient()
+    client.add_documents("products", [
+        ("a", {"title": "red shoes", "tenant": "acme"}),
+        ("b", {"title": "red socks", "tenant": "other"}),
+    ])
+    return client
+
+
+def query(**options):
+    return BooleanQuery(
+        must=[MatchQuery(field="title", query=Param("title"), **options)],
+        filter=[TermQuery(field="tenant.keyword", query=Param("tenant"))],
+        size=5,
+    )
+
+
+def ids(result):
+    return [hit.id for hit in result.hits.hits]
+
+
+def test_bound_body_equals_body_of_query():
+    prepared = query().prepare()
+    expected = BooleanQuery(
+        must=[MatchQuery(field="title", query='red "shoes"')],
+        filter=[TermQuery(field="tenant.keyword", query="acme")],
+        size=5,
+    ).body()
+    assert prepared.params == {"title", "tenant"}
+    assert prepared.bind(title='red "shoes"', tenant="acme") == expected
+    assert json.loads(prepared.bind_json(title='red "shoes"', tenant="acme")) == expected
+
+
+def test_values_are_validated():
+    prepared = query().prepare()
+    with pytest.raises(ValueError, match="Missing"):
+        prepared.bind(title="red")
+    with pytest.raises(ValueError, match="Unknown"):
+        prepared.bind(title="red", tenant="acme", color="blue")
+    with pytest.raises(ValueError):
+        prepared.bind(title=5, tenant="acme")
+    with pytest.raises(ValueError, match="clash"):
+        TermQuery(field="tenant", query=Param("model")).prepare()
+
+
+def test_search_sends_serialized_body(client):
+    prepared = query().prepare()
+    assert ids(prepared.search("products", client, title="red", tenant="acme")) == ["a"]
+    assert client.bodies == [prepared.bind_json(title="red", tenant="acme")]
+
+
+def test_search_reports_stats(client):
+    reported = []
+    hook = register_hook(reported.append)
+    try:
+        prepared = query().prepare()
+        prepared.search("products", client, title="red", tenant="other")
+    finally:
+        unregister_hook(hook)
+    (stats,) = reported
+    assert stats.request_type == "BooleanQuery"
+    assert stats.body_bytes == len(client.bodies[0])
+    assert stats.hits == 1
+
+
+def test_search_is_cached_by_bound_values(client):
+    cache = ResultCache()
+    prepared = query().prepare()
+    first = prepared.search("products", client, cache=cache, title="red", tenant="acme")
+    assert prepared.search("products", client, cache=cache, title="red", tenant="acme") is first
+    assert ids(prepared.search("products", client, cache=cache, title="red", tenant="other")) == ["b"]
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(client.bodies) == 2
+
+
+def test_search_enforces_budget(client):
+    prepared = query(max_expansions=500).prepare()
+    budget = Budget(max_cost=10, action="downgrade")
+    prepared.search("products", client, budget=budget, title="red", tenant="acme")
+    assert json.loads(client.bodies[0])["query"]["bool"]["must"] == [
+        {"match": {"title": {"query": "red", "max_expansions": 50}}}
+    ]
+
+    prepared = QueryStringQuery(query="*shoes", default_field=Param("field")).prepare()
+    with pytest.raises(QueryTooExpensive):
+        prepared.search("products", client, budget=Budget(), field="title")
+    assert len(client.bodies) == 1
@@ -0,0 +1,34 @@
+import pytest
+from pydantic import ValidationError
+
+from opensearch_requests.search.aggregations import AvgAggregation, TermsAggregation
+from opensearch_requests.search.queries import TermQuery
+from opensearch_requests.search.request import SearchRequest
+
+
+def test_duplicate_aggregation_names_are_rejected():
+    with pytest.raises(ValidationError, match="Duplicate aggregation name: price"):
+        SearchRequest(aggs=[
+            AvgAggregation(name="price", field="price"),
+            TermsAggregation(name="price", field="price"),
+        ])
+
+    request = SearchRequest(aggs=[AvgAggregation(name="price", field="price")]).freeze()
+    with pytest.raises(ValidationError):
+        request.replace(aggs=[*request.aggs, AvgAggregation(name="price", field="cost")])
+
+
+def test_body_holds_query_aggregations_and_paging():
+    request = SearchRequest(
+        query=TermQuery(field="color", query="red"),
+        aggs=[
+            TermsAggregation(name="brands", field="brand", bucket_size=5),
+            AvgAggregation(name="avg_price", field="price"),
+        ],
+        size=0,
+        sort=["_id"],
+    )
+    body = request.body()
+    assert body["query"] == {"term": {"color": "red"}}
+    assert list(body["aggs"]) == ["brands", "avg_price"]
+    assert (body["size"], body["sort"]) == (0, ["_id"])
@@ -0,0 +1,185 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from opensearchpy import ConnectionTimeout, NotFoundError, TransportError
+
+from opensearch_requests.search import resilience
+from opensearch_requests.search.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResiliencePolicy,
+    circuit_breaker,
+)
+
+
+class Client:
+    """Stand-in for a client, breakers are kept per client object."""
+
+
+def policy(**kwargs) -> ResiliencePolicy:
+    kwargs.setdefault("initial_backoff", 0)
+    return ResiliencePolicy(**kwargs)
+
+
+def failing(*errors: Exception, result="ok"):
+    """Return call raising the errors in turn, then returning result."""
+    calls = []
+
+    def call(preference):
+        calls.append(preference)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+
+    return call, calls
+
+
+def test_retries_retryable_status():
+    call, calls = failing(TransportError(503, "unavailable"))
+    assert policy().execute(Client(), call) == "ok"
+    assert len(calls) == 2
+
+
+def test_doesnt_retry_other_status_and_counts_it_as_success():
+    client = Client()
+    call, calls = failing(NotFoundError(404, "index_not_found_exception"))
+    with pytest.raises(NotFoundError):
+        policy(failure_threshold=1).execute(client, call)
+    assert len(calls) == 1
+    assert circuit_breaker(client, policy()).state == "closed"
+
+
+def test_retries_connection_timeout_and_counts_it_as_failure():
+    client = Client()
+    timeout = ConnectionTimeout("TIMEOUT", "Read timed out", None)
+    call, calls = failing(timeout, timeout, timeout)
+    with pytest.raises(ConnectionTimeout):
+        policy(max_attempts=3, failure_threshold=10).execute(client, call)
+    assert len(calls) == 3
+    assert circuit_breaker(client, policy()).failures == 3
+
+
+def test_retries_partial_results():
+    class Partial:
+        timed_out = True
+        shards = None
+
+    results = [Partial(), "ok"]
+    assert policy().execute(Client(), lambda preference: results.pop(0)) == "ok"
+
+
+def test_breaker_opens_after_threshold_and_closes_after_trial():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.failure()
+    breaker.before()
+    breaker.failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before()
+
+    time.sleep(0.05)
+    breaker.before()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before()
+    breaker.success()
+    assert breaker.state == "closed"
+    breaker.before()
+
+
+def test_breaker_reopens_after_failed_trial():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.failure()
+    time.sleep(0.05)
+    breaker.before()
+    breaker.failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before()
+
+
+def test_breaker_lets_new_trial_after_cancelled_one():
+    client = Client()
+    p = policy(failure_threshold=1, reset_timeout=0.05)
+    breaker = circuit_breaker(client, p)
+    breaker.failure()
+    time.sleep(0.05)
+
+    async def hanging(preference):
+        await asyncio.sleep(10)
+
+    async def trial():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(p.aexecute(client, hanging), 0.01)
+
+    asyncio.run(trial())
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before()
+
+    time.sleep(0.05)
+
+    async def ok(preference):
+        return "ok"
+
+    assert asyncio.run(p.aexecute(client, ok)) == "ok"
+    assert breaker.state == "closed"
+
+
+def hedging(**kwargs) -> ResiliencePolicy:
+    p = policy(hedge=True, hedge_min_samples=1, hedge_min_delay=0.01, **kwargs)
+    p._latencies.append(0.01)
+    return p
+
+
+def test_hedges_slow_search():
+    def call(preference):
+        if preference is None:
+            time.sleep(0.5)
+            return "primary"
+        return "hedge"
+
+    started = time.perf_counter()
+    assert hedging(hedge_workers=2)._hedged(call) == "hedge"
+    assert time.perf_counter() - started < 0.4
+
+
+def test_doesnt_hedge_fast_search():
+    preferences = []
+
+    def call(preference):
+        preferences.append(preference)
+        return "primary"
+
+    assert hedging(hedge_workers=2)._hedged(call) == "primary"
+    assert preferences == [None]
+
+
+def test_sends_search_from_calling_thread_when_workers_are_busy():
+    release = threading.Event()
+    pool = resilience._hedge_pool(1)
+    busy = pool.submit(release.wait)
+    threads = []
+
+    def call(preference):
+        threads.append(threading.current_thread())
+        return "primary"
+
+    try:
+        assert hedging(hedge_workers=1)._hedged(call) == "primary"
+    finally:
+        release.set()
+        busy.result()
+    assert threads == [threading.current_thread()]
+
+
+def test_hedges_async_search():
+    async def call(preference):
+        if preference is None:
+            await asyncio.sleep(0.5)
+            return "primary"
+        return "hedge"
+
+    assert asyncio.run(hedging()._ahedged(call)) == "hedge"
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from opensearch_requests.search.result import Result
+
+
+PRUNED_AGGREGATIONS = {
+    "aggregations": {
+        "brands": {"buckets": [{"key": "acme"}, {"key": "globex"}]},
+        "counts": {"buckets": [{"doc_count": 3}, {"doc_count": 1}]},
+    },
+}
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_parses_count_only_response(lazy):
+    result = Result.parse({"hits": {"total": {"value": 5}}}, lazy=lazy)
+    assert result.hits.total.value == 5
+    assert result.hits.total.relation is None
+    assert result.took is None
+
+
+def test_parses_pruned_hits_from_json():
+    response = {"hits": {"hits": [{"_id": "1"}, {"_id": "2", "_source": {"name": "a"}}]}}
+    result = Result.parse(json.dumps(response))
+    assert [hit.id for hit in result.hits.hits] == ["1", "2"]
+    assert result.hits.total is None
+    assert result.hits.hits[0].source is None
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_parses_pruned_buckets(lazy):
+    result = Result.parse(PRUNED_AGGREGATIONS, lazy=lazy)
+    brands = result.aggregations["brands"]
+    assert [b.key for b in brands.buckets] == ["acme", "globex"]
+    assert brands.buckets[0].doc_count is None
+    assert brands.bucket("globex") is brands.buckets[1]
+    counts = result.aggregations["counts"]
+    assert [b.doc_count for b in counts.buckets] == [3, 1]
+    assert counts.buckets[0].key is None
+
+
+def test_bucket_arrays_of_pruned_counts():
+    np = pytest.importorskip("numpy")
+    arrays = Result.parse(PRUNED_AGGREGATIONS).aggregations["brands"].to_arrays()
+    assert list(arrays["key"]) == ["acme", "globex"]
+    assert np.isnan(arrays["doc_count"]).all()